@@ -157,6 +157,7 @@ setup(
     entry_points={
         'console_scripts': [
             'urh = urh.main:main',
+            'urh_batch = urh.cli.batch:main',
         ]}
 )
 
@@ -1,7 +1,7 @@
 from collections import defaultdict
 
 import numpy as np
-from urh import constants
+from urh import core_constants
 from urh.awre.CommonRange import CommonRange
 from urh.cythonext import util
 from urh.awre.components.Component import Component
@@ -79,7 +79,7 @@ class Address(Component):
                             start = end + alignment
 
         if verbose:
-            print(constants.color.BOLD + "Result after Step 1" +constants.color.END)
+            print(core_constants.color.BOLD + "Result after Step 1" +core_constants.color.END)
             self.__print_ranges(equal_ranges_per_participant)
 
         # Step 2: Now we want to find our address candidates.
@@ -268,7 +268,7 @@ class Address(Component):
 
     def __print_clustered(self, clustered_addresses):
         for bl in sorted(clustered_addresses):
-            print(constants.color.BOLD + "Byte length " + str(bl) + constants.color.END)
+            print(core_constants.color.BOLD + "Byte length " + str(bl) + core_constants.color.END)
             for (start, end), bits in sorted(clustered_addresses[bl].items()):
                 print(start, end, bits)
 
@@ -277,16 +277,16 @@ class Address(Component):
             if parti is None:
                 continue
 
-            print("\n" + constants.color.UNDERLINE + str(parti.name) + " (" + parti.shortname+ ")" + constants.color.END)
+            print("\n" + core_constants.color.UNDERLINE + str(parti.name) + " (" + parti.shortname+ ")" + core_constants.color.END)
             address1 = "000110110110000000110011"
             address2 = "011110001110001010001001"
 
             assert len(address1) % 8 == 0
             assert len(address2) % 8 == 0
 
-            print("address1", constants.color.BLUE, address1 + " (" +hex(int("".join(map(str, address1)), 2)) +")", constants.color.END)
-            print("address2", constants.color.GREEN, address2 + " (" + hex(int("".join(map(str, address2)), 2)) + ")",
-                  constants.color.END)
+            print("address1", core_constants.color.BLUE, address1 + " (" +hex(int("".join(map(str, address1)), 2)) +")", core_constants.color.END)
+            print("address2", core_constants.color.GREEN, address2 + " (" + hex(int("".join(map(str, address2)), 2)) + ")",
+                  core_constants.color.END)
 
             print()
 
@@ -295,11 +295,11 @@ class Address(Component):
                 bits_str = common_range.bits
                 format_start = ""
                 if address1 in bits_str and address2 not in bits_str:
-                    format_start = constants.color.BLUE
+                    format_start = core_constants.color.BLUE
                 if address2 in bits_str and address1 not in bits_str:
-                    format_start = constants.color.GREEN
+                    format_start = core_constants.color.GREEN
                 if address1 in bits_str and address2 in bits_str:
-                    format_start = constants.color.RED + constants.color.BOLD
+                    format_start = core_constants.color.RED + core_constants.color.BOLD
 
                 # For Bob the adress 1b60330 is found to be 0x8db0198000 which is correct,
                 # as it starts with a leading 1 in all messages.
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Headless batch processing of signal files: demodulate, extract protocols and write them
+to protocol XML or PCAP files without starting the GUI.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+OUTPUT_FORMATS = OrderedDict([("xml", ".proto.xml"), ("pcap", ".pcap")])
+DEFAULT_DECODING = "Non Return To Zero (NRZ)"
+
+
+class BatchResult(object):
+    def __init__(self, filename: str, output_filename: str = None, num_messages=0, timings: OrderedDict = None,
+                 error: str = None):
+        self.filename = filename
+        self.output_filename = output_filename
+        self.num_messages = num_messages
+        self.timings = timings if timings is not None else OrderedDict()
+        self.error = error
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+
+def parse_decoding(decoding: str):
+    """
+    Create an Encoding from a comma separated chain like in decodings.txt,
+    e.g. "Manchester I, Edge Trigger"
+
+    :rtype: urh.signalprocessing.Encoding.Encoding
+    """
+    from urh.signalprocessing.Encoding import Encoding
+    return Encoding([d.strip().replace("'", "") for d in decoding.split(",") if d.strip().replace("'", "")])
+
+
+def get_output_filename(filename: str, output_dir: str, output_format: str) -> str:
+    name = os.path.basename(filename)
+    for ext in (".complex16u", ".complex16s", ".complex", ".coco", ".wav"):
+        if name.endswith(ext):
+            name = name[:-len(ext)]
+            break
+
+    directory = output_dir if output_dir is not None else os.path.dirname(filename)
+    return os.path.join(directory, name + OUTPUT_FORMATS[output_format])
+
+
+def process_file(filename: str, args: argparse.Namespace) -> BatchResult:
+    """
+    Load a single signal, apply given or auto detected parameters, extract its protocol and write it to disk.
+    Runs in a worker process, so all urh imports happen here.
+    """
+    from urh.dev.PCAP import PCAP
+    from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+    from urh.signalprocessing.Signal import Signal
+
+    result = BatchResult(filename)
+    try:
+        t = time.perf_counter()
+        signal = Signal(filename, os.path.basename(filename), modulation=args.modulation,
+                        sample_rate=args.sample_rate)
+        signal.block_protocol_update = True
+        if args.noise is not None:
+            signal.noise_threshold = args.noise
+        result.timings["load"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        if args.bit_length is None or args.center is None:
+            signal.auto_detect(emit_update=False)
+        if args.bit_length is not None:
+            signal.bit_len = args.bit_length
+        if args.center is not None:
+            signal.qad_center = args.center
+        if args.tolerance is not None:
+            signal.tolerance = args.tolerance
+        if args.pause_threshold is not None:
+            signal.pause_threshold = args.pause_threshold
+        if args.message_length_divisor is not None:
+            signal.message_length_divisor = args.message_length_divisor
+        result.timings["detect"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        proto_analyzer = ProtocolAnalyzer(signal)
+        proto_analyzer.get_protocol_from_signal()
+        decoder = parse_decoding(args.decoding)
+        proto_analyzer.set_decoder_for_messages(decoder)
+        result.num_messages = len(proto_analyzer.messages)
+        result.timings["demodulate"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        result.output_filename = get_output_filename(filename, args.output_dir, args.format)
+        if args.format == "pcap":
+            PCAP().write_packets(proto_analyzer.messages, result.output_filename, signal.sample_rate)
+        else:
+            proto_analyzer.to_xml_file(result.output_filename, decoders=[decoder], participants=[], write_bits=True)
+        result.timings["write"] = time.perf_counter() - t
+
+        proto_analyzer.eliminate()
+    except Exception as e:
+        result.error = "{}: {}".format(type(e).__name__, e)
+
+    return result
+
+
+def run_batch(filenames: list, args: argparse.Namespace):
+    """
+    Process all files in a process pool
+
+    :rtype: list of BatchResult
+    """
+    if args.jobs == 1 or len(filenames) <= 1:
+        return [process_file(filename, args) for filename in filenames]
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        return list(executor.map(process_file, filenames, [args] * len(filenames)))
+
+
+def format_summary(results: list, wall_time: float) -> str:
+    """
+    :type results: list of BatchResult
+    """
+    steps = ["load", "detect", "demodulate", "write"]
+    name_len = max([len(os.path.basename(r.filename)) for r in results] + [len("File")])
+    header = "{:<{}}  {:>8}".format("File", name_len, "Messages") + "".join("{:>12}".format(s) for s in steps)
+    lines = [header + "{:>12}".format("total"), "-" * (len(header) + 12)]
+
+    for r in results:
+        line = "{:<{}}  {:>8}".format(os.path.basename(r.filename), name_len, r.num_messages)
+        if r.error is not None:
+            line += "  ERROR " + r.error
+        else:
+            line += "".join("{:>11.3f}s".format(r.timings.get(s, 0)) for s in steps)
+            line += "{:>11.3f}s".format(r.total_time)
+        lines.append(line)
+
+    num_errors = sum(1 for r in results if r.error is not None)
+    lines.append("")
+    lines.append("Processed {} files ({} failed) in {:.3f}s, {:.3f}s summed over files".format(
+        len(results), num_errors, wall_time, sum(r.total_time for r in results)))
+    return "\n".join(lines)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Demodulate signal files and extract their protocols "
+                                                 "without starting the GUI.")
+    parser.add_argument("filenames", nargs="+", help="Signal files (.complex, .complex16u, .complex16s, "
+                                                     ".coco, .wav)")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="Directory for the protocol files (default: next to the signal file)")
+    parser.add_argument("-f", "--format", choices=list(OUTPUT_FORMATS.keys()), default="xml",
+                        help="Output format (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("-m", "--modulation", choices=["ASK", "FSK", "PSK", "QAM"], default="FSK",
+                        help="Modulation type (default: %(default)s)")
+    parser.add_argument("-s", "--sample-rate", type=float, default=1e6, help="Sample rate (default: %(default)s)")
+    parser.add_argument("-b", "--bit-length", type=int, default=None, help="Bit length (default: auto detect)")
+    parser.add_argument("-c", "--center", type=float, default=None, help="Center (default: auto detect)")
+    parser.add_argument("-n", "--noise", type=float, default=None, help="Noise threshold (default: auto detect)")
+    parser.add_argument("-t", "--tolerance", type=int, default=None, help="Error tolerance")
+    parser.add_argument("--pause-threshold", type=int, default=None, help="Pause threshold")
+    parser.add_argument("--message-length-divisor", type=int, default=None, help="Message length divisor")
+    parser.add_argument("-d", "--decoding", default=DEFAULT_DECODING,
+                        help="Comma separated decoding chain as in decodings.txt (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    args = create_parser().parse_args(argv)
+
+    filenames = [f for f in args.filenames if os.path.isfile(f)]
+    for missing in sorted(set(args.filenames) - set(filenames)):
+        print("Skipping {}: file not found".format(missing), file=sys.stderr)
+
+    if not filenames:
+        sys.exit(1)
+
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    t = time.perf_counter()
+    results = run_batch(filenames, args)
+    print(format_summary(results, time.perf_counter() - t))
+
+    if any(r.error is not None for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
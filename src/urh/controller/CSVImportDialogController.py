@@ -1,4 +1,5 @@
 import csv
+import itertools
 
 import os
 import numpy as np
@@ -15,6 +16,7 @@ class CSVImportDialogController(QDialog):
 
 
     PREVIEW_ROWS = 100
+    CSV_BLOCK_SIZE = 2 ** 16  # rows parsed at once on import
     COLUMNS = {"T": 0, "I": 1, "Q": 2}
 
     def __init__(self, filename="", parent=None):
@@ -130,36 +132,109 @@ class CSVImportDialogController(QDialog):
         return result
 
     @staticmethod
-    def parse_csv_file(filename: str, separator: str, i_data_col: int, q_data_col=-1, t_data_col=-1):
-        iq_data = []
-        timestamps = [] if t_data_col > -1 else None
-        with open(filename, encoding="utf-8-sig") as f:
-            csv_reader = csv.reader(f, delimiter=separator)
-            for line in csv_reader:
+    def parse_csv_block(lines: list, separator: str, i_data_col: int, q_data_col=-1, t_data_col=-1):
+        """
+        Parse a block of CSV lines in bulk with NumPy.
+        Blocks with invalid lines (e.g. comments or headers) are parsed line by line and the invalid lines skipped.
+
+        :return: complex64 IQ data and float64 timestamps (None if there is no timestamp column)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        columns = [col for col in (i_data_col, q_data_col, t_data_col) if col >= 0]
+        try:
+            values = np.loadtxt(lines, delimiter=separator, usecols=columns, dtype=np.float64,
+                                comments=None, ndmin=2) if columns else np.zeros((len(lines), 0))
+        except (ValueError, IndexError):
+            values = []
+            for line in csv.reader(lines, delimiter=separator):
                 parsed = CSVImportDialogController.parse_csv_line(line, i_data_col, q_data_col, t_data_col)
-                if parsed is None:
-                    continue
+                if parsed is not None:
+                    values.append([parsed[key] for key, col in zip("IQT", (i_data_col, q_data_col, t_data_col))
+                                   if col >= 0])
+            values = np.array(values, dtype=np.float64).reshape((len(values), len(columns)))
+
+        iq_data = np.zeros(len(values), dtype=np.complex64)
+        col = 0
+        if i_data_col >= 0:
+            iq_data.real = values[:, col]
+            col += 1
+        if q_data_col >= 0:
+            iq_data.imag = values[:, col]
+            col += 1
 
-                iq_data.append(complex(parsed["I"], parsed["Q"]))
-                if timestamps is not None:
-                    timestamps.append(parsed["T"])
+        timestamps = values[:, col] if t_data_col >= 0 else None
+        return iq_data, timestamps
 
-        iq_data = np.asarray(iq_data, dtype=np.complex64)
+    @staticmethod
+    def iter_csv_blocks(filename: str, separator: str, i_data_col: int, q_data_col=-1, t_data_col=-1):
+        """
+        Parse the CSV file in blocks of CSV_BLOCK_SIZE rows
+
+        :return: Generator of (IQ data, timestamps) per block
+        """
+        with open(filename, encoding="utf-8-sig") as f:
+            while True:
+                lines = list(itertools.islice(f, CSVImportDialogController.CSV_BLOCK_SIZE))
+                if len(lines) == 0:
+                    break
+
+                yield CSVImportDialogController.parse_csv_block(lines, separator, i_data_col, q_data_col, t_data_col)
+
+    @staticmethod
+    def parse_csv_file(filename: str, separator: str, i_data_col: int, q_data_col=-1, t_data_col=-1):
+        blocks = list(CSVImportDialogController.iter_csv_blocks(filename, separator,
+                                                                i_data_col, q_data_col, t_data_col))
+        iq_data = np.concatenate([iq for iq, _ in blocks]) if blocks else np.zeros(0, dtype=np.complex64)
+        timestamps = np.concatenate([t for _, t in blocks]) if blocks and t_data_col > -1 else None
         sample_rate = CSVImportDialogController.estimate_sample_rate(timestamps)
         return iq_data / abs(iq_data.max()), sample_rate
 
+    @staticmethod
+    def import_csv_file(filename: str, target_filename: str, separator: str, i_data_col: int,
+                        q_data_col=-1, t_data_col=-1):
+        """
+        Stream a CSV file block-wise into a complex file and normalize it in place afterwards,
+        so the whole file never needs to be held in memory.
+
+        :return: Estimated sample rate or None, if there are no timestamps
+        """
+        maximum = None
+        num_samples = 0
+        timestamps = [] if t_data_col > -1 else None
+
+        with open(target_filename, "wb") as target:
+            for iq_data, block_timestamps in CSVImportDialogController.iter_csv_blocks(filename, separator, i_data_col,
+                                                                                       q_data_col, t_data_col):
+                if len(iq_data) == 0:
+                    continue
+
+                block_max = iq_data.max()
+                if maximum is None or (block_max.real, block_max.imag) > (maximum.real, maximum.imag):
+                    maximum = block_max
+
+                if timestamps is not None and len(timestamps) < CSVImportDialogController.PREVIEW_ROWS:
+                    timestamps.extend(block_timestamps[:CSVImportDialogController.PREVIEW_ROWS - len(timestamps)])
+
+                iq_data.tofile(target)
+                num_samples += len(iq_data)
+
+        if num_samples > 0:
+            data = np.memmap(target_filename, dtype=np.complex64, mode="r+", shape=(num_samples,))
+            scale = abs(maximum)
+            for start in range(0, num_samples, CSVImportDialogController.CSV_BLOCK_SIZE):
+                data[start:start + CSVImportDialogController.CSV_BLOCK_SIZE] /= scale
+            data.flush()
+            del data
+
+        return CSVImportDialogController.estimate_sample_rate(timestamps)
+
     @staticmethod
     def estimate_sample_rate(timestamps):
         if timestamps is None or len(timestamps) < 2:
             return None
 
-        previous_timestamp = timestamps[0]
-        durations = []
-
-        for timestamp in timestamps[1:CSVImportDialogController.PREVIEW_ROWS]:
-            durations.append(abs(timestamp-previous_timestamp))
-            previous_timestamp = timestamp
-
+        timestamps = np.asarray(timestamps[:CSVImportDialogController.PREVIEW_ROWS], dtype=np.float64)
+        durations = np.abs(np.diff(timestamps))
         return 1 / (sum(durations) / len(durations))
 
     @pyqtSlot()
@@ -207,11 +282,6 @@ class CSVImportDialogController(QDialog):
     def on_accepted(self):
         QApplication.setOverrideCursor(Qt.WaitCursor)
 
-        iq_data, sample_rate = self.parse_csv_file(self.filename, self.ui.comboBoxCSVSeparator.currentText(),
-                                                   self.ui.spinBoxIDataColumn.value()-1,
-                                                   self.ui.spinBoxQDataColumn.value()-1,
-                                                   self.ui.spinBoxTimestampColumn.value()-1)
-
         target_filename = self.filename.rstrip(".csv")
         if os.path.exists(target_filename + ".complex"):
             i = 1
@@ -223,7 +293,10 @@ class CSVImportDialogController(QDialog):
         target_filename = target_filename if not i else target_filename + "_" + str(i)
         target_filename += ".complex"
 
-        iq_data.tofile(target_filename)
+        sample_rate = self.import_csv_file(self.filename, target_filename, self.ui.comboBoxCSVSeparator.currentText(),
+                                           self.ui.spinBoxIDataColumn.value() - 1,
+                                           self.ui.spinBoxQDataColumn.value() - 1,
+                                           self.ui.spinBoxTimestampColumn.value() - 1)
 
         self.data_imported.emit(target_filename, sample_rate if sample_rate is not None else 0)
         QApplication.restoreOverrideCursor()
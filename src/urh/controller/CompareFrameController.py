@@ -29,6 +29,7 @@ from urh.util import FileOperator
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
 from urh.util.ProjectManager import ProjectManager
+from urh.util.QtNotifierAdapter import QtNotifierAdapter, ProtocolAnalyzerQtAdapter, SignalQtAdapter
 
 
 class CompareFrameController(QWidget):
@@ -108,6 +109,8 @@ class CompareFrameController(QWidget):
         self.proto_tree_model = ProtocolTreeModel(controller=self)  # type: ProtocolTreeModel
         self.ui.treeViewProtocols.setModel(self.proto_tree_model)
 
+        self.protocol_adapters = {}  # type: dict[ProtocolAnalyzer, list[QtNotifierAdapter]]
+
         self.create_connects()
         self.fill_decoding_combobox()
 
@@ -445,11 +448,15 @@ class CompareFrameController(QWidget):
     def add_protocol(self, protocol: ProtocolAnalyzer, group_id: int = 0) -> ProtocolAnalyzer:
         self.__protocols = None
         self.proto_tree_model.add_protocol(protocol, group_id)
-        protocol.qt_signals.protocol_updated.connect(self.set_shown_protocols)
+        protocol_adapter = ProtocolAnalyzerQtAdapter(protocol, parent=self)
+        protocol_adapter.protocol_updated.connect(self.set_shown_protocols)
+        protocol_adapter.show_state_changed.connect(self.set_shown_protocols)
+        protocol_adapter.show_state_changed.connect(self.filter_search_results)
+        self.protocol_adapters.setdefault(protocol, []).append(protocol_adapter)
         if protocol.signal:
-            protocol.signal.sample_rate_changed.connect(self.set_shown_protocols)  # Refresh times
-        protocol.qt_signals.show_state_changed.connect(self.set_shown_protocols)
-        protocol.qt_signals.show_state_changed.connect(self.filter_search_results)
+            signal_adapter = SignalQtAdapter(protocol.signal, parent=self)
+            signal_adapter.sample_rate_changed.connect(self.set_shown_protocols)  # Refresh times
+            self.protocol_adapters[protocol].append(signal_adapter)
         for i in range(self.proto_tree_model.ngroups):
             self.expand_group_node(i)
         return protocol
@@ -518,6 +525,9 @@ class CompareFrameController(QWidget):
     def remove_protocol(self, protocol: ProtocolAnalyzer):
         self.__protocols = None
         self.proto_tree_model.remove_protocol(protocol)
+        for adapter in self.protocol_adapters.pop(protocol, []):
+            adapter.disconnect_source()
+            adapter.deleteLater()
         try:
             del self.rows_for_protocols[protocol]
         except KeyError:
@@ -856,7 +856,7 @@ class DecoderWidgetController(QDialog):
             last_message = pa.messages[-1]
             lookup = {i: msg.bit_sample_pos for i, msg in enumerate(pa.messages)}
 
-            plot_data = signal.qad[lookup[0][0]:lookup[pa.num_messages - 1][len(last_message) - 1]]
+            plot_data = signal.get_qad_section(lookup[0][0], lookup[pa.num_messages - 1][len(last_message) - 1])
             self.ui.graphicsView_signal.plot_data(plot_data)
 
         self.ui.graphicsView_signal.centerOn(0, 0)
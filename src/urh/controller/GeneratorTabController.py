@@ -31,6 +31,7 @@ from urh.util.Errors import Errors
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
 from urh.util.ProjectManager import ProjectManager
+from urh.util.QtNotifierAdapter import ProtocolAnalyzerQtAdapter
 
 
 class GeneratorTabController(QWidget):
@@ -116,11 +117,11 @@ class GeneratorTabController(QWidget):
         self.ui.tableMessages.selectionModel().selectionChanged.connect(self.on_table_selection_changed)
         self.ui.tableMessages.encodings_updated.connect(self.on_table_selection_changed)
         self.table_model.undo_stack.indexChanged.connect(self.on_undo_stack_index_changed)
-        self.table_model.protocol.qt_signals.line_duplicated.connect(self.refresh_pause_list)
-        self.table_model.protocol.qt_signals.fuzzing_started.connect(self.on_fuzzing_started)
-        self.table_model.protocol.qt_signals.current_fuzzing_message_changed.connect(
-            self.on_current_fuzzing_message_changed)
-        self.table_model.protocol.qt_signals.fuzzing_finished.connect(self.on_fuzzing_finished)
+        protocol_adapter = ProtocolAnalyzerQtAdapter(self.table_model.protocol, parent=self)
+        protocol_adapter.line_duplicated.connect(self.refresh_pause_list)
+        protocol_adapter.fuzzing_started.connect(self.on_fuzzing_started)
+        protocol_adapter.current_fuzzing_message_changed.connect(self.on_current_fuzzing_message_changed)
+        protocol_adapter.fuzzing_finished.connect(self.on_fuzzing_finished)
         self.table_model.first_protocol_added.connect(self.on_first_protocol_added)
         self.label_list_model.protolabel_fuzzing_status_changed.connect(self.set_fuzzing_ui_status)
         self.ui.cbViewType.currentIndexChanged.connect(self.on_view_type_changed)
@@ -31,6 +31,7 @@ from urh.ui.ui_main import Ui_MainWindow
 from urh.util import FileOperator
 from urh.util.Errors import Errors
 from urh.util.Logger import logger
+from urh.util.Notifier import Notifier
 from urh.util.ProjectManager import ProjectManager
 
 
@@ -270,13 +271,13 @@ class MainController(QMainWindow):
         sig_frame = self.signal_tab_controller.add_signal_frame(pa, index=index)
         pa = self.compare_frame_controller.add_protocol(pa, group_id)
 
-        signal.blockSignals(True)
+        Notifier.block_all(signal, True)
         has_entry = self.project_manager.read_project_file_for_signal(signal)
 
         if not has_entry and not signal.changed:
             signal.auto_detect()
 
-        signal.blockSignals(False)
+        Notifier.block_all(signal, False)
 
         self.signal_protocol_dict[sig_frame] = pa
 
@@ -794,6 +795,12 @@ class MainController(QMainWindow):
         if "spectrogram_colormap" in changed_options:
             self.signal_tab_controller.redraw_spectrograms()
 
+        if "costa_reset_noise_samples" in changed_options:
+            for sf in self.signal_tab_controller.signal_frames:
+                if sf.signal is not None:
+                    sf.signal.costa_reset_noise_samples = int(changed_options["costa_reset_noise_samples"])
+                    sf.refresh_signal()
+
     @pyqtSlot()
     def on_text_edit_project_description_text_changed(self):
         self.project_manager.description = self.ui.textEditProjectDescription.toPlainText()
@@ -1,11 +1,13 @@
 import numpy
 from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QCloseEvent, QResizeEvent, QKeyEvent
+from PyQt5.QtGui import QCloseEvent, QResizeEvent, QKeyEvent, QPen
 from PyQt5.QtWidgets import QDialog, QMessageBox
 
 from urh import constants
+from urh.cythonext import path_creator
 from urh.signalprocessing.Modulator import Modulator
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.ui.painting.ZoomableScene import ZoomableScene
 from urh.ui.ui_modulation import Ui_DialogModulation
 
 
@@ -153,9 +155,20 @@ class ModulatorDialogController(QDialog):
         self.ui.gVCarrier.plot_data(self.current_modulator.carrier_data)
 
     def draw_data_bits(self):
-        self.ui.gVData.setScene(self.current_modulator.data_scene)
+        self.ui.gVData.setScene(self.__create_data_scene(self.current_modulator))
         self.ui.gVData.update()
 
+    @staticmethod
+    def __create_data_scene(modulator: Modulator) -> ZoomableScene:
+        n = modulator.samples_per_bit * len(modulator.display_bits)
+        scene = ZoomableScene()
+        scene.setSceneRect(0, -1, n, 2)
+        scene.setBackgroundBrush(constants.BGCOLOR)
+        scene.addLine(0, 0, n, 0, QPen(constants.AXISCOLOR, Qt.FlatCap))
+        path = path_creator.array_to_QPath(numpy.arange(0, n).astype(numpy.int64), modulator.display_data)
+        scene.addPath(path, QPen(constants.LINECOLOR, Qt.FlatCap))
+        return scene
+
     def draw_modulated(self):
         self.current_modulator.modulate(pause=0)
         self.ui.gVModulated.plot_data(self.current_modulator.modulated_samples.imag.astype(numpy.float32))
@@ -177,7 +190,7 @@ class ModulatorDialogController(QDialog):
         h = scene_manager.scene.sceneRect().height()
         self.ui.gVOriginalSignal.setSceneRect(start, y, end - start, h)
         self.ui.gVOriginalSignal.fitInView(self.ui.gVOriginalSignal.sceneRect())
-        scene_manager.show_scene_section(start, end)
+        scene_manager.show_scene_section(start, end, num_pixels=self.ui.gVOriginalSignal.viewport().width())
         self.ui.gVOriginalSignal.update()
 
         if self.lock_samples_in_view:
@@ -21,6 +21,7 @@ from urh.signalprocessing.Spectrogram import Spectrogram
 from urh.ui.delegates.ComboBoxDelegate import ComboBoxDelegate
 from urh.ui.ui_options import Ui_DialogOptions
 from urh.util import util
+from urh.util.SignalCache import SignalCache
 
 
 class OptionsController(QDialog):
@@ -148,6 +149,7 @@ class OptionsController(QDialog):
         self.ui.btnHealthCheck.clicked.connect(self.on_btn_health_check_clicked)
         self.ui.comboBoxIconTheme.currentIndexChanged.connect(self.on_combobox_icon_theme_index_changed)
         self.ui.checkBoxMultipleModulations.clicked.connect(self.on_checkbox_multiple_modulations_clicked)
+        self.ui.btnClearSignalCache.clicked.connect(self.on_btn_clear_signal_cache_clicked)
 
     def show_gnuradio_infos(self):
         self.ui.lineEditPython2Interpreter.setText(self.backend_handler.python2_exe)
@@ -204,9 +206,22 @@ class OptionsController(QDialog):
 
         self.old_show_pause_as_time = bool(self.ui.checkBoxPauseTime.isChecked())
 
+        self.ui.spinBoxCostaResetNoiseSamples.setValue(settings.value('costa_reset_noise_samples', 0, int))
+        self.old_costa_reset_noise_samples = self.ui.spinBoxCostaResetNoiseSamples.value()
+
+        self.ui.checkBoxUseSignalCache.setChecked(settings.value('use_signal_cache', True, bool))
+        self.old_use_signal_cache = self.ui.checkBoxUseSignalCache.isChecked()
+        cache_size_mb = settings.value('signal_cache_size_mb', SignalCache.DEFAULT_SIZE_MB, int)
+        self.ui.spinBoxSignalCacheSize.setValue(cache_size_mb)
+        self.show_signal_cache_usage()
+
         self.field_type_table_model.field_types = FieldType.load_from_xml()
         self.field_type_table_model.update()
 
+    def show_signal_cache_usage(self):
+        used_mb = SignalCache.total_size() / 1024 ** 2
+        self.ui.labelSignalCacheUsage.setText("Currently used: {0:.0f} MiB".format(used_mb))
+
     def refresh_device_tab(self):
         self.backend_handler.get_backends()
         self.show_gnuradio_infos()
@@ -235,11 +250,18 @@ class OptionsController(QDialog):
             changed_values['show_pause_as_time'] = bool(self.ui.checkBoxPauseTime.isChecked())
         if self.old_default_view != self.ui.comboBoxDefaultView.currentIndex():
             changed_values['default_view'] = self.ui.comboBoxDefaultView.currentIndex()
+        if self.old_costa_reset_noise_samples != self.ui.spinBoxCostaResetNoiseSamples.value():
+            changed_values['costa_reset_noise_samples'] = self.ui.spinBoxCostaResetNoiseSamples.value()
 
         settings = constants.SETTINGS
         settings.setValue('default_view', self.ui.comboBoxDefaultView.currentIndex())
         settings.setValue('num_sending_repeats', self.ui.spinBoxNumSendingRepeats.value())
         settings.setValue('show_pause_as_time', self.ui.checkBoxPauseTime.isChecked())
+        settings.setValue('costa_reset_noise_samples', self.ui.spinBoxCostaResetNoiseSamples.value())
+        settings.setValue('use_signal_cache', self.ui.checkBoxUseSignalCache.isChecked())
+        settings.setValue('signal_cache_size_mb', self.ui.spinBoxSignalCacheSize.value())
+        if self.old_use_signal_cache != self.ui.checkBoxUseSignalCache.isChecked():
+            SignalCache.ENABLED = self.ui.checkBoxUseSignalCache.isChecked()
 
         FieldType.save_to_xml(self.field_type_table_model.field_types)
         self.plugin_controller.save_enabled_states()
@@ -443,6 +465,11 @@ class OptionsController(QDialog):
     def on_checkbox_multiple_modulations_clicked(self):
         constants.SETTINGS.setValue("multiple_modulations", self.ui.checkBoxMultipleModulations.isChecked())
 
+    @pyqtSlot()
+    def on_btn_clear_signal_cache_clicked(self):
+        SignalCache.clear()
+        self.show_signal_cache_usage()
+
     @staticmethod
     def write_default_options():
         settings = constants.SETTINGS
@@ -10,6 +10,7 @@ from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import NetworkSDR
 from urh.signalprocessing.ProtocolSniffer import ProtocolSniffer
 from urh.ui.painting.LiveSceneManager import LiveSceneManager
 from urh.util import util
+from urh.util.QtNotifierAdapter import ProtocolAnalyzerQtAdapter
 
 
 class ProtocolSniffDialogController(SendRecvDialogController):
@@ -92,8 +93,9 @@ class ProtocolSniffDialogController(SendRecvDialogController):
         super().create_connects()
         self.ui.btnAccept.clicked.connect(self.on_btn_accept_clicked)
 
-        self.sniffer.qt_signals.data_sniffed.connect(self.on_data_sniffed)
-        self.sniffer.qt_signals.sniff_device_errors_changed.connect(self.on_device_errors_changed)
+        sniffer_adapter = ProtocolAnalyzerQtAdapter(self.sniffer, parent=self)
+        sniffer_adapter.data_sniffed.connect(self.on_data_sniffed)
+        sniffer_adapter.sniff_device_errors_changed.connect(self.on_device_errors_changed)
 
         self.ui.spinbox_sniff_Noise.editingFinished.connect(self.on_noise_edited)
         self.ui.spinbox_sniff_Center.editingFinished.connect(self.on_center_edited)
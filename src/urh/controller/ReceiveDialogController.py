@@ -1,3 +1,6 @@
+import locale
+import os
+
 import numpy as np
 from PyQt5.QtCore import pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon
@@ -68,16 +71,59 @@ class ReceiveDialogController(SendRecvDialogController):
             self.scene_manager.show_full_scene()
             self.graphics_view.update()
 
+        if self.device.record_filename is not None:
+            # The receive buffer only holds the most recent samples, so show the size of the recording
+            num_samples = self.device.num_recorded_samples
+            self.ui.lSamplesCaptured.setText("{0:n}".format(num_samples))
+            self.ui.lSignalSize.setText(locale.format_string("%.2f", (8 * num_samples) / (1024 ** 2)))
+            self.ui.lTime.setText(locale.format_string("%.2f", num_samples / self.device.sample_rate))
+
     def init_device(self):
         device_name = self.ui.cbDevice.currentText()
         self.device = VirtualDevice(self.backend_handler, device_name, Mode.receive,
                                     device_ip="192.168.10.2", parent=self)
         self._create_device_connects()
         self.scene_manager = LiveSceneManager(np.array([]), parent=self)
+        self.ui.checkBoxRecordToDisk.setEnabled(self.device.supports_recording_to_file)
+
+    def get_initial_filename(self) -> str:
+        dev = self.device
+        big_val = Formatter.big_value_with_suffix
+        initial_name = "{0}-{1}Hz-{2}Sps".format(dev.name, big_val(dev.frequency), big_val(dev.sample_rate))
+
+        if dev.bandwidth_is_adjustable:
+            initial_name += "-{}Hz".format(big_val(dev.bandwidth))
+
+        return initial_name.replace(Formatter.local_decimal_seperator(), "_").replace("_000", "")
+
+    def get_record_filename(self) -> str:
+        """
+        Ask for the file to record to. The extension is set to the native sample format of the device.
+
+        :return: filename or None if the dialog was canceled
+        """
+        extension = self.device.recording_file_extension
+        filename = FileOperator.get_save_file_name(self.get_initial_filename() + extension)
+        if not filename:
+            return None
+
+        if not filename.endswith(extension):
+            filename = os.path.splitext(filename)[0] + extension
+        return filename
 
     @pyqtSlot()
     def on_start_clicked(self):
         super().on_start_clicked()
+
+        if self.device.supports_recording_to_file:
+            if self.ui.checkBoxRecordToDisk.isChecked():
+                filename = self.get_record_filename()
+                if filename is None:
+                    return
+                self.device.record_filename = filename
+            else:
+                self.device.record_filename = None
+
         self.device.start()
 
     @pyqtSlot()
@@ -89,6 +135,20 @@ class ReceiveDialogController(SendRecvDialogController):
         self.already_saved = False
         self.ui.btnStart.setEnabled(False)
         self.set_device_ui_items_enabled(False)
+        self.ui.checkBoxRecordToDisk.setEnabled(False)
+
+    @pyqtSlot()
+    def on_device_stopped(self):
+        super().on_device_stopped()
+        self.ui.checkBoxRecordToDisk.setEnabled(self.device.supports_recording_to_file)
+
+        filename = self.device.record_filename
+        if filename is not None:
+            # Recording is already on disk and will be opened memory mapped
+            self.already_saved = True
+            self.ui.btnSave.setEnabled(False)
+            if filename not in self.recorded_files:
+                self.recorded_files.append(filename)
 
     @pyqtSlot()
     def on_clear_clicked(self):
@@ -98,17 +158,7 @@ class ReceiveDialogController(SendRecvDialogController):
     @pyqtSlot()
     def on_save_clicked(self):
         data = self.device.data[:self.device.current_index]
-
-        dev = self.device
-        big_val = Formatter.big_value_with_suffix
-        initial_name = "{0}-{1}Hz-{2}Sps".format(dev.name, big_val(dev.frequency), big_val(dev.sample_rate))
-
-        if dev.bandwidth_is_adjustable:
-            initial_name += "-{}Hz".format(big_val(dev.bandwidth))
-
-        initial_name = initial_name.replace(Formatter.local_decimal_seperator(), "_").replace("_000", "")
-
-        filename = FileOperator.save_data_dialog(initial_name + ".complex", data, parent=self)
+        filename = FileOperator.save_data_dialog(self.get_initial_filename() + ".complex", data, parent=self)
         self.already_saved = True
         if filename is not None and filename not in self.recorded_files:
             self.recorded_files.append(filename)
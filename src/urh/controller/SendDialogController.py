@@ -1,6 +1,6 @@
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QBrush, QColor, QIcon, QPen
-from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtWidgets import QMessageBox, QApplication
 
 from urh import constants
 from urh.controller.SendRecvDialogController import SendRecvDialogController
@@ -8,6 +8,7 @@ from urh.dev.VirtualDevice import VirtualDevice, Mode
 from urh.signalprocessing.Signal import Signal
 from urh.ui.painting.SignalSceneManager import SignalSceneManager
 from urh.util import FileOperator
+from urh.util.QtNotifierAdapter import SignalQtAdapter
 
 
 class SendDialogController(SendRecvDialogController):
@@ -57,7 +58,7 @@ class SendDialogController(SendRecvDialogController):
         super().create_connects()
 
         self.graphics_view.save_as_clicked.connect(self.on_graphics_view_save_as_clicked)
-        self.scene_manager.signal.data_edited.connect(self.on_signal_data_edited)
+        SignalQtAdapter(self.scene_manager.signal, parent=self).data_edited.connect(self.on_signal_data_edited)
 
     def _update_send_indicator(self, width: int):
         y, h = self.ui.graphicsViewSend.view_rect().y(), self.ui.graphicsViewSend.view_rect().height()
@@ -93,10 +94,13 @@ class SendDialogController(SendRecvDialogController):
     def on_graphics_view_save_as_clicked(self):
         filename = FileOperator.get_save_file_name("signal.complex")
         if filename:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
                 self.scene_manager.signal.save_as(filename)
             except Exception as e:
                 QMessageBox.critical(self, self.tr("Error saving signal"), e.args[0])
+            finally:
+                QApplication.restoreOverrideCursor()
 
     @pyqtSlot()
     def on_signal_data_edited(self):
@@ -26,6 +26,7 @@ from urh.util import FileOperator, util
 from urh.util.Errors import Errors
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
+from urh.util.QtNotifierAdapter import SignalQtAdapter, ProtocolAnalyzerQtAdapter
 
 
 def perform_filter(result_array: Array, data, f_low, f_high, filter_bw):
@@ -73,6 +74,9 @@ class SignalFrameController(QFrame):
 
         self.proto_analyzer = proto_analyzer
         self.signal = proto_analyzer.signal if self.proto_analyzer is not None else None  # type: Signal
+        self.signal_adapter = SignalQtAdapter(self.signal, parent=self) if self.signal is not None else None
+        self.proto_analyzer_adapter = ProtocolAnalyzerQtAdapter(self.proto_analyzer, parent=self) \
+            if self.proto_analyzer is not None else None
         self.ui.gvSignal.protocol = self.proto_analyzer
         self.ui.gvSignal.set_signal(self.signal)
         self.ui.sliderFFTWindowSize.setValue(int(math.log2(Spectrogram.DEFAULT_FFT_WINDOW_SIZE)))
@@ -172,19 +176,19 @@ class SignalFrameController(QFrame):
         if self.signal is not None:
             self.ui.gvSignal.save_clicked.connect(self.save_signal)
 
-            self.signal.bit_len_changed.connect(self.ui.spinBoxInfoLen.setValue)
-            self.signal.qad_center_changed.connect(self.on_signal_qad_center_changed)
-            self.signal.noise_threshold_changed.connect(self.on_noise_threshold_changed)
-            self.signal.modulation_type_changed.connect(self.ui.cbModulationType.setCurrentIndex)
-            self.signal.tolerance_changed.connect(self.ui.spinBoxTolerance.setValue)
-            self.signal.protocol_needs_update.connect(self.refresh_protocol)
-            self.signal.data_edited.connect(self.on_signal_data_edited)  # Crop/Delete Mute etc.
+            self.signal_adapter.bit_len_changed.connect(self.ui.spinBoxInfoLen.setValue)
+            self.signal_adapter.qad_center_changed.connect(self.on_signal_qad_center_changed)
+            self.signal_adapter.noise_threshold_changed.connect(self.on_noise_threshold_changed)
+            self.signal_adapter.modulation_type_changed.connect(self.ui.cbModulationType.setCurrentIndex)
+            self.signal_adapter.tolerance_changed.connect(self.ui.spinBoxTolerance.setValue)
+            self.signal_adapter.protocol_needs_update.connect(self.refresh_protocol)
+            self.signal_adapter.data_edited.connect(self.on_signal_data_edited)  # Crop/Delete Mute etc.
 
-            self.signal.sample_rate_changed.connect(self.on_signal_sample_rate_changed)
+            self.signal_adapter.sample_rate_changed.connect(self.on_signal_sample_rate_changed)
 
-            self.signal.saved_status_changed.connect(self.on_signal_data_changed_before_save)
+            self.signal_adapter.saved_status_changed.connect(self.on_signal_data_changed_before_save)
             self.ui.btnSaveSignal.clicked.connect(self.save_signal)
-            self.signal.name_changed.connect(self.ui.lineEditSignalName.setText)
+            self.signal_adapter.name_changed.connect(self.ui.lineEditSignalName.setText)
             self.ui.gvLegend.resized.connect(self.on_gv_legend_resized)
 
             self.ui.gvSignal.selection_width_changed.connect(self.start_proto_selection_timer)
@@ -193,7 +197,7 @@ class SignalFrameController(QFrame):
             self.spectrogram_update_timer.timeout.connect(self.on_spectrogram_update_timer_timeout)
 
             self.ui.lineEditSignalName.editingFinished.connect(self.change_signal_name)
-            self.proto_analyzer.qt_signals.protocol_updated.connect(self.on_protocol_updated)
+            self.proto_analyzer_adapter.protocol_updated.connect(self.on_protocol_updated)
 
             self.ui.btnFilter.clicked.connect(self.on_btn_filter_clicked)
 
@@ -415,7 +419,9 @@ class SignalFrameController(QFrame):
 
     def save_signal(self):
         if len(self.signal.filename) > 0:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
             self.signal.save()
+            QApplication.restoreOverrideCursor()
         else:
             self.save_signal_as()
 
@@ -427,10 +433,13 @@ class SignalFrameController(QFrame):
 
         filename = FileOperator.get_save_file_name(initial_name, wav_only=self.signal.wav_mode)
         if filename:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
                 self.signal.save_as(filename)
             except Exception as e:
                 QMessageBox.critical(self, self.tr("Error saving signal"), e.args[0])
+            finally:
+                QApplication.restoreOverrideCursor()
 
     def draw_signal(self, full_signal=False):
         gv_legend = self.ui.gvLegend
@@ -580,6 +589,8 @@ class SignalFrameController(QFrame):
 
         if self.signal is not None:
             # Avoid memory leaks
+            self.signal_adapter.disconnect_source()
+            self.proto_analyzer_adapter.disconnect_source()
             self.scene_manager.eliminate()
             self.signal.eliminate()
             self.proto_analyzer.eliminate()
@@ -740,7 +751,7 @@ class SignalFrameController(QFrame):
     def on_btn_replay_clicked(self):
         project_manager = self.project_manager
         try:
-            dialog = SendDialogController(project_manager, modulated_data=self.signal.data, parent=self)
+            dialog = SendDialogController(project_manager, modulated_data=np.asarray(self.signal.data), parent=self)
         except OSError as e:
             logger.error(repr(e))
             return
@@ -1175,7 +1186,7 @@ class SignalFrameController(QFrame):
         QApplication.instance().setOverrideCursor(Qt.WaitCursor)
         filter_bw = Filter.read_configured_filter_bw()
         filtered = Array("f", 2 * self.signal.num_samples)
-        p = Process(target=perform_filter, args=(filtered, self.signal.data, f_low, f_high, filter_bw))
+        p = Process(target=perform_filter, args=(filtered, np.asarray(self.signal.data), f_low, f_high, filter_bw))
         p.daemon = True
         p.start()
 
@@ -1,5 +1,6 @@
 from PyQt5.QtCore import QPoint, pyqtSignal, Qt, pyqtSlot
-from PyQt5.QtWidgets import QSplitter, QWidget, QVBoxLayout, QSizePolicy, QUndoStack, QCheckBox, QMessageBox
+from PyQt5.QtWidgets import QSplitter, QWidget, QVBoxLayout, QSizePolicy, QUndoStack, QCheckBox, QMessageBox, \
+    QApplication
 
 from urh import constants
 
@@ -148,10 +149,12 @@ class SignalTabController(QWidget):
             if reply != QMessageBox.Yes:
                 return
 
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         for f in self.signal_frames:
             if f.signal is None or f.signal.filename == "":
                 continue
             f.signal.save()
+        QApplication.restoreOverrideCursor()
 
     @pyqtSlot()
     def close_all(self):
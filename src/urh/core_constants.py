@@ -0,0 +1,98 @@
+"""
+Constants of the signal processing core. They do not depend on Qt, so the core
+can be used in scripts and worker processes without importing it.
+urh.constants provides them together with the colors and settings of the GUI.
+"""
+
+
+class color:
+    PURPLE = '\033[95m'
+    CYAN = '\033[96m'
+    DARKCYAN = '\033[36m'
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+    END = '\033[0m'
+
+
+MAX_RECENT_FILE_NR = 10
+ZOOM_TICKS = 10
+
+PIXELS_PER_PATH = 5000
+
+SPECTRUM_BUFFER_SIZE = 2**15
+SNIFF_BUFFER_SIZE = 5 * 10 ** 7
+
+PAUSE_TRESHOLD = 10
+RECT_BIT_WIDTH = 10
+BIT_SCENE_HEIGHT = 100
+
+SELECTION_OPACITY = 0.8
+NOISE_OPACITY = 0.4
+
+SEPARATION_OPACITY = 0.2
+SEPARATION_PADDING = .05  # Prozent
+
+SEPARATION_ROW_HEIGHT = 30
+
+PROJECT_FILE = "URHProject.xml"
+DECODINGS_FILE = "decodings.txt"
+
+# Values of Qt.Unchecked and Qt.Checked for the check states of labels and protocols
+UNCHECKED = 0
+CHECKED = 2
+
+# DEVICE SETTINGS
+DEFAULT_IP_USRP = "192.168.10.2"
+DEFAULT_IP_RTLSDRTCP = "127.0.0.1"
+
+# DECODING NAMES
+DECODING_INVERT = "Invert"
+DECODING_DIFFERENTIAL = "Differential Encoding"
+DECODING_REDUNDANCY = "Remove Redundancy"
+DECODING_DATAWHITENING = "Remove Data Whitening (CC1101)"
+DECODING_CARRIER = "Remove Carrier"
+DECODING_BITORDER = "Change Bitorder"
+DECODING_EDGE = "Edge Trigger"
+DECODING_SUBSTITUTION = "Substitution"
+DECODING_EXTERNAL = "External Program"
+DECODING_ENOCEAN = "Wireless Short Packet (WSP)"
+DECODING_CUT = "Cut before/after"
+DECODING_MORSE = "Morse Code"
+DECODING_DISABLED_PREFIX = "[Disabled] "
+
+# RGBA values of the label colors, labels and participants store an index into them
+LABEL_COLORS_RGBA = [(217, 240, 27, 125),  # yellow
+                     (41, 172, 81, 125),  # green
+                     (245, 12, 12, 125),  # red
+                     (12, 12, 242, 125),  # blue
+                     (67, 44, 14, 125),  # brown
+                     (146, 49, 49, 125),  # dark red
+                     (9, 9, 54, 125),  # dark blue
+                     (17, 49, 27, 125),  # dark green
+                     (244, 246, 36, 125),  # strong yellow
+                     (61, 67, 67, 125),  # gray 3
+                     (58, 60, 100, 125),  # halfdark blue
+                     (139, 148, 148, 125),  # gray 2
+                     (153, 207, 206, 125),  # light blue green
+                     (207, 223, 223, 125),  # gray 1
+                     (106, 10, 10, 125),  # darker red
+                     (12, 142, 242, 125),  # light blue
+                     (213, 212, 134, 125),  # light yellow
+                     (240, 238, 244, 125),  # gray 0
+                     (201, 121, 18, 125),  # orange
+                     (155, 170, 224, 125),  # lighter blue
+                     (12, 242, 201, 125),  # blue green
+                     (7, 237, 78, 125),  # light green
+                     (154, 37, 111, 125),  # pink
+                     (159, 237, 7, 125),  # yellow green
+                     (231, 136, 242, 125),  # light pink
+                     ]
+
+NUM_CENTERS = 16
+
+SHORTEST_PREAMBLE_IN_BITS = 8
+SHORTEST_CONSTANT_IN_BITS = 8
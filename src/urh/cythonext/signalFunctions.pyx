@@ -45,18 +45,48 @@ cpdef float get_noise_for_mod_type(int mod_type):
         return 0
 
 
-cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise_sqrd,
-                          float costa_alpha, float costa_beta, bool qam, long long num_samples):
+cdef class DemodulationState:
+    """
+    State of afp_demod_chunk at the border between two consecutive chunks of a signal.
+    States are never changed by afp_demod_chunk, so they can be stored as checkpoints.
+    """
+    cdef public float complex prev_sample  # Last sample of the previous chunk for FSK
+    cdef public float costa_phase
+    cdef public float costa_freq
+    cdef public unsigned long long num_samples  # Number of samples demodulated before
+    cdef public unsigned long long noise_samples  # Consecutive noise samples at end of previous chunk (PSK/QAM)
+
+    def __init__(self, float complex prev_sample=0, float costa_phase=0, float costa_freq=0,
+                 unsigned long long num_samples=0, unsigned long long noise_samples=0):
+        self.prev_sample = prev_sample
+        self.costa_phase = costa_phase
+        self.costa_freq = costa_freq
+        self.num_samples = num_samples
+        self.noise_samples = noise_samples
+
+    def __reduce__(self):
+        return DemodulationState, (self.prev_sample, self.costa_phase, self.costa_freq,
+                                   self.num_samples, self.noise_samples)
+
+    def __repr__(self):
+        return "DemodulationState(prev_sample={}, costa_phase={}, costa_freq={}, num_samples={}, " \
+               "noise_samples={})".format(self.prev_sample, self.costa_phase, self.costa_freq,
+                                          self.num_samples, self.noise_samples)
+
+
+cdef void costa_demod(float complex[::1] samples, float[::1] result, long long start, long long end,
+                      float noise_sqrd, float costa_alpha, float costa_beta, bool qam,
+                      float* costa_phase_ptr, float* costa_freq_ptr) nogil:
     cdef float phase_error
     cdef long long i
-    cdef float costa_freq = 0
-    cdef float costa_phase = 0
+    cdef float costa_freq = costa_freq_ptr[0]
+    cdef float costa_phase = costa_phase_ptr[0]
     cdef float complex nco_out
     cdef float complex nco_times_sample, c
     cdef float real, imag
     cdef float magnitude
 
-    for i in range(0, num_samples):
+    for i in range(start, end):
         c = samples[i]
         real, imag = c.real, c.imag
         magnitude = real * real + imag * imag
@@ -77,32 +107,57 @@ cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise
         else:
             result[i] = nco_times_sample.real
 
-cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
+    costa_phase_ptr[0] = costa_phase
+    costa_freq_ptr[0] = costa_freq
+
+cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type,
+                                                 unsigned long long costa_reset_noise_samples=0):
     if len(samples) <= 2:
         return np.zeros(len(samples), dtype=np.float32)
 
+    return afp_demod_chunk(samples, noise_mag, mod_type, None, costa_reset_noise_samples)[0]
+
+cpdef tuple afp_demod_chunk(float complex[::1] samples, float noise_mag, int mod_type,
+                            DemodulationState state=None, unsigned long long costa_reset_noise_samples=0):
+    """
+    Demodulate a chunk of a signal starting at the given state.
+    Demodulating consecutive chunks and passing the returned state on to the next call
+    gives the same result as demodulating the concatenated chunks with afp_demod.
+
+    :param state: State after the previous chunk or None for the start of the signal
+    :param costa_reset_noise_samples: For PSK and QAM reset the Costas loop when a burst starts after at least
+                                      so many noise samples. The bursts are demodulated in parallel then.
+                                      The default 0 never resets the loop, as bits after a reset may be inverted.
+    :return: demodulated chunk and the state after this chunk
+    """
+    if state is None:
+        state = DemodulationState()
+
     cdef long long i, ns
     cdef float complex tmp = 0
     cdef float complex c = 0
-    cdef float arg, noise_sqrd, complex_phase, prev_phase, NOISE
+    cdef float noise_sqrd, NOISE
     cdef float real = 0
     cdef float imag = 0
     ns = len(samples)
 
     cdef float[::1] result = np.zeros(ns, dtype=np.float32, order="C")
-    cdef float costa_freq = 0
-    cdef float costa_phase = 0
-    cdef complex nco_out = 0
-    cdef float phase_error
     cdef float costa_alpha, costa_beta
-    cdef complex nco_times_sample
     cdef float magnitude = 0
+    cdef unsigned long long noise_samples = 0
+
+    cdef long long k, num_bursts
+    cdef long long[::1] burst_starts
+    cdef float[::1] costa_phases
+    cdef float[::1] costa_freqs
+
+    if ns == 0:
+        return np.asarray(result), state
 
     # Atan2 liefert Werte im Bereich von -Pi bis Pi
     # Wir nutzen die Magic Constant NOISE_FSK_PSK um Rauschen abzuschneiden
     noise_sqrd = noise_mag * noise_mag
     NOISE = get_noise_for_mod_type(mod_type)
-    result[0] = NOISE
 
     cdef bool qam = False
 
@@ -112,9 +167,59 @@ cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, flo
 
         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))
         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))
-        costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns)
+
+        num_bursts = 1
+        burst_starts = np.empty(2 if costa_reset_noise_samples == 0 else ns // costa_reset_noise_samples + 3,
+                                dtype=np.int64)
+        costa_phases = np.zeros(len(burst_starts), dtype=np.float32)
+        costa_freqs = np.zeros(len(burst_starts), dtype=np.float32)
+        costa_phases[0], costa_freqs[0] = state.costa_phase, state.costa_freq
+        burst_starts[0] = 0
+
+        if costa_reset_noise_samples > 0:
+            # Split at long noise gaps, the loop is reset there, so the bursts can be demodulated in parallel
+            noise_samples = state.noise_samples
+            for i in range(0, ns):
+                c = samples[i]
+                if c.real * c.real + c.imag * c.imag <= noise_sqrd:
+                    noise_samples += 1
+                    continue
+
+                if noise_samples >= costa_reset_noise_samples:
+                    if i == 0:
+                        costa_phases[0], costa_freqs[0] = 0, 0
+                    else:
+                        burst_starts[num_bursts] = i
+                        num_bursts += 1
+                noise_samples = 0
+
+        burst_starts[num_bursts] = ns
+
+        if num_bursts == 1:
+            costa_demod(samples, result, 0, ns, noise_sqrd, costa_alpha, costa_beta, qam,
+                        &costa_phases[0], &costa_freqs[0])
+        else:
+            for k in prange(0, num_bursts, nogil=True, schedule='dynamic'):
+                costa_demod(samples, result, burst_starts[k], burst_starts[k + 1], noise_sqrd,
+                            costa_alpha, costa_beta, qam, &costa_phases[k], &costa_freqs[k])
+
+        return np.asarray(result), DemodulationState(samples[ns - 1], costa_phases[num_bursts - 1],
+                                                     costa_freqs[num_bursts - 1], state.num_samples + ns,
+                                                     noise_samples)
 
     else:
+        # The first sample of the signal has no predecessor, later chunks continue with the previous sample
+        result[0] = NOISE
+        if state.num_samples > 0:
+            c = samples[0]
+            magnitude = c.real * c.real + c.imag * c.imag
+            if magnitude > noise_sqrd:
+                if mod_type == 0:  # ASK
+                    result[0] = magnitude
+                elif mod_type == 1:  # FSK
+                    tmp = state.prev_sample.conjugate() * c
+                    result[0] = atan2(tmp.imag, tmp.real)
+
         for i in prange(1, ns, nogil=True, schedule='static'):
             c = samples[i]
             real, imag = c.real, c.imag
@@ -129,7 +234,7 @@ cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, flo
                 tmp = samples[i - 1].conjugate() * c
                 result[i] = atan2(tmp.imag, tmp.real)  # Freq
 
-    return np.asarray(result)
+    return np.asarray(result), DemodulationState(samples[ns - 1], num_samples=state.num_samples + ns)
 
 cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):
 
@@ -195,105 +300,220 @@ cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type)
 
     return ns
 
-cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples, float center,
-                                                 unsigned int tolerance, int modulation_type, unsigned int bit_length):
+cdef class PulseState:
     """
-    Holt sich die Pulslängen aus den quadraturdemodulierten Samples
-    @param samples: Samples nach der QAD
-    @param center: Alles über der Treshold ist ein Einserpuls, alles darunter 0er Puls
-    @return: Ein 2D Array arr.
-    arr[i] gibt Position an.
-    arr[i][0] gibt an ob Einspuls (arr[i][0] = 1) Nullpuls (arr[i][0] = 0) Pause (arr[i][0] = 42)
-    arr[i][1] gibt die Länge des Pulses bzw. der Pause an.
+    State of grab_pulses at the border between two consecutive chunks of demodulated samples.
+    States are never changed by grab_pulses, so they can be stored as checkpoints.
     """
+    cdef public int cur_state  # -1 if no sample was processed yet
+    cdef public unsigned long long pulse_length
+    cdef public unsigned long long consecutive_ones, consecutive_zeros, consecutive_pause
+    cdef public int pending_type  # Last found pulse, it is extended if the next one has the same type
+    cdef public unsigned long long pending_length
+
+    def __init__(self, int cur_state=-1, unsigned long long pulse_length=0, unsigned long long consecutive_ones=0,
+                 unsigned long long consecutive_zeros=0, unsigned long long consecutive_pause=0,
+                 int pending_type=-1, unsigned long long pending_length=0):
+        self.cur_state = cur_state
+        self.pulse_length = pulse_length
+        self.consecutive_ones = consecutive_ones
+        self.consecutive_zeros = consecutive_zeros
+        self.consecutive_pause = consecutive_pause
+        self.pending_type = pending_type
+        self.pending_length = pending_length
+
+    def __reduce__(self):
+        return PulseState, (self.cur_state, self.pulse_length, self.consecutive_ones, self.consecutive_zeros,
+                            self.consecutive_pause, self.pending_type, self.pending_length)
+
+
+cdef class _PulseBuffer:
+    """
+    Growable buffer for found pulses, so memory scales with the number of pulses and not with the samples
+    """
+    cdef np.uint8_t[::1] types
+    cdef np.uint64_t[::1] lengths
+    cdef unsigned long long size
+
+    def __init__(self, unsigned long long capacity):
+        self.types = np.empty(capacity, dtype=np.uint8)
+        self.lengths = np.empty(capacity, dtype=np.uint64)
+        self.size = 0
+
+    cdef void grow(self) except *:
+        cdef np.uint8_t[::1] types = np.empty(2 * self.size, dtype=np.uint8)
+        cdef np.uint64_t[::1] lengths = np.empty(2 * self.size, dtype=np.uint64)
+        types[:self.size] = self.types
+        lengths[:self.size] = self.lengths
+        self.types, self.lengths = types, lengths
+
+    cdef void append(self, int pulse_type, unsigned long long length) nogil except *:
+        if self.size == self.types.shape[0]:
+            with gil:
+                self.grow()
+
+        self.types[self.size] = pulse_type
+        self.lengths[self.size] = length
+        self.size += 1
+
+    cdef tuple to_arrays(self):
+        return np.asarray(self.types)[:self.size].copy(), np.asarray(self.lengths)[:self.size].copy()
+
+
+cpdef tuple grab_pulses(float[::1] samples, float center, unsigned int tolerance, int modulation_type,
+                        unsigned int bit_length, PulseState state=None, bool finish=True):
+    """
+    Find the pulses in quadrature demodulated samples.
+    Consecutive chunks of a signal can be processed by passing the returned state on to the next call.
+    Only the call for the last chunk should finish, so the last pulse of the signal is appended.
+
+    :param samples: Samples after the quadrature demodulation
+    :param center: Samples above center are a one pulse, samples below a zero pulse
+    :param state: State after the previous chunk or None for the start of the signal
+    :param finish: Append the last pulse, because no more chunks follow
+    :return: pulse types (uint8 array, 1 = one pulse, 0 = zero pulse, 42 = pause),
+             pulse lengths in samples (uint64 array) and the state after this chunk
+    """
+    if state is None:
+        state = PulseState()
+
     cdef int is_ask = modulation_type == 0
-    cdef unsigned long long i, pulse_length = 0
-    cdef unsigned long long cur_index = 0, consecutive_ones = 0, consecutive_zeros = 0, consecutive_pause = 0
-    cdef float s, s_prev
-    cdef int cur_state, new_state
+    cdef unsigned long long i
+    cdef unsigned long long pulse_length = state.pulse_length
+    cdef unsigned long long consecutive_ones = state.consecutive_ones
+    cdef unsigned long long consecutive_zeros = state.consecutive_zeros
+    cdef unsigned long long consecutive_pause = state.consecutive_pause
+    cdef int pending_type = state.pending_type
+    cdef unsigned long long pending_length = state.pending_length
+    cdef float s
+    cdef int cur_state = state.cur_state, new_state
     cdef float NOISE = get_noise_for_mod_type(modulation_type)
     cdef unsigned long long num_samples = len(samples)
 
-    cdef unsigned long long[:, ::1] result = np.zeros((num_samples, 2), dtype=np.uint64, order="C")
-    if num_samples == 0:
-        return result
-
-    s_prev = samples[0]
-    if s_prev == NOISE:
-        cur_state = 42
-    elif s_prev > center:
-        cur_state = 1
-    else:
-        cur_state = 0
+    cdef _PulseBuffer pulses = _PulseBuffer(1024)
 
-    for i in range(num_samples):
-        pulse_length += 1
-        s = samples[i]
+    if cur_state == -1 and num_samples > 0:
+        s = samples[0]
         if s == NOISE:
-            consecutive_pause += 1
-            consecutive_ones = 0
-            consecutive_zeros = 0
-            if cur_state == 42:
-                continue
-
+            cur_state = 42
         elif s > center:
-            consecutive_ones += 1
-            consecutive_zeros = 0
-            consecutive_pause = 0
-            if cur_state == 1:
-                continue
-
+            cur_state = 1
         else:
-            consecutive_zeros += 1
-            consecutive_ones = 0
-            consecutive_pause = 0
-            if cur_state == 0:
+            cur_state = 0
+
+    with nogil:
+        for i in range(num_samples):
+            pulse_length += 1
+            s = samples[i]
+            if s == NOISE:
+                consecutive_pause += 1
+                consecutive_ones = 0
+                consecutive_zeros = 0
+                if cur_state == 42:
+                    continue
+
+            elif s > center:
+                consecutive_ones += 1
+                consecutive_zeros = 0
+                consecutive_pause = 0
+                if cur_state == 1:
+                    continue
+
+            else:
+                consecutive_zeros += 1
+                consecutive_ones = 0
+                consecutive_pause = 0
+                if cur_state == 0:
+                    continue
+
+            if consecutive_ones > tolerance:
+                new_state = 1
+            elif consecutive_zeros > tolerance:
+                new_state = 0
+            elif consecutive_pause > tolerance:
+                new_state = 42
+            else:
                 continue
 
-        if consecutive_ones > tolerance:
-            new_state = 1
-        elif consecutive_zeros > tolerance:
-            new_state = 0
-        elif consecutive_pause > tolerance:
-            new_state = 42
-        else:
-            continue
+            if is_ask and cur_state == 42 and (pulse_length - tolerance) < bit_length:
+                # Aggregate short pauses for ASK
+                cur_state = 0
 
-        if is_ask and cur_state == 42 and (pulse_length - tolerance) < bit_length:
-            # Aggregate short pauses for ASK
-            cur_state = 0
+            if pending_type == cur_state:
+                pending_length += pulse_length - tolerance
+            else:
+                if pending_type != -1:
+                    pulses.append(pending_type, pending_length)
+                pending_type, pending_length = cur_state, pulse_length - tolerance
 
-        if cur_index > 0 and result[cur_index - 1, 0] == cur_state:
-            result[cur_index - 1, 1] += pulse_length - tolerance
-        else:
-            result[cur_index, 0] = cur_state
-            result[cur_index, 1] = pulse_length - tolerance
-            cur_index += 1
-
-        pulse_length = tolerance
-        cur_state = new_state
-
-    # Append last one
-    cdef unsigned long long len_result = len(result)
-    if cur_index < len_result:
-        if cur_index > 0 and result[cur_index - 1, 0] == cur_state:
-            result[cur_index - 1, 1] += pulse_length - tolerance
-        else:
-            result[cur_index, 0] = cur_state
-            result[cur_index, 1] = pulse_length - tolerance
-            cur_index += 1
+            pulse_length = tolerance
+            cur_state = new_state
 
-    return result[:cur_index]
+        if finish and cur_state != -1:
+            # Append last one
+            if pending_type == cur_state:
+                pending_length += pulse_length - tolerance
+            else:
+                if pending_type != -1:
+                    pulses.append(pending_type, pending_length)
+                pending_type, pending_length = cur_state, pulse_length - tolerance
+
+            pulses.append(pending_type, pending_length)
+            pending_type, pending_length = -1, 0
+
+    types, lengths = pulses.to_arrays()
+    return types, lengths, PulseState(cur_state, pulse_length, consecutive_ones, consecutive_zeros,
+                                      consecutive_pause, pending_type, pending_length)
+
+cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples, float center,
+                                                 unsigned int tolerance, int modulation_type, unsigned int bit_length):
+    """
+    Holt sich die Pulslängen aus den quadraturdemodulierten Samples
+    @param samples: Samples nach der QAD
+    @param center: Alles über der Treshold ist ein Einserpuls, alles darunter 0er Puls
+    @return: Ein 2D Array arr.
+    arr[i] gibt Position an.
+    arr[i][0] gibt an ob Einspuls (arr[i][0] = 1) Nullpuls (arr[i][0] = 0) Pause (arr[i][0] = 42)
+    arr[i][1] gibt die Länge des Pulses bzw. der Pause an.
+    """
+    types, lengths, _ = grab_pulses(samples, center, tolerance, modulation_type, bit_length)
+    cdef unsigned long long[:, ::1] result = np.empty((len(types), 2), dtype=np.uint64, order="C")
+    np.asarray(result)[:, 0] = types
+    np.asarray(result)[:, 1] = lengths
+    return result
+
+cpdef long long find_noise_gap(float[::1] samples, unsigned long long start, unsigned long long min_length,
+                               int modulation_type):
+    """
+    Find the first run of at least min_length noise samples at or after start
+
+    :return: index of the first noise sample of the run or -1 if there is no such run
+    """
+    cdef float NOISE = get_noise_for_mod_type(modulation_type)
+    cdef unsigned long long i, run_length = 0
+    cdef unsigned long long num_samples = len(samples)
+
+    with nogil:
+        for i in range(start, num_samples):
+            if samples[i] == NOISE:
+                run_length += 1
+                if run_length >= min_length:
+                    return i + 1 - run_length
+            else:
+                run_length = 0
+
+    return -1
 
 cpdef unsigned long long estimate_bit_len(float[::1] qad_samples, float qad_center, int tolerance, int mod_type):
 
     start = find_signal_start(qad_samples, mod_type)
-    cdef unsigned long long[:, ::1] ppseq = grab_pulse_lens(qad_samples[start:], qad_center, tolerance, mod_type, 0)
+    types, lengths, _ = grab_pulses(qad_samples[start:], qad_center, tolerance, mod_type, 0)
+    cdef np.uint8_t[::1] pulse_types = types
     cdef unsigned long long i = 0
-    cdef unsigned long long l = len(ppseq)
+    cdef unsigned long long l = len(pulse_types)
     for i in range(0, l):
-        if ppseq[i, 0] == 1:
-            return ppseq[i, 1] # first pulse after pause
+        if pulse_types[i] == 1:
+            return lengths[i] # first pulse after pause
 
     return 100
 
@@ -314,70 +534,119 @@ cpdef int find_nearest_center(float sample, float[::1] centers, int num_centers)
     return result
 
 
-from libc.stdlib cimport malloc, free
+from libc.math cimport INFINITY
 
-cdef:
-    struct Cluster:
-        double sum
-        unsigned long long int nitems
+# Center estimation works on blocks of samples, so subsampling keeps the shape of pulses
+# and the result does not depend on the number of threads
+cdef unsigned long long CENTER_ESTIMATION_BLOCK_SIZE = 65536
 
-cpdef float estimate_qad_center(float[::1] samples, unsigned int num_centers):
+cdef inline int nearest_center_index(float sample, float[::1] centers, int num_centers, float first_center,
+                                     float center_distance) nogil:
+    """
+    Same result as find_nearest_center for equally spaced centers, but only compares the neighbours
+    of the center computed from the distance between centers
     """
-    Estimate the centers using Lloyds algorithm
-    Use more centers for ks clipping
+    cdef int i, result
+    cdef long long guess = 0
+    cdef float min_diff, cur_diff
+
+    if center_distance > 0:
+        guess = <long long>((sample - first_center) / center_distance + 0.5)
+        if guess < 0:
+            guess = 0
+        elif guess >= num_centers:
+            guess = num_centers - 1
+
+    result = guess
+    min_diff = 99999
+    for i in range(max(<long long>0, guess - 1), min(<long long>num_centers, guess + 2)):
+        cur_diff = (sample - centers[i]) * (sample - centers[i])
+        if cur_diff < min_diff:
+            min_diff = cur_diff
+            result = i
 
-    :param samples:
-    :param num_centers:
+    return result
+
+cpdef float estimate_qad_center(float[::1] samples, unsigned int num_centers, float min_value=-INFINITY,
+                                unsigned long long block_step=1):
+    """
+    Estimate the center between the two most frequent levels of the demodulated samples.
+    The samples are assigned to equally spaced centers between their minimum and maximum
+    in a histogram and the center is the mean of the two largest clusters.
+
+    :param samples: demodulated samples
+    :param num_centers: Number of histogram bins. Use more centers for ks clipping
+    :param min_value: Only samples greater than this are used, e.g. to ignore noise samples
+    :param block_step: Use every block_step-th block of samples only. The error of subsampling is small
+                       as long as the used blocks contain plenty of samples of both levels.
     :return:
     """
     cdef unsigned long long nsamples = len(samples)
-    if nsamples == 0:
+    if nsamples == 0 or num_centers == 0:
         return 0
 
-    cdef Cluster *clusters = <Cluster *>malloc(num_centers * sizeof(Cluster))
+    if block_step == 0:
+        block_step = 1
+
+    cdef unsigned long long block_size = CENTER_ESTIMATION_BLOCK_SIZE
+    cdef long long num_blocks = (nsamples + block_size - 1) // block_size
+    cdef long long num_used_blocks = (num_blocks + block_step - 1) // block_step
+
+    cdef float[::1] block_minimums = np.full(num_used_blocks, INFINITY, dtype=np.float32)
+    cdef float[::1] block_maximums = np.full(num_used_blocks, -INFINITY, dtype=np.float32)
+    cdef unsigned long long[:, ::1] block_counts = np.zeros((num_used_blocks, num_centers), dtype=np.uint64)
+    cdef double[:, ::1] block_sums = np.zeros((num_used_blocks, num_centers), dtype=np.float64)
+
+    cdef long long k
+    cdef unsigned long long i, block_start, block_end
+    cdef float sample
+    cdef int center_index
+
+    for k in prange(0, num_used_blocks, nogil=True, schedule='static'):
+        block_start = k * block_step * block_size
+        block_end = min(block_start + block_size, nsamples)
+        for i in range(block_start, block_end):
+            sample = samples[i]
+            if sample > min_value:
+                if sample < block_minimums[k]:
+                    block_minimums[k] = sample
+                if sample > block_maximums[k]:
+                    block_maximums[k] = sample
+
+    cdef float first_center = np.min(block_minimums)
+    cdef float last_center = np.max(block_maximums)
+    if first_center > last_center:
+        return 0  # All samples are noise
+
+    cdef float[::1] centers = np.array([first_center + i * (last_center - first_center) / max(num_centers - 1, 1)
+                                        for i in range(0, num_centers)], dtype=np.float32)
+    cdef float center_distance = centers[1] - centers[0] if num_centers > 1 else 0
+
+    for k in prange(0, num_used_blocks, nogil=True, schedule='static'):
+        block_start = k * block_step * block_size
+        block_end = min(block_start + block_size, nsamples)
+        for i in range(block_start, block_end):
+            sample = samples[i]
+            if sample > min_value:
+                center_index = nearest_center_index(sample, centers, num_centers, first_center, center_distance)
+                block_counts[k, center_index] += 1
+                block_sums[k, center_index] += sample
+
+    cluster_lens = np.asarray(block_counts).sum(axis=0)
+    cluster_sums = np.asarray(block_sums).sum(axis=0)
 
-    cdef unsigned long long i
-
-    for i in range(0, num_centers):
-        clusters[i].nitems = 0
-        clusters[i].sum = 0
-
-    cdef:
-        tuple tmp = util.minmax(samples)
-        float first_center = tmp[0]
-        float last_center = tmp[1]
-
-        float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)
-                                       for i in range(0, num_centers) ], dtype=np.float32)
-        float sample
-        int center_index = 0
-
-
-
-    for i in range(0, nsamples):
-        sample = samples[i]
-        center_index = find_nearest_center(sample, centers, num_centers)
-        clusters[center_index].sum += sample
-        clusters[center_index].nitems += 1
-
-    cdef unsigned long long[::1] cluster_lens = np.array([clusters[i].nitems for i in range(num_centers)], dtype=np.uint64)
     # can't to static typing here, because resulting type of argsort depends on x64/x86
     sorted_indexes = np.argsort(cluster_lens)
-    cdef float center1, center2
+    cdef float center1 = 0, center2 = 0
     cdef int index1 = sorted_indexes[len(sorted_indexes)-1]
-    cdef int index2 = sorted_indexes[len(sorted_indexes)-2]
+    cdef int index2 = sorted_indexes[len(sorted_indexes)-2] if num_centers > 1 else index1
 
-    if clusters[index1].nitems > 0:
-        center1 = clusters[index1].sum / clusters[index1].nitems # Cluster with most entries
-    else:
-        center1 = 0
+    if cluster_lens[index1] > 0:
+        center1 = cluster_sums[index1] / cluster_lens[index1] # Cluster with most entries
 
-    if clusters[index2].nitems > 0:
-        center2 = clusters[index2].sum / clusters[index2].nitems # Cluster with second most entries
-    else:
-        center2 = 0
+    if cluster_lens[index2] > 0 and num_centers > 1:
+        center2 = cluster_sums[index2] / cluster_lens[index2] # Cluster with second most entries
 
-    free(clusters)
     return (center1 + center2)/2
 
 cpdef np.ndarray[np.complex64_t, ndim=1] fir_filter(float complex[::1] input_samples, float complex[::1] filter_taps):
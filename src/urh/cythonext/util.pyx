@@ -81,3 +81,96 @@ cpdef np.ndarray[np.float32_t, ndim=2] arr2decibel(np.ndarray[np.complex64_t, nd
         for j in range(y):
             result[i, j] = factor * log10(arr[i, j].real * arr[i, j].real + arr[i, j].imag * arr[i, j].imag)
     return result
+
+ctypedef fused complex_t:
+    float complex
+    double complex
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef np.ndarray[np.float32_t, ndim=2] stft_to_decibel(complex_t[:, :] stft):
+    """
+    Convert a short-time Fourier transform (time, frequency) to dB with shifted and flipped
+    frequency axis, so frequencies descend from positive to negative along axis 1.
+    Same as np.fliplr(arr2decibel(np.fft.fftshift(stft, axes=(1,)).astype(np.complex64))) in one pass.
+    """
+    cdef long long num_frames = stft.shape[0]
+    cdef long long n = stft.shape[1]
+    cdef long long shift = n // 2
+    cdef long long i, j, k
+    cdef float re, im
+    cdef np.float32_t factor = 10.0
+
+    result = np.empty((num_frames, n), dtype=np.float32)
+    cdef float[:, ::1] result_view = result
+
+    for i in prange(num_frames, nogil=True, schedule='static'):
+        for j in range(n):
+            # Flipped column j is shifted column n-1-j which is unshifted bin n-1-j-n//2 (mod n)
+            k = (2 * n - 1 - j - shift) % n
+            re = <float>stft[i, k].real
+            im = <float>stft[i, k].imag
+            result_view[i, j] = factor * log10(re * re + im * im)
+
+    return result
+
+cdef inline long long colormap_index(float value, float data_min, float data_range, float scale,
+                                     long long num_colors) nogil:
+    cdef float x = scale * ((value - data_min) / data_range)
+    cdef long long index
+
+    if not (-9.2e18 < x < 9.2e18):
+        # NaN and overflows end up at the first color like with numpy's cast to int
+        return 0
+
+    index = <long long> x
+    if index < 0:
+        return 0
+    if index > num_colors - 1:
+        return num_colors - 1
+    return index
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef np.ndarray[np.uint8_t, ndim=3] decibel_to_bgra(float[:, :] spectrogram, np.uint8_t[:, ::1] colormap,
+                                                      double data_min, double data_max, bint transpose=False):
+    """
+    Normalize a spectrogram (time, frequency) to data_min and data_max and look up the BGRA colors
+    of an image with time on the x axis. If transpose is True, time is on the y axis and
+    frequencies ascend from left to right.
+
+    :return: contiguous BGRA buffer of shape (height, width, 4)
+    """
+    cdef long long num_frames = spectrogram.shape[0]
+    cdef long long n = spectrogram.shape[1]
+    cdef long long num_colors = colormap.shape[0]
+    cdef float fmin = <float>data_min
+    cdef float data_range = <float>(data_max - data_min)
+    cdef float scale = <float>(num_colors - 1)
+    cdef long long i, j, c, index, block, block_end
+    cdef long long block_size = 64  # frames per block, so reads and writes of a block stay in cache
+
+    if transpose:
+        result = np.empty((num_frames, n, 4), dtype=np.uint8)
+    else:
+        result = np.empty((n, num_frames, 4), dtype=np.uint8)
+    cdef np.uint8_t[:, :, ::1] result_view = result
+
+    if transpose:
+        for i in prange(num_frames, nogil=True, schedule='static'):
+            for j in range(n):
+                index = colormap_index(spectrogram[i, n - 1 - j], fmin, data_range, scale, num_colors)
+                for c in range(4):
+                    result_view[i, j, c] = colormap[index, c]
+    else:
+        for block in prange(0, num_frames, block_size, nogil=True, schedule='static'):
+            block_end = min(block + block_size, num_frames)
+            for j in range(n):
+                for i in range(block, block_end):
+                    index = colormap_index(spectrogram[i, j], fmin, data_range, scale, num_colors)
+                    for c in range(4):
+                        result_view[j, i, c] = colormap[index, c]
+
+    return result
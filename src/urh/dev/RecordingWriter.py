@@ -0,0 +1,120 @@
+import threading
+from queue import Queue
+
+import numpy as np
+
+from urh.util.IQConverter import IQConverter
+from urh.util.Logger import logger
+
+
+class RecordingWriter(object):
+    """
+    Stream received samples to a file instead of keeping them in RAM.
+
+    Samples are collected in large blocks, which a dedicated thread converts to the
+    native sample format of the device and writes sequentially to the file.
+    """
+
+    BLOCK_SIZE = 2 ** 20  # samples per write
+    MAX_PENDING_BLOCKS = 16  # writing blocks the receiving thread, if the disk can not keep up
+
+    FILE_EXTENSIONS = {np.dtype(np.complex64): ".complex",
+                       np.dtype(np.uint8): ".complex16u",
+                       np.dtype(np.int8): ".complex16s"}
+
+    def __init__(self, filename: str, dtype=np.complex64):
+        """
+
+        :param filename: file to record to, an existing file is overwritten
+        :param dtype: sample format of the file: np.complex64 or 8 bit I/Q values (np.uint8 or np.int8)
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in self.FILE_EXTENSIONS:
+            raise ValueError("Can't record samples as {}".format(self.dtype))
+
+        self.filename = filename
+        self.num_samples = 0
+        self.error = None  # type: OSError
+
+        self.__file = open(filename, "wb")
+        self.__block = np.empty(self.BLOCK_SIZE, dtype=np.complex64)
+        self.__block_fill = 0
+        self.__free_blocks = Queue()
+        self.__pending_blocks = Queue(maxsize=self.MAX_PENDING_BLOCKS)
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+        self.__thread = threading.Thread(target=self.__write_blocks, daemon=True)
+        self.__thread.start()
+
+    @classmethod
+    def file_extension(cls, dtype) -> str:
+        return cls.FILE_EXTENSIONS[np.dtype(dtype)]
+
+    @property
+    def is_closed(self) -> bool:
+        return self.__closed
+
+    def write(self, samples: np.ndarray):
+        """
+        Append complex64 samples to the recording. Samples written after close are ignored.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.num_samples += len(samples)
+            i = 0
+            while i < len(samples):
+                n = min(len(samples) - i, self.BLOCK_SIZE - self.__block_fill)
+                self.__block[self.__block_fill:self.__block_fill + n] = samples[i:i + n]
+                self.__block_fill += n
+                i += n
+
+                if self.__block_fill == self.BLOCK_SIZE:
+                    self.__flush_block()
+
+    def close(self):
+        """
+        Write the remaining samples and close the file
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.__closed = True
+            if self.__block_fill > 0:
+                self.__flush_block()
+            self.__pending_blocks.put(None)
+
+        self.__thread.join()
+        self.__file.close()
+        logger.info("Recorded {0} samples to {1}".format(self.num_samples, self.filename))
+
+    def __flush_block(self):
+        self.__pending_blocks.put((self.__block, self.__block_fill))
+        self.__block = self.__free_blocks.get() if not self.__free_blocks.empty() else np.empty_like(self.__block)
+        self.__block_fill = 0
+
+    def __write_blocks(self):
+        converted = None
+        while True:
+            item = self.__pending_blocks.get()
+            if item is None:
+                break
+
+            block, num_samples = item
+            try:
+                if self.error is None:
+                    if self.dtype == np.complex64:
+                        self.__file.write(block[:num_samples].data)
+                    else:
+                        if converted is None:
+                            converted = np.empty(2 * self.BLOCK_SIZE, dtype=self.dtype)
+                        self.__file.write(IQConverter.convert_from_complex64(block[:num_samples], self.dtype,
+                                                                             out=converted).data)
+            except OSError as e:
+                self.error = e
+                logger.error("Could not write recording {0}: {1}".format(self.filename, e))
+            finally:
+                self.__free_blocks.put(block)
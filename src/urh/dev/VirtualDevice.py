@@ -1,13 +1,14 @@
 import time
 from enum import Enum
 
-import numpy as np
 from PyQt5.QtCore import pyqtSignal, QObject
 
 from urh.dev import config
 from urh.dev.BackendHandler import Backends, BackendHandler
+from urh.dev.RecordingWriter import RecordingWriter
 from urh.dev.native.Device import Device
 from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import NetworkSDRInterfacePlugin
+from urh.signalprocessing.FFT import FFT
 from urh.util.Logger import logger
 
 
@@ -30,6 +31,9 @@ class VirtualDevice(QObject):
     continuous_send_msg = "Continuous send mode is not supported for GNU Radio backend. " \
                           "You can change the configured device backend in options."
 
+    record_to_file_msg = "Recording to file is only supported for native backend. " \
+                         "You can change the configured device backend in options."
+
     def __init__(self, backend_handler, name: str, mode: Mode, freq=None, sample_rate=None, bandwidth=None,
                  gain=None, if_gain=None, baseband_gain=None, samples_to_send=None,
                  device_ip=None, sending_repeats=1, parent=None, resume_on_full_receive_buffer=False, raw_mode=True,
@@ -221,6 +225,41 @@ class VirtualDevice(QObject):
         else:
             raise ValueError(self.continuous_send_msg)
 
+    @property
+    def supports_recording_to_file(self) -> bool:
+        return self.backend == Backends.native
+
+    @property
+    def record_filename(self) -> str:
+        """
+        File received samples are streamed to. If None, they are kept in the receive buffer.
+        """
+        if self.backend == Backends.native:
+            return self.__dev.record_filename
+        else:
+            return None
+
+    @record_filename.setter
+    def record_filename(self, value: str):
+        if self.backend == Backends.native:
+            self.__dev.record_filename = value
+        elif value is not None:
+            raise ValueError(self.record_to_file_msg)
+
+    @property
+    def recording_file_extension(self) -> str:
+        if self.backend == Backends.native:
+            return RecordingWriter.file_extension(self.__dev.NATIVE_DTYPE)
+        else:
+            raise ValueError(self.record_to_file_msg)
+
+    @property
+    def num_recorded_samples(self) -> int:
+        if self.backend == Backends.native and self.__dev.recording_writer is not None:
+            return self.__dev.recording_writer.num_samples
+        else:
+            return 0
+
     @property
     def is_in_spectrum_mode(self):
         if self.backend in (Backends.grc, Backends.native, Backends.network):
@@ -504,10 +543,7 @@ class VirtualDevice(QObject):
             if self.backend == Backends.grc:
                 return self.__dev.x, self.__dev.y
             elif self.backend == Backends.native or self.backend == Backends.network:
-                w = np.abs(np.fft.fft(self.__dev.receive_buffer))
-                freqs = np.fft.fftfreq(len(w), 1 / self.sample_rate)
-                idx = np.argsort(freqs)
-                return freqs[idx].astype(np.float32), w[idx].astype(np.float32)
+                return FFT.magnitude_spectrum(self.__dev.receive_buffer, self.sample_rate)
         else:
             raise ValueError("Spectrum x only available in spectrum mode")
 
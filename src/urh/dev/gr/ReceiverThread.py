@@ -10,16 +10,22 @@ from urh.util.SettingsProxy import SettingsProxy
 class ReceiverThread(AbstractBaseThread):
     index_changed = pyqtSignal(int, int)
 
+    # Frames that are already queued are received until this many bytes were written before index_changed is emitted
+    RECV_CHUNK_SIZE = 2 ** 18
+
     def __init__(self, freq, sample_rate, bandwidth, gain, if_gain, baseband_gain, ip='127.0.0.1',
                  parent=None, resume_on_full_receive_buffer=False):
         super().__init__(freq, sample_rate, bandwidth, gain, if_gain, baseband_gain, True, ip, parent)
 
         self.resume_on_full_receive_buffer = resume_on_full_receive_buffer  # for Live Sniffing
         self.data = None
+        self.recv_chunk_size = self.RECV_CHUNK_SIZE
+        self.__num_partial_bytes = 0  # bytes of an incomplete sample behind current_index
 
     def init_recv_buffer(self):
         n_samples = SettingsProxy.get_receive_buffer_size(self.resume_on_full_receive_buffer, self.is_in_spectrum_mode)
         self.data = np.zeros(n_samples, dtype=np.complex64)
+        self.__num_partial_bytes = 0
 
     def run(self):
         if self.data is None:
@@ -29,49 +35,77 @@ class ReceiverThread(AbstractBaseThread):
         logger.info("Initialize receive socket")
         self.init_recv_socket()
 
-        recv = self.socket.recv
-        rcvd = b""
-
         try:
             while not self.isInterruptionRequested():
-                try:
-                    rcvd += recv(32768)  # Receive Buffer = 32768 Byte
-                except (zmq.error.ContextTerminated, ConnectionResetError):
-                    self.stop("Stopped receiving, because connection was reset.")
+                if not self.receive_chunk():
                     return
-                except OSError as e:  # https://github.com/jopohl/urh/issues/131
-                    logger.warning("Error occurred", str(e))
-
-                if len(rcvd) < 8:
-                    self.stop("Stopped receiving: No data received anymore")
-                    return
-
-                if len(rcvd) % 8 != 0:
-                    continue
-
-                try:
-                    tmp = np.fromstring(rcvd, dtype=np.complex64)
-
-                    num_samples = len(tmp)
-                    if self.data is None:
-                        # seems to be sometimes None in rare cases
-                        self.init_recv_buffer()
-
-                    if self.current_index + num_samples >= len(self.data):
-                        if self.resume_on_full_receive_buffer:
-                            self.current_index = 0
-                            if num_samples >= len(self.data):
-                                self.stop("Receiving buffer too small.")
-                        else:
-                            self.stop("Receiving Buffer is full.")
-                            return
-                    self.data[self.current_index:self.current_index + num_samples] = tmp
-                    self.current_index += num_samples
-                    self.index_changed.emit(self.current_index - num_samples,
-                                            self.current_index)
-
-                    rcvd = b""
-                except ValueError:
-                    self.stop("Could not receive data. Is your Hardware ok?")
         except RuntimeError:
             logger.error("Receiver Thread crashed.")
+
+    def receive_chunk(self) -> bool:
+        """
+        Wait for the next frame and receive the frames queued behind it up to recv_chunk_size bytes.
+        Frames are not copied by zmq but written directly to the receive buffer.
+
+        :return: False if receiving was stopped
+        """
+        if self.data is None:
+            # seems to be sometimes None in rare cases
+            self.init_recv_buffer()
+
+        start_index = self.current_index
+        num_bytes = 0
+        flags = 0
+        while num_bytes < self.recv_chunk_size:
+            try:
+                frame = self.socket.recv(flags, copy=False)
+            except zmq.error.Again:
+                break
+            except (zmq.error.ContextTerminated, ConnectionResetError):
+                self.stop("Stopped receiving, because connection was reset.")
+                return False
+            except OSError as e:  # https://github.com/jopohl/urh/issues/131
+                logger.warning("Error occurred", str(e))
+                break
+
+            flags = zmq.NOBLOCK
+            num_bytes += len(frame)
+
+            old_index = self.current_index
+            if not self.__write_frame(frame.buffer):
+                return False
+
+            if self.current_index < old_index:
+                # Receive buffer wrapped around
+                self.index_changed.emit(start_index, old_index)
+                start_index = 0
+
+        if num_bytes == 0:
+            self.stop("Stopped receiving: No data received anymore")
+            return False
+
+        if self.current_index != start_index:
+            self.index_changed.emit(start_index, self.current_index)
+        return True
+
+    def __write_frame(self, frame: memoryview) -> bool:
+        data = self.data.view(np.uint8)
+        pos = 8 * self.current_index
+        num_bytes = self.__num_partial_bytes + len(frame)
+
+        if pos + num_bytes >= len(data):
+            if not self.resume_on_full_receive_buffer:
+                self.stop("Receiving Buffer is full.")
+                return False
+            if num_bytes >= len(data):
+                self.stop("Receiving buffer too small.")
+                return False
+
+            # Carry the incomplete sample to the start of the buffer
+            data[:self.__num_partial_bytes] = data[pos:pos + self.__num_partial_bytes]
+            pos = 0
+
+        data[pos + self.__num_partial_bytes:pos + num_bytes] = np.frombuffer(frame, dtype=np.uint8)
+        self.current_index = pos // 8 + num_bytes // 8
+        self.__num_partial_bytes = num_bytes % 8
+        return True
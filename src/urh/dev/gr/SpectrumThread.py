@@ -4,6 +4,7 @@ import numpy as np
 import zmq
 
 from urh.dev.gr.AbstractBaseThread import AbstractBaseThread
+from urh.signalprocessing.FFT import FFT
 from urh.util.Logger import logger
 
 
@@ -54,11 +55,7 @@ class SpectrumThread(AbstractBaseThread):
                     if self.current_index + len_tmp >= len(self.data):
                         self.data[self.current_index:] = tmp[:len(self.data) - self.current_index]
                         tmp = tmp[len(self.data) - self.current_index:]
-                        w = np.abs(np.fft.fft(self.data))
-                        freqs = np.fft.fftfreq(len(w), 1 / self.sample_rate)
-                        idx = np.argsort(freqs)
-                        self.x = freqs[idx].astype(np.float32)
-                        self.y = w[idx].astype(np.float32)
+                        self.x, self.y = FFT.magnitude_spectrum(self.data, self.sample_rate)
 
                         self.data = np.zeros(len(self.data), dtype=np.complex64)
                         self.data[0:len(tmp)] = tmp
@@ -9,17 +9,22 @@ from pickle import UnpicklingError
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from urh.dev.RecordingWriter import RecordingWriter
 from urh.dev.native.SendConfig import SendConfig
+from urh.dev.native.SharedReceiveBuffer import SharedReceiveBuffer, SharedReceiveBufferWriter
 from urh.util.Logger import logger
 from urh.util.SettingsProxy import SettingsProxy
 
 
 class Device(QObject):
     JOIN_TIMEOUT = 1.0
+    RECEIVE_POLL_INTERVAL = 0.1  # seconds the receive buffer reader waits for notifications before checking for stop
 
     SEND_BUFFER_SIZE = 0
     CONTINUOUS_SEND_BUFFER_SIZE = 0
 
+    NATIVE_DTYPE = np.complex64  # Sample format of the device, used when recording to file
+
     class Command(Enum):
         STOP = 0
         SET_FREQUENCY = 1
@@ -240,6 +245,11 @@ class Device(QObject):
         self.device_ip = "192.168.10.2"  # For USRP and RTLSDRTCP
 
         self.receive_buffer = None
+        self.shared_receive_buffer = None  # type: SharedReceiveBuffer
+
+        # If set, received samples are streamed to this file and receive_buffer only holds the most recent ones
+        self.record_filename = None
+        self.recording_writer = None  # type: RecordingWriter
 
         self.spectrum_x = None
         self.spectrum_y = None
@@ -298,9 +308,14 @@ class Device(QObject):
     def send_process_arguments(self):
         return self.child_ctrl_conn, self.send_config, self.device_parameters
 
+    @property
+    def is_recording_to_file(self) -> bool:
+        return self.record_filename is not None
+
     def init_recv_buffer(self):
         if self.receive_buffer is None:
-            num_samples = SettingsProxy.get_receive_buffer_size(self.resume_on_full_receive_buffer,
+            num_samples = SettingsProxy.get_receive_buffer_size(self.resume_on_full_receive_buffer or
+                                                                self.is_recording_to_file,
                                                                 self.is_in_spectrum_mode)
             self.receive_buffer = np.zeros(int(num_samples), dtype=np.complex64, order='C')
 
@@ -504,9 +519,21 @@ class Device(QObject):
 
     def start_rx_mode(self):
         self.init_recv_buffer()
-        self.parent_data_conn, self.child_data_conn = Pipe(duplex=False)
+        if self.shared_receive_buffer is None:
+            self.shared_receive_buffer = SharedReceiveBuffer()
+        self.shared_receive_buffer.clear()
+
+        # The device process writes samples to shared memory and only notifies through the data connection
+        self.parent_data_conn, child_data_conn = Pipe(duplex=False)
+        self.child_data_conn = SharedReceiveBufferWriter(self.shared_receive_buffer, child_data_conn,
+                                                         self.unpack_complex)
         self.parent_ctrl_conn, self.child_ctrl_conn = Pipe()
 
+        if self.is_recording_to_file:
+            self.recording_writer = RecordingWriter(self.record_filename, self.NATIVE_DTYPE)
+        else:
+            self.recording_writer = None
+
         self.is_receiving = True
         logger.info("{0}: Starting RX Mode".format(self.__class__.__name__))
         self.receive_process = Process(target=self.receive_process_function,
@@ -541,6 +568,16 @@ class Device(QObject):
         self.child_ctrl_conn.close()
         self.child_data_conn.close()
 
+        reader = getattr(self, "read_recv_buffer_thread", None)
+        if reader is not None and reader is not threading.current_thread():
+            # The shared receive buffer has a single consumer, so the reader must have stopped before we read from it.
+            # It notices is_receiving within a poll interval and finishes reading the samples it already took.
+            reader.join()
+
+        if self.recording_writer is not None and not self.recording_writer.is_closed:
+            self.read_shared_receive_buffer()  # Samples received after the last notification
+            self.recording_writer.close()
+
     def start_tx_mode(self, samples_to_send: np.ndarray = None, repeats=None, resume=False):
         self.is_transmitting = True
         self.parent_ctrl_conn, self.child_ctrl_conn = Pipe()
@@ -599,29 +636,20 @@ class Device(QObject):
         logger.debug("Exiting read device errors thread")
 
     def read_receiving_queue(self):
+        num_dropped = self.shared_receive_buffer.num_dropped
         while self.is_receiving:
             try:
-                byte_buffer = self.parent_data_conn.recv_bytes()
-
-                samples = self.unpack_complex(byte_buffer)
-                n_samples = len(samples)
-                if n_samples > 0:
-                    if self.current_recv_index + n_samples >= len(self.receive_buffer):
-                        if self.resume_on_full_receive_buffer:
-                            self.current_recv_index = 0
-                            if n_samples >= len(self.receive_buffer):
-                                n_samples = len(self.receive_buffer) - 1
-                        else:
-                            self.stop_rx_mode(
-                                "Receiving buffer is full {0}/{1}".format(self.current_recv_index + n_samples,
-                                                                          len(self.receive_buffer)))
-                            return
-
-                    self.receive_buffer[self.current_recv_index:self.current_recv_index + n_samples] = samples[:n_samples]
-                    old_index = self.current_recv_index
-                    self.current_recv_index += n_samples
-
-                    self.rcv_index_changed.emit(old_index, self.current_recv_index)
+                # Poll with timeout instead of blocking, so the thread ends in time when receiving is stopped
+                if not self.parent_data_conn.poll(self.RECEIVE_POLL_INTERVAL):
+                    continue
+                self.parent_data_conn.recv_bytes()  # Notification about new samples in shared receive buffer
+                if not self.read_shared_receive_buffer():
+                    return
+
+                if self.shared_receive_buffer.num_dropped > num_dropped:
+                    logger.warning("{0}: Dropped {1} samples, because they were not read in time".format(
+                        self.__class__.__name__, self.shared_receive_buffer.num_dropped - num_dropped))
+                    num_dropped = self.shared_receive_buffer.num_dropped
             except (BrokenPipeError, OSError):
                 pass
             except EOFError:
@@ -630,6 +658,36 @@ class Device(QObject):
 
         logger.debug("Exiting read_receive_queue thread.")
 
+    def read_shared_receive_buffer(self) -> bool:
+        """
+        Move the available samples from shared receive buffer to receive buffer and the recording, if any
+
+        :return: False if receiving was stopped because the receive buffer is full
+        """
+        while not self.shared_receive_buffer.is_empty:
+            n_samples = len(self.shared_receive_buffer)
+            if self.current_recv_index + n_samples >= len(self.receive_buffer):
+                if self.resume_on_full_receive_buffer or self.is_recording_to_file:
+                    self.current_recv_index = 0
+                    if n_samples >= len(self.receive_buffer):
+                        n_samples = len(self.receive_buffer) - 1
+                else:
+                    self.stop_rx_mode(
+                        "Receiving buffer is full {0}/{1}".format(self.current_recv_index + n_samples,
+                                                                  len(self.receive_buffer)))
+                    return False
+
+            old_index = self.current_recv_index
+            self.current_recv_index += self.shared_receive_buffer.pop_into(
+                self.receive_buffer[old_index:old_index + n_samples])
+
+            if self.recording_writer is not None:
+                self.recording_writer.write(self.receive_buffer[old_index:self.current_recv_index])
+
+            self.rcv_index_changed.emit(old_index, self.current_recv_index)
+
+        return True
+
     def init_send_parameters(self, samples_to_send: np.ndarray = None, repeats: int = None, resume=False):
         if samples_to_send is not None:
             self.samples_to_send = samples_to_send
@@ -6,12 +6,14 @@ import time
 
 from urh.dev.native.Device import Device
 from urh.dev.native.lib import hackrf
+from urh.util.IQConverter import IQConverter
 from urh.util.Logger import logger
 
 
 class HackRF(Device):
     DEVICE_LIB = hackrf
     ASYNCHRONOUS = True
+    NATIVE_DTYPE = np.int8
     DEVICE_METHODS = Device.DEVICE_METHODS.copy()
     DEVICE_METHODS.update({
         Device.Command.SET_FREQUENCY.name: "set_freq",
@@ -76,11 +78,7 @@ class HackRF(Device):
 
     @staticmethod
     def unpack_complex(buffer):
-        unpacked = np.frombuffer(buffer, dtype=[('r', np.int8), ('i', np.int8)])
-        result = np.empty(len(unpacked), dtype=np.complex64)
-        result.real = (unpacked['r'] + 0.5) / 127.5
-        result.imag = (unpacked['i'] + 0.5) / 127.5
-        return result
+        return IQConverter.convert_to_complex64(np.frombuffer(buffer, dtype=np.int8))
 
     @staticmethod
     def pack_complex(complex_samples: np.ndarray):
@@ -9,12 +9,14 @@ try:
     from urh.dev.native.lib import rtlsdr
 except ImportError:
     import urh.dev.native.lib.rtlsdr_fallback as rtlsdr
+from urh.util.IQConverter import IQConverter
 from urh.util.Logger import logger
 
 
 class RTLSDR(Device):
     DEVICE_LIB = rtlsdr
     ASYNCHRONOUS = False
+    NATIVE_DTYPE = np.uint8
     DEVICE_METHODS = Device.DEVICE_METHODS.copy()
     DEVICE_METHODS.update({
         Device.Command.SET_RF_GAIN.name: "set_tuner_gain",
@@ -87,11 +89,7 @@ class RTLSDR(Device):
 
         :return:
         """
-        unpacked = np.frombuffer(buffer, dtype=[('r', np.uint8), ('i', np.uint8)])
-        result = np.empty(len(unpacked), dtype=np.complex64)
-        result.real = (unpacked['r'] / 127.5) - 1.0
-        result.imag = (unpacked['i'] / 127.5) - 1.0
-        return result
+        return IQConverter.convert_to_complex64(np.frombuffer(buffer, dtype=np.uint8))
 
     @staticmethod
     def pack_complex(complex_samples: np.ndarray):
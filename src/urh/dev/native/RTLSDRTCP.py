@@ -1,6 +1,7 @@
 import numpy as np
 
 from urh.dev.native.Device import Device
+from urh.util.IQConverter import IQConverter
 from urh.util.Logger import logger
 
 import socket
@@ -10,6 +11,7 @@ import select
 class RTLSDRTCP(Device):
     MAXDATASIZE = 65536
     ENDIAN = "big"
+    NATIVE_DTYPE = np.uint8
     RTL_TCP_CONSTS = ["NULL", "centerFreq", "sampleRate", "tunerGainMode", "tunerGain", "freqCorrection", "tunerIFGain",
                       "testMode", "agcMode", "directSampling", "offsetTuning", "rtlXtalFreq", "tunerXtalFreq",
                       "gainByIndex", "bandwidth", "biasTee"]
@@ -193,8 +195,4 @@ class RTLSDRTCP(Device):
 
         :return:
         """
-        unpacked = np.frombuffer(buffer, dtype=[('r', np.uint8), ('i', np.uint8)])
-        result = np.empty(len(unpacked), dtype=np.complex64)
-        result.real = (unpacked['r'] / 127.5) - 1.0
-        result.imag = (unpacked['i'] / 127.5) - 1.0
-        return result
+        return IQConverter.convert_to_complex64(np.frombuffer(buffer, dtype=np.uint8))
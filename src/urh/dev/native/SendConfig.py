@@ -17,6 +17,7 @@ class SendConfig(object):
         self.continuous = continuous
         self.pack_complex_method = pack_complex_method
         self.continuous_send_ring_buffer = continuous_send_ring_buffer
+        self.__continuous_send_buffer = None  # type: np.ndarray
 
     def get_data_to_send(self, buffer_length: int):
         try:
@@ -24,7 +25,10 @@ class SendConfig(object):
                 return np.array([], dtype=np.complex64)
 
             if self.continuous:
-                result = self.pack_complex_method(self.continuous_send_ring_buffer.pop(buffer_length // 2))
+                if self.__continuous_send_buffer is None or len(self.__continuous_send_buffer) != buffer_length // 2:
+                    self.__continuous_send_buffer = np.empty(buffer_length // 2, dtype=np.complex64)
+                n = self.continuous_send_ring_buffer.pop_into(self.__continuous_send_buffer)
+                result = self.pack_complex_method(self.__continuous_send_buffer[:n])
             else:
                 result = self.send_buffer[
                          self.current_sent_index.value:self.current_sent_index.value + buffer_length]
@@ -0,0 +1,42 @@
+from multiprocessing.connection import Connection
+
+from urh.util.RingBuffer import RingBuffer
+
+
+class SharedReceiveBuffer(RingBuffer):
+    """
+    Ring buffer in shared memory through which a device process passes received samples to the GUI process.
+
+    The device process pushes the converted samples and only notifies the GUI process through the data connection,
+    so no sample data is sent through the pipe. Samples that do not fit, because the GUI process did not pop
+    them in time, are dropped and counted in num_dropped.
+    """
+
+    DEFAULT_SIZE = 2 ** 22  # samples
+
+    def __init__(self, size=DEFAULT_SIZE):
+        super().__init__(size)
+
+
+class SharedReceiveBufferWriter(object):
+    """
+    Stands in for the data connection of a device process. Received raw bytes are converted
+    and pushed to the shared buffer and only a short notification is sent through the connection.
+    """
+
+    def __init__(self, buffer: SharedReceiveBuffer, connection: Connection, unpack_function):
+        """
+
+        :param unpack_function: function converting raw bytes of the device to complex64 samples
+        """
+        self.buffer = buffer
+        self.connection = connection
+        self.unpack_function = unpack_function
+
+    def send_bytes(self, raw_data):
+        samples = self.unpack_function(raw_data)
+        if len(samples) > 0 and self.buffer.push_or_drop(samples) > 0:
+            self.connection.send_bytes(b"\x01")
+
+    def close(self):
+        self.connection.close()
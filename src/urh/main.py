@@ -98,6 +98,9 @@ def main():
 
     from urh.controller.MainController import MainController
     from urh import constants
+    from urh.util.SignalCache import SignalCache
+
+    SignalCache.ENABLED = constants.SETTINGS.value("use_signal_cache", True, bool)
 
     if constants.SETTINGS.value("theme_index", 0, int) > 0:
         os.environ['QT_QPA_PLATFORMTHEME'] = 'fusion'
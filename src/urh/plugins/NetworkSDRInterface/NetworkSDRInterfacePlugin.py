@@ -22,35 +22,52 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
     sending_stop_requested = pyqtSignal()
     current_send_message_changed = pyqtSignal(int)
 
+    RECV_SIZE = 65536 * 8  # bytes
+
     class MyTCPHandler(socketserver.BaseRequestHandler):
         def handle(self):
-            received = self.request.recv(65536 * 8)
-            self.data = received
+            if hasattr(self.server, "received_bits"):
+                self.handle_bits()
+            else:
+                self.handle_samples()
 
+        def handle_bits(self):
+            pending = b""
+            received = self.request.recv(NetworkSDRInterfacePlugin.RECV_SIZE)
             while received:
-                received = self.request.recv(65536 * 8)
-                self.data += received
-
-            if len(self.data) == 0:
-                return
+                # Messages are separated by newlines, the last one may be incomplete
+                *messages, pending = (pending + received).split(b"\n")
+                NetworkSDRInterfacePlugin.add_received_bits(self.server, messages)
+                received = self.request.recv(NetworkSDRInterfacePlugin.RECV_SIZE)
+
+            NetworkSDRInterfacePlugin.add_received_bits(self.server, [pending])
+
+        def handle_samples(self):
+            # Bytes of an incomplete sample are only carried over within a connection
+            self.server.num_partial_bytes = 0
+            while True:
+                view = NetworkSDRInterfacePlugin.get_receive_view(self.server, NetworkSDRInterfacePlugin.RECV_SIZE)
+                num_bytes = self.request.recv_into(view)
+                if num_bytes == 0:
+                    break
+                NetworkSDRInterfacePlugin.advance_receive_index(self.server, num_bytes)
 
+    class MyUDPHandler(socketserver.BaseRequestHandler):
+        def handle(self):
+            datagram = self.request[0]
             if hasattr(self.server, "received_bits"):
-                for data in filter(None, self.data.split(b"\n")):
-                    self.server.received_bits.append(NetworkSDRInterfacePlugin.bytearray_to_bit_str(data))
+                NetworkSDRInterfacePlugin.add_received_bits(self.server, datagram.split(b"\n"))
             else:
-                while len(self.data) % 8 != 0:
-                    self.data += self.request.recv(len(self.data) % 8)
-
-                received = np.frombuffer(self.data, dtype=np.complex64)
-
-                if len(received) + self.server.current_receive_index >= len(self.server.receive_buffer):
-                    self.server.previous_receive_index = 0
-                    self.server.current_receive_index = 0
-
-                self.server.receive_buffer[
-                self.server.current_receive_index:self.server.current_receive_index + len(received)] = received
-                self.server.previous_receive_index = self.server.current_receive_index
-                self.server.current_receive_index += len(received)
+                # Datagrams may get lost or reordered, so an incomplete sample at the end is dropped
+                # instead of being completed by the next datagram
+                received = np.frombuffer(datagram, dtype=np.uint8)
+                received = received[:len(received) - len(received) % 8]
+                self.server.num_partial_bytes = 0
+                while len(received) > 0:
+                    view = NetworkSDRInterfacePlugin.get_receive_view(self.server, len(received))
+                    view[:] = received[:len(view)]
+                    NetworkSDRInterfacePlugin.advance_receive_index(self.server, len(view))
+                    received = received[len(view):]
 
     def __init__(self, raw_mode=False, resume_on_full_receive_buffer=False, spectrum=False, sending=False):
         """
@@ -65,6 +82,7 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
 
         self.client_port = self.qsettings.value("client_port", defaultValue=2222, type=int)
         self.server_port = self.qsettings.value("server_port", defaultValue=4444, type=int)
+        self.use_udp = self.qsettings.value("use_udp", defaultValue=False, type=bool)  # only for receiving
 
         self.receive_check_timer = QTimer()
         self.receive_check_timer.setInterval(250)
@@ -150,21 +168,32 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
         self.settings_frame.lineEditClientIP.setText(self.client_ip)
         self.settings_frame.spinBoxClientPort.setValue(self.client_port)
         self.settings_frame.spinBoxServerPort.setValue(self.server_port)
+        self.settings_frame.checkBoxUDP.setChecked(self.use_udp)
 
         self.settings_frame.lineEditClientIP.editingFinished.connect(self.on_linedit_client_ip_editing_finished)
         self.settings_frame.lineEditServerIP.editingFinished.connect(self.on_linedit_server_ip_editing_finished)
         self.settings_frame.spinBoxClientPort.editingFinished.connect(self.on_spinbox_client_port_editing_finished)
         self.settings_frame.spinBoxServerPort.editingFinished.connect(self.on_spinbox_server_port_editing_finished)
+        self.settings_frame.checkBoxUDP.toggled.connect(self.on_checkbox_udp_toggled)
 
         self.settings_frame.lOpenProtoSniffer.linkActivated.connect(self.on_lopenprotosniffer_link_activated)
 
     def start_tcp_server_for_receiving(self):
-        self.server = socketserver.TCPServer((self.server_ip, self.server_port), self.MyTCPHandler)
-        self.server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        """
+        Start the server for receiving. Data is received as UDP datagrams instead of a TCP stream, if use_udp is set.
+        """
+        if self.use_udp:
+            self.server = socketserver.UDPServer((self.server_ip, self.server_port), self.MyUDPHandler)
+            self.server.max_packet_size = 65536
+        else:
+            self.server = socketserver.TCPServer((self.server_ip, self.server_port), self.MyTCPHandler)
+            self.server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         if self.raw_mode:
             self.server.receive_buffer = self.receive_buffer
             self.server.current_receive_index = 0
             self.server.previous_receive_index = 0
+            self.server.num_partial_bytes = 0
         else:
             self.server.received_bits = self.received_bits
 
@@ -223,6 +252,7 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
     def send_raw_data_continuously(self, ring_buffer: RingBuffer, num_samples_to_send: int, num_repeats: int):
         rng = iter(int, 1) if num_repeats <= 0 else range(0, num_repeats)  # <= 0 = forever
         samples_per_iteration = 65536 // 2
+        buffer = np.empty(samples_per_iteration, dtype=np.complex64)
         sock = self.prepare_send_connection()
 
         try:
@@ -243,10 +273,10 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
                     else:
                         n = max(0, min(samples_per_iteration, num_samples_to_send - self.current_sent_sample))
 
-                    data = ring_buffer.pop(n, ensure_even_length=True)
-                    if len(data) > 0:
-                        self.send_data(data, sock)
-                        self.current_sent_sample += len(data)
+                    n = ring_buffer.pop_into(buffer[:n], ensure_even_length=True)
+                    if n > 0:
+                        self.send_data(buffer[:n], sock)
+                        self.current_sent_sample += n
 
                     time.sleep(0.0000001)
 
@@ -328,6 +358,34 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
 
         self.sending_stop_requested.emit()
 
+    @staticmethod
+    def get_receive_view(server, max_bytes: int) -> np.ndarray:
+        """
+        Get the bytes of the receive buffer of server where up to max_bytes of received samples are written to.
+        The receive buffer wraps around, when it is full, so the view may be shorter than max_bytes.
+        """
+        data = server.receive_buffer.view(np.uint8)
+        if 8 * server.current_receive_index >= len(data):
+            server.previous_receive_index = 0
+            server.current_receive_index = 0
+
+        start = 8 * server.current_receive_index + server.num_partial_bytes
+        return data[start:start + max_bytes]
+
+    @staticmethod
+    def advance_receive_index(server, num_bytes: int):
+        """
+        Account num_bytes written to the view of get_receive_view. Bytes of an incomplete sample are kept for later.
+        """
+        num_bytes += server.num_partial_bytes
+        server.current_receive_index += num_bytes // 8
+        server.num_partial_bytes = num_bytes % 8
+
+    @staticmethod
+    def add_received_bits(server, messages):
+        for data in filter(None, messages):
+            server.received_bits.append(NetworkSDRInterfacePlugin.bytearray_to_bit_str(data))
+
     @staticmethod
     def bytearray_to_bit_str(arr: bytearray) -> str:
         return "".join("{:08b}".format(a) for a in arr)
@@ -356,13 +414,20 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
         self.server_port = self.settings_frame.spinBoxServerPort.value()
         self.qsettings.setValue('server_port', str(self.server_port))
 
+    def on_checkbox_udp_toggled(self, checked: bool):
+        self.use_udp = checked
+        self.qsettings.setValue('use_udp', self.use_udp)
+
     def __emit_rcv_index_changed(self):
         # for updating received bits in protocol sniffer
         if hasattr(self, "received_bits") and self.received_bits:
             # int arguments are just for compatibility with native and grc backend
             self.rcv_index_changed.emit(0, 0)
         elif self.raw_mode and self.server.previous_receive_index != self.server.current_receive_index:
-            self.rcv_index_changed.emit(self.server.previous_receive_index, self.server.current_receive_index)
+            # Emit all samples received since the last update at once
+            old_index, new_index = self.server.previous_receive_index, self.server.current_receive_index
+            self.server.previous_receive_index = new_index
+            self.rcv_index_changed.emit(old_index if old_index < new_index else 0, new_index)
 
     @pyqtSlot(str)
     def on_lopenprotosniffer_link_activated(self, link: str):
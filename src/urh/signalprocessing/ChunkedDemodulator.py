@@ -0,0 +1,124 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from urh.cythonext.signalFunctions import afp_demod_chunk, DemodulationState
+
+
+class ChunkedDemodulator(object):
+    """
+    Demodulate a signal block by block on demand and keep the most recently used blocks.
+    The demodulated blocks are identical to the corresponding parts of afp_demod on the whole signal.
+
+    For PSK and QAM the Costas loop state at a block border depends on all samples before,
+    so the states at block borders are kept as checkpoints even if a block itself is evicted.
+    """
+
+    DEFAULT_CHUNK_SIZE = 2 ** 18  # samples
+    DEFAULT_MAX_CHUNKS = 32
+
+    def __init__(self, samples: np.ndarray, noise_threshold: float, modulation_type: int,
+                 chunk_size=DEFAULT_CHUNK_SIZE, max_chunks=DEFAULT_MAX_CHUNKS, costa_reset_noise_samples=0):
+        """
+
+        :param samples: complex64 samples of the whole signal
+        :param max_chunks: maximum number of demodulated chunks kept in memory
+        :param costa_reset_noise_samples: see Signal.costa_reset_noise_samples
+        """
+        self.samples = samples
+        self.noise_threshold = noise_threshold
+        self.modulation_type = modulation_type
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.costa_reset_noise_samples = costa_reset_noise_samples
+
+        self.__chunks = OrderedDict()  # chunk index -> demodulated chunk, least recently used first
+        self.__states = {0: DemodulationState()}  # chunk index -> state at start of chunk
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.samples)
+
+    @property
+    def num_chunks(self) -> int:
+        return (self.num_samples + self.chunk_size - 1) // self.chunk_size
+
+    @property
+    def has_costa_loop(self) -> bool:
+        return self.modulation_type in (2, 3)  # PSK or QAM
+
+    def get_chunk(self, index: int) -> np.ndarray:
+        """
+        Return the demodulated chunk with given index.
+        The returned array is shared with the cache, so it must not be modified.
+        """
+        if not 0 <= index < self.num_chunks:
+            raise IndexError("Chunk index {} out of range".format(index))
+
+        try:
+            self.__chunks.move_to_end(index)
+            return self.__chunks[index]
+        except KeyError:
+            pass
+
+        state_index = index
+        if self.has_costa_loop:
+            # Demodulate forward from the last checkpoint before index
+            state_index = max(i for i in self.__states if i <= index)
+
+        state = self.__get_state(state_index)
+        for i in range(state_index, index + 1):
+            chunk = self.samples[i * self.chunk_size:(i + 1) * self.chunk_size]
+            result, state = afp_demod_chunk(np.ascontiguousarray(chunk), self.noise_threshold,
+                                            self.modulation_type, state, self.costa_reset_noise_samples)
+            self.__states[i + 1] = state
+            self.__store_chunk(i, result)
+
+        return result
+
+    def get_section(self, start: int, end: int) -> np.ndarray:
+        """
+        Return the demodulated samples in range start to end like afp_demod(samples)[start:end]
+        """
+        start, end = max(0, start), min(end, self.num_samples)
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        if self.num_samples <= 2:
+            # afp_demod does not demodulate such short signals
+            return np.zeros(end - start, dtype=np.float32)
+
+        first, last = start // self.chunk_size, (end - 1) // self.chunk_size
+        offset = first * self.chunk_size
+        if first == last:
+            return self.get_chunk(first)[start - offset:end - offset]
+
+        result = np.concatenate([self.get_chunk(i) for i in range(first, last + 1)])
+        return result[start - offset:end - offset]
+
+    def iter_chunks(self, start_chunk=0):
+        """
+        Iterate over the demodulated chunks for streaming consumers
+
+        :rtype: collections.Iterable[np.ndarray]
+        """
+        for i in range(start_chunk, self.num_chunks):
+            yield self.get_chunk(i)
+
+    def clear(self):
+        self.__chunks.clear()
+        self.__states = {0: DemodulationState()}
+
+    def __get_state(self, index: int) -> DemodulationState:
+        try:
+            return self.__states[index]
+        except KeyError:
+            # Only the previous sample is needed for ASK and FSK
+            return DemodulationState(prev_sample=self.samples[index * self.chunk_size - 1],
+                                     num_samples=index * self.chunk_size)
+
+    def __store_chunk(self, index: int, chunk: np.ndarray):
+        self.__chunks[index] = chunk
+        self.__chunks.move_to_end(index)
+        while len(self.__chunks) > self.max_chunks:
+            self.__chunks.popitem(last=False)
@@ -50,21 +50,21 @@ class ContinuousModulator(object):
 
     def stop(self, clear_buffer=True):
         self.abort.value = 1
-        if clear_buffer:
-            self.ring_buffer.clear()
-        if not self.process.is_alive():
-            return
+        if self.process.is_alive():
+            try:
+                self.process.join(0.1)
+            except RuntimeError as e:
+                logger.debug(str(e))
 
-        try:
-            self.process.join(0.1)
-        except RuntimeError as e:
-            logger.debug(str(e))
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
 
-        if self.process.is_alive():
-            self.process.terminate()
-            self.process.join()
+            logger.debug("Stopped continuous modulation")
 
-        logger.debug("Stopped continuous modulation")
+        # Clear after the modulation process stopped pushing, a sending device may still pop
+        if clear_buffer:
+            self.ring_buffer.clear()
 
     def modulate_continuously(self, num_repeats):
         rng = iter(int, 1) if num_repeats <= 0 else range(0, num_repeats)  # <= 0 = forever
@@ -0,0 +1,110 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from urh.util.Logger import logger
+
+
+class FFT(object):
+    """
+    FFT functions used for signal processing. pyfftw or scipy.fft is used, if installed,
+    because they compute single precision input in single precision and use multiple threads.
+    Otherwise numpy.fft is used, which always computes in double precision.
+    Callers whose results must not depend on the backend pass double precision input.
+    """
+
+    BACKENDS = ("pyfftw", "scipy", "numpy")  # in order of preference
+    NUM_THREADS = os.cpu_count() or 1
+
+    backend = None
+    __module = None
+    __kwargs = None
+
+    @classmethod
+    def set_backend(cls, name: str = None):
+        """
+        Use the FFT backend with given name or the first available one, if name is None
+
+        :param name: "pyfftw", "scipy" or "numpy"
+        """
+        if name is None:
+            for backend in cls.BACKENDS:
+                try:
+                    cls.set_backend(backend)
+                    return
+                except ImportError:
+                    continue
+
+        if name == "pyfftw":
+            import pyfftw
+            import pyfftw.interfaces.numpy_fft as module
+            pyfftw.interfaces.cache.enable()  # Keep plans of recently used sizes
+            kwargs = {"threads": cls.NUM_THREADS}
+        elif name == "scipy":
+            import scipy.fft as module
+            kwargs = {"workers": cls.NUM_THREADS}
+        elif name == "numpy":
+            module, kwargs = np.fft, dict()
+        else:
+            raise ValueError("Unknown FFT backend " + str(name))
+
+        cls.backend, cls.__module, cls.__kwargs = name, module, kwargs
+        logger.debug("Using {} for FFT".format(name))
+
+    @classmethod
+    def fft(cls, x: np.ndarray, n: int = None, axis=-1) -> np.ndarray:
+        return cls.__module.fft(x, n=n, axis=axis, **cls.__kwargs)
+
+    @classmethod
+    def ifft(cls, x: np.ndarray, n: int = None, axis=-1) -> np.ndarray:
+        return cls.__module.ifft(x, n=n, axis=axis, **cls.__kwargs)
+
+    @classmethod
+    def rfft(cls, x: np.ndarray, n: int = None, axis=-1) -> np.ndarray:
+        return cls.__module.rfft(x, n=n, axis=axis, **cls.__kwargs)
+
+    @classmethod
+    def irfft(cls, x: np.ndarray, n: int = None, axis=-1) -> np.ndarray:
+        return cls.__module.irfft(x, n=n, axis=axis, **cls.__kwargs)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def fftfreq(n: int, d: float = 1.0) -> np.ndarray:
+        """
+        Cached numpy.fft.fftfreq. The returned array is read only.
+        """
+        result = np.fft.fftfreq(n, d)
+        result.flags.writeable = False
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_window(window_function, size: int) -> np.ndarray:
+        """
+        Return window_function(size) as float32, so windowed complex64 samples stay single precision.
+        The returned array is cached and read only.
+        """
+        result = np.asarray(window_function(size), dtype=np.float32)
+        result.flags.writeable = False
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def __shifted_frequencies(n: int, sample_rate: float) -> np.ndarray:
+        result = np.fft.fftshift(np.fft.fftfreq(n, 1 / sample_rate)).astype(np.float32)
+        result.flags.writeable = False
+        return result
+
+    @classmethod
+    def magnitude_spectrum(cls, samples: np.ndarray, sample_rate: float):
+        """
+        Return frequencies and magnitudes of the spectrum of samples sorted by frequency
+
+        :return: frequencies (float32, read only) and magnitudes (float32)
+        """
+        magnitudes = np.fft.fftshift(np.abs(cls.fft(samples))).astype(np.float32)
+        return cls.__shifted_frequencies(len(samples), sample_rate), magnitudes
+
+
+FFT.set_backend()
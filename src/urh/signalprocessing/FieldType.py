@@ -2,7 +2,7 @@ import xml.etree.cElementTree as ET
 from enum import Enum
 from xml.dom import minidom
 
-from urh import constants
+from urh.util.Settings import Settings
 
 
 class FieldType(object):
@@ -56,7 +56,7 @@ class FieldType(object):
         :rtype: list of FieldType
         """
 
-        e = ET.parse(constants.FIELD_TYPE_SETTINGS).getroot()
+        e = ET.parse(Settings.field_type_settings()).getroot()
 
         result = []
 
@@ -104,7 +104,7 @@ class FieldType(object):
             root.append(field_type.to_xml())
 
         xmlstr = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-        with open(constants.FIELD_TYPE_SETTINGS, "w") as f:
+        with open(Settings.field_type_settings(), "w") as f:
             for line in xmlstr.split("\n"):
                 if line.strip():
                     f.write(line + "\n")
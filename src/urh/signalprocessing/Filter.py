@@ -3,10 +3,11 @@ from enum import Enum
 
 import numpy as np
 
-from urh import constants
 from urh.cythonext import signalFunctions
+from urh.signalprocessing.FFT import FFT
 from urh.util import util
 from urh.util.Logger import logger
+from urh.util.Settings import Settings
 
 
 class FilterType(Enum):
@@ -35,13 +36,13 @@ class Filter(object):
 
     @staticmethod
     def read_configured_filter_bw() -> float:
-        bw_type = constants.SETTINGS.value("bandpass_filter_bw_type", "Medium", str)
+        bw_type = Settings.value("bandpass_filter_bw_type", "Medium", str)
 
         if bw_type in Filter.BANDWIDTHS:
             return Filter.BANDWIDTHS[bw_type]
 
         if bw_type.lower() == "custom":
-            return constants.SETTINGS.value("bandpass_filter_custom_bw", 0.1, float)
+            return Settings.value("bandpass_filter_custom_bw", 0.1, float)
 
         return 0.08
 
@@ -58,10 +59,13 @@ class Filter(object):
     def fft_convolve_1d(x: np.ndarray, h: np.ndarray):
         n = len(x) + len(h) - 1
         n_opt = 1 << (n - 1).bit_length()  # Get next power of 2
+
+        # pyfftw and scipy keep single precision input in single precision, but filtered signals shall not change
+        x = np.asarray(x, dtype=np.result_type(x, np.float64))
         if np.issubdtype(x.dtype, np.complexfloating) or np.issubdtype(h.dtype, np.complexfloating):
-            fft, ifft = np.fft.fft, np.fft.ifft  # use complex fft
+            fft, ifft = FFT.fft, FFT.ifft  # use complex fft
         else:
-            fft, ifft = np.fft.rfft, np.fft.irfft  # use real fft
+            fft, ifft = FFT.rfft, FFT.irfft  # use real fft
 
         result = ifft(fft(x, n_opt) * fft(h, n_opt), n_opt)[0:n]
         too_much = (len(result) - len(x)) // 2  # Center result
@@ -2,7 +2,7 @@ import random
 import uuid
 import xml.etree.ElementTree as ET
 
-from urh import constants
+from urh import core_constants
 from urh.signalprocessing.ChecksumLabel import ChecksumLabel
 from urh.signalprocessing.FieldType import FieldType
 from urh.signalprocessing.ProtocoLabel import ProtocolLabel
@@ -99,13 +99,13 @@ class MessageType(list):
 
         name = "" if not name else name
         used_colors = [p.color_index for p in self]
-        avail_colors = [i for i, _ in enumerate(constants.LABEL_COLORS) if i not in used_colors]
+        avail_colors = [i for i, _ in enumerate(core_constants.LABEL_COLORS_RGBA) if i not in used_colors]
 
         if color_ind is None:
             if len(avail_colors) > 0:
                 color_ind = avail_colors[0]
             else:
-                color_ind = random.randint(0, len(constants.LABEL_COLORS) - 1)
+                color_ind = random.randint(0, len(core_constants.LABEL_COLORS_RGBA) - 1)
 
         proto_label = self.__create_label(name=name, start=start, end=end, color_index=color_ind,
                                           auto_created=auto_created, field_type=type)
@@ -2,13 +2,7 @@ import locale
 import xml.etree.ElementTree as ET
 
 import numpy as np
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPen
-from PyQt5.QtWidgets import QGraphicsScene
 
-from urh import constants
-from urh.cythonext import path_creator
-from urh.ui.painting.ZoomableScene import ZoomableScene
 from urh.util.Formatter import Formatter
 
 
@@ -118,25 +112,21 @@ class Modulator(object):
         return y.astype(np.float32)
 
     @property
-    def data_scene(self) -> QGraphicsScene:
+    def display_data(self) -> np.ndarray:
+        """
+        Rectangular waveform of the display bits with one value per sample (1 for one bits, -1 for zero bits)
+
+        :rtype: np.ndarray
+        """
         ones = np.ones(self.samples_per_bit, dtype=np.float32) * 1
         zeros = np.ones(self.samples_per_bit, dtype=np.float32) * -1
-        n = self.samples_per_bit * len(self.display_bits)
         y = []
         for bit in self.display_bits:
             if bit == "0":
                 y.extend(zeros)
             elif bit == "1":
                 y.extend(ones)
-        x = np.arange(0, n).astype(np.int64)
-        scene = ZoomableScene()
-        scene.setSceneRect(0, -1, n, 2)
-        scene.setBackgroundBrush(constants.BGCOLOR)
-        scene.addLine(0, 0, n, 0, QPen(constants.AXISCOLOR, Qt.FlatCap))
-        y = np.array(y) if len(y) > 0 else np.array(y).astype(np.float32)
-        path = path_creator.array_to_QPath(x, y)
-        scene.addPath(path, QPen(constants.LINECOLOR, Qt.FlatCap))
-        return scene
+        return np.array(y) if len(y) > 0 else np.array(y).astype(np.float32)
 
     def modulate(self, data=None, pause=0, start=0):
         assert pause >= 0
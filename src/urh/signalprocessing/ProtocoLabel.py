@@ -1,7 +1,6 @@
 import xml.etree.ElementTree as ET
 
-from PyQt5.QtCore import Qt
-
+from urh import core_constants
 from urh.signalprocessing.FieldType import FieldType
 from urh.signalprocessing.Interval import Interval
 from urh.util.Formatter import Formatter
@@ -32,9 +31,9 @@ class ProtocolLabel(object):
 
         self.apply_decoding = True
         self.color_index = color_index
-        self.show = Qt.Checked
+        self.show = core_constants.CHECKED
 
-        self.fuzz_me = Qt.Checked
+        self.fuzz_me = core_constants.CHECKED
         self.fuzz_values = []
 
         self.fuzz_created = fuzz_created
@@ -154,8 +153,10 @@ class ProtocolLabel(object):
 
         result = ProtocolLabel(name=name, start=start, end=end, color_index=color_index)
         result.apply_decoding = True if tag.get("apply_decoding", 'True') == "True" else False
-        result.show = Qt.Checked if Formatter.str2val(tag.get("show", 0), int) else Qt.Unchecked
-        result.fuzz_me = Qt.Checked if Formatter.str2val(tag.get("fuzz_me", 0), int) else Qt.Unchecked
+        result.show = core_constants.CHECKED if Formatter.str2val(tag.get("show", 0), int) \
+            else core_constants.UNCHECKED
+        result.fuzz_me = core_constants.CHECKED if Formatter.str2val(tag.get("fuzz_me", 0), int) \
+            else core_constants.UNCHECKED
         result.fuzz_values = tag.get("fuzz_values", "").split(",")
         result.auto_created = True if tag.get("auto_created", 'False') == "True" else False
 
@@ -1,14 +1,15 @@
 import copy
+import os
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from xml.dom import minidom
 
 import array
 import numpy as np
 import sys
-from PyQt5.QtCore import QObject, pyqtSignal, Qt
 
-from urh import constants
+from urh import core_constants
 from urh.awre.FormatFinder import FormatFinder
 from urh.cythonext import signalFunctions, util
 from urh.signalprocessing.Message import Message
@@ -18,20 +19,19 @@ from urh.signalprocessing.Participant import Participant
 from urh.signalprocessing.Signal import Signal
 from urh.signalprocessing.Encoding import Encoding
 from urh.util.Logger import logger
+from urh.util.Notifier import Notifier
+from urh.util.Settings import Settings
 
 
-class ProtocolAnalyzerSignals(QObject):
-    protocol_updated = pyqtSignal()
-    show_state_changed = pyqtSignal()
-    data_sniffed = pyqtSignal(int)
-    sniff_device_errors_changed = pyqtSignal(str)
-    line_duplicated = pyqtSignal()
-    fuzzing_started = pyqtSignal(int)
-    current_fuzzing_message_changed = pyqtSignal(int)
-    fuzzing_finished = pyqtSignal()
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
+class ProtocolAnalyzerSignals(object):
+    protocol_updated = Notifier()
+    show_state_changed = Notifier()
+    data_sniffed = Notifier(int)
+    sniff_device_errors_changed = Notifier(str)
+    line_duplicated = Notifier()
+    fuzzing_started = Notifier(int)
+    current_fuzzing_message_changed = Notifier(int)
+    fuzzing_finished = Notifier()
 
 
 class ProtocolAnalyzer(object):
@@ -41,6 +41,8 @@ class ProtocolAnalyzer(object):
     This class offers several methods for protocol analysis.
     """
 
+    PARALLEL_MIN_SAMPLES = 2 ** 22  # Minimum samples per thread for parallel pulse extraction
+
     def __init__(self, signal: Signal):
         self.messages = []  # type: list[Message]
         self.signal = signal
@@ -48,7 +50,7 @@ class ProtocolAnalyzer(object):
 
         self.__name = "Blank"  # Fallback if Signal has no Name
 
-        self.show = Qt.Checked  # Show in Compare Frame?
+        self.show = core_constants.CHECKED  # Show in Compare Frame?
         self.qt_signals = ProtocolAnalyzerSignals()
 
         self.decoder = Encoding(["Non Return To Zero (NRZ)"])  # For Default Encoding of Protocol
@@ -160,7 +162,7 @@ class ProtocolAnalyzer(object):
 
         :param view: 0 - Bits ## 1 - Hex ## 2 - ASCII
         """
-        time = constants.SETTINGS.value('show_pause_as_time', type=bool)
+        time = Settings.value('show_pause_as_time', type=bool)
         if show_pauses and time and self.signal:
             srate = self.signal.sample_rate
         else:
@@ -171,7 +173,7 @@ class ProtocolAnalyzer(object):
                                             ) for msg in self.messages)
 
     def plain_to_html(self, view, show_pauses=True) -> str:
-        time = constants.SETTINGS.value('show_pause_as_time', type=bool)
+        time = Settings.value('show_pause_as_time', type=bool)
         if show_pauses and time and self.signal:
             srate = self.signal.sample_rate
         else:
@@ -181,8 +183,8 @@ class ProtocolAnalyzer(object):
         for message in self.messages:
             cur_str = ""
             if message.participant:
-                color = constants.PARTICIPANT_COLORS[message.participant.color_index]
-                red, green, blue = color.red(), color.green(), color.blue()
+                # Participant colors are the label colors with full alpha
+                red, green, blue = core_constants.LABEL_COLORS_RGBA[message.participant.color_index][:3]
                 fgcolor = "#000000" if (red * 0.299 + green * 0.587 + blue * 0.114) > 186 else "#ffffff"
                 cur_str += '<span style="background-color: rgb({0},{1},{2}); color: {3}">'.format(red, green, blue,
                                                                                                   fgcolor)
@@ -218,18 +220,25 @@ class ProtocolAnalyzer(object):
 
         bit_len = signal.bit_len
 
-        try:
-            ppseq = signalFunctions.grab_pulse_lens(signal.qad, signal.qad_center, signal.tolerance,
-                                                    signal.modulation_type, signal.bit_len)
-        except TypeError:
-            # Remove this check in version 1.7
-            print("Extension method has changed! To fix this, first move to URHs base directory "
-                  "then recompile the extensions using the following command:")
-            print("python3 src/urh/cythonext/build.py")
-            print("and finally restart the application")
-            sys.exit(1)
-
-        bit_data, pauses, bit_sample_pos = self._ppseq_to_bits(ppseq, bit_len, pause_threshold=signal.pause_threshold)
+        # Changes of pause threshold, message length divisor or bit length (except for ASK) need no pulse extraction
+        pulses = signal.get_cached_pulses()
+        if pulses is None:
+            try:
+                pulses = self.grab_pulses_parallel(signal.qad, signal.qad_center, signal.tolerance,
+                                                   signal.modulation_type, signal.bit_len)
+            except TypeError:
+                # Remove this check in version 1.7
+                print("Extension method has changed! To fix this, first move to URHs base directory "
+                      "then recompile the extensions using the following command:")
+                print("python3 src/urh/cythonext/build.py")
+                print("and finally restart the application")
+                sys.exit(1)
+            signal.set_cached_pulses(*pulses)
+
+        pulse_types, pulse_lengths = pulses
+
+        bit_data, pauses, bit_sample_pos = self._pulses_to_bit_arrays(pulse_types, pulse_lengths, bit_len,
+                                                                      pause_threshold=signal.pause_threshold)
         if signal.message_length_divisor > 1 and signal.modulation_type_str == "ASK":
             self.__ensure_message_length_multiple(bit_data, signal.bit_len, pauses, bit_sample_pos,
                                                   signal.message_length_divisor)
@@ -272,83 +281,187 @@ class ProtocolAnalyzer(object):
                 bit_sample_pos[i].extend([bit_sample_pos[i][-1] + (k + 1) * bit_len for k in range(missing_bits - 1)])
                 bit_sample_pos[i].append(bit_sample_pos[i][-1] + pauses[i])
 
-    def _ppseq_to_bits(self, ppseq, bit_len: int, write_bit_sample_pos=True, pause_threshold=8):
-        bit_sampl_pos = array.array("L", [])
-        bit_sample_positions = []
+    @staticmethod
+    def grab_pulses_parallel(qad: np.ndarray, center: float, tolerance: int, modulation_type: int, bit_len: int,
+                             min_samples_per_thread: int = None, num_threads: int = None):
+        """
+        Extract the pulses of demodulated samples in a thread pool.
 
-        data_bits = array.array("B", [])
-        resulting_data_bits = []
-        pauses = array.array("L", [])
-        start = 0
-        total_samples = 0
+        The samples are cut in the middle of noise gaps, which are long enough, that the pulses after the gap
+        do not depend on the samples before it. The pieces are processed without the GIL and the pauses at
+        the cuts are merged afterwards, so the result is the same as grab_pulses on all samples.
 
-        pause_type = 42
-        zero_pulse_type = 0
-        one_pulse_type = 1
+        :return: pulse types and pulse lengths like grab_pulses
+        """
+        if min_samples_per_thread is None:
+            min_samples_per_thread = ProtocolAnalyzer.PARALLEL_MIN_SAMPLES
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+
+        num_samples = len(qad)
+        samples_per_thread = max(min_samples_per_thread, num_samples // num_threads + 1)
+        # Each side of a cut needs a pause longer than a bit, so short pause handling of ASK does not change
+        half_gap = bit_len + tolerance + 2
+
+        cuts = []
+        pos = samples_per_thread
+        while pos < num_samples - min_samples_per_thread and num_threads > 1:
+            gap_start = signalFunctions.find_noise_gap(qad, pos, 2 * half_gap, modulation_type)
+            if gap_start == -1:
+                break
+            cuts.append(gap_start + half_gap)
+            pos = cuts[-1] + samples_per_thread
 
-        there_was_data = False
+        if not cuts:
+            return signalFunctions.grab_pulses(qad, center, tolerance, modulation_type, bit_len)[:2]
 
-        if len(ppseq) > 0 and ppseq[0, 0] == pause_type:
-            start = 1  # Starts with Pause
-            total_samples = ppseq[0, 1]
+        bounds = [0] + cuts + [num_samples]
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            results = list(executor.map(lambda piece: signalFunctions.grab_pulses(qad[piece[0]:piece[1]], center,
+                                                                                  tolerance, modulation_type,
+                                                                                  bit_len)[:2],
+                                        zip(bounds[:-1], bounds[1:])))
 
-        for i in range(start, len(ppseq)):
-            cur_pulse_type = ppseq[i, 0]
-            num_samples = ppseq[i, 1]
-            num_bits_floated = num_samples / bit_len
-            num_bits = int(num_bits_floated)
-            decimal_place = num_bits_floated - num_bits
+        pulse_types = np.concatenate([types for types, _ in results])
+        pulse_lengths = np.concatenate([lengths for _, lengths in results])
+        piece_starts = np.cumsum([len(types) for types, _ in results])[:-1]
 
-            if decimal_place > 0.5:
-                num_bits += 1
+        # Piece ends with the first part of a pause and the next piece starts with the rest of it
+        merged = np.zeros(len(pulse_types), dtype=bool)
+        for i in piece_starts:
+            j = i - 1
+            while merged[j]:
+                j -= 1  # Previous piece consisted of this pause only
 
-            if cur_pulse_type == pause_type:
-                # OOK
-                if num_bits <= pause_threshold or pause_threshold == 0:
-                    data_bits.extend([False] * num_bits)
-                    if write_bit_sample_pos:
-                        bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
+            if pulse_types[j] != 42 or pulse_types[i] != 42:
+                logger.warning("Could not merge pulses of parallel extraction, falling back to a single pass")
+                return signalFunctions.grab_pulses(qad, center, tolerance, modulation_type, bit_len)[:2]
 
-                elif not there_was_data:
-                    # Ignore this pause, if there were no information
-                    # transmitted previously
-                    data_bits[:] = array.array("B", [])
-                    bit_sampl_pos[:] = array.array("L", [])
+            pulse_lengths[j] += tolerance + pulse_lengths[i]
+            merged[i] = True
 
-                else:
-                    if write_bit_sample_pos:
-                        bit_sampl_pos.append(total_samples)
-                        bit_sampl_pos.append(total_samples + num_samples)
-                        bit_sample_positions.append(bit_sampl_pos[:])
-                        bit_sampl_pos[:] = array.array("L", [])
-
-                    resulting_data_bits.append(data_bits[:])
-                    data_bits[:] = array.array("B", [])
-                    pauses.append(num_samples)
-                    there_was_data = False
-
-            elif cur_pulse_type == zero_pulse_type:
-                data_bits.extend([False] * num_bits)
-                if write_bit_sample_pos:
-                    bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
-
-            elif cur_pulse_type == one_pulse_type:
-                if not there_was_data:
-                    there_was_data = num_bits > 0
-                data_bits.extend([True] * num_bits)
-                if write_bit_sample_pos:
-                    bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
-
-            total_samples += num_samples
-
-        if there_was_data:
-            resulting_data_bits.append(data_bits[:])
-            if write_bit_sample_pos:
-                bit_sample_positions.append(bit_sampl_pos[:] + array.array("L", [total_samples]))
-            pause = ppseq[-1, 1] if ppseq[-1, 0] == pause_type else 0
-            pauses.append(pause)
-
-        return resulting_data_bits, pauses, bit_sample_positions
+        return pulse_types[~merged], pulse_lengths[~merged]
+
+    def _ppseq_to_bits(self, ppseq, bit_len: int, write_bit_sample_pos=True, pause_threshold=8):
+        """
+        Convert a pulse sequence from grab_pulse_lens to a bit array, pause and bit sample positions per message
+
+        :rtype: (list of array.array, array.array, list of array.array)
+        """
+        ppseq = np.asarray(ppseq, dtype=np.uint64).reshape(-1, 2)
+        return self._pulses_to_bit_arrays(ppseq[:, 0], ppseq[:, 1], bit_len, write_bit_sample_pos, pause_threshold)
+
+    def _pulses_to_bit_arrays(self, pulse_types: np.ndarray, pulse_lengths: np.ndarray, bit_len: int,
+                              write_bit_sample_pos=True, pause_threshold=8):
+        """
+        Like pulses_to_bits, but return an array.array per message
+
+        :rtype: (list of array.array, array.array, list of array.array)
+        """
+        bits, bit_offsets, pauses, bit_sample_pos, bit_sample_pos_offsets = \
+            self.pulses_to_bits(pulse_types, pulse_lengths, bit_len, write_bit_sample_pos, pause_threshold)
+
+        resulting_data_bits = [self.__to_array("B", bits[bit_offsets[i]:bit_offsets[i + 1]])
+                               for i in range(len(pauses))]
+        bit_sample_positions = [self.__to_array("L", bit_sample_pos[bit_sample_pos_offsets[i]:
+                                                                    bit_sample_pos_offsets[i + 1]])
+                                for i in range(len(bit_sample_pos_offsets) - 1)]
+        return resulting_data_bits, self.__to_array("L", pauses), bit_sample_positions
+
+    @staticmethod
+    def __to_array(typecode: str, values: np.ndarray) -> array.array:
+        result = array.array(typecode)
+        result.frombytes(values.astype(typecode).tobytes())
+        return result
+
+    @staticmethod
+    def pulses_to_bits(pulse_types: np.ndarray, pulse_lengths: np.ndarray, bit_len: int,
+                       write_bit_sample_pos=True, pause_threshold=8):
+        """
+        Convert pulses to messages. Pauses longer than pause_threshold bits separate messages,
+        shorter pauses are zero bits. Messages without a one bit are dropped.
+
+        :param pulse_types: 1 = one pulse, 0 = zero pulse, 42 = pause, as returned by grab_pulses
+        :param pulse_lengths: length of pulses in samples
+        :param write_bit_sample_pos: If False, no bit sample positions are calculated (empty arrays are returned)
+        :return: bits (uint8) of all messages and offsets of the messages in it,
+                 pauses (uint64) after each message,
+                 bit sample positions (uint64) of all messages and offsets of the messages in it.
+                 The sample positions of a message contain one entry per bit, followed by the start and
+                 end of the pause after it (the last message has only the end of the signal).
+        """
+        pause_type = 42
+        one_pulse_type = 1
+
+        pulse_types = np.asarray(pulse_types, dtype=np.uint8)
+        pulse_lengths = np.asarray(pulse_lengths, dtype=np.uint64).astype(np.int64)
+        empty = np.zeros(0, dtype=np.uint8), np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.uint64), \
+                np.zeros(0, dtype=np.uint64), np.zeros(1 if write_bit_sample_pos else 0, dtype=np.int64)
+        if len(pulse_types) == 0:
+            return empty
+
+        pulse_starts = np.concatenate(([0], np.cumsum(pulse_lengths)[:-1]))
+        total_samples = int(pulse_starts[-1] + pulse_lengths[-1])
+
+        # A leading pause is ignored
+        first = 1 if pulse_types[0] == pause_type else 0
+        types, lengths, starts = pulse_types[first:], pulse_lengths[first:], pulse_starts[first:]
+
+        # Round to nearest number of bits, exactly half a bit is rounded down
+        num_bits = lengths // bit_len
+        num_bits += 2 * (lengths - num_bits * bit_len) > bit_len
+
+        is_separator = (types == pause_type) & (num_bits > pause_threshold) & (pause_threshold != 0)
+        separators = np.flatnonzero(is_separator)
+
+        # Each pulse belongs to the segment ending at the next separator, the last segment has no separator
+        segment = np.cumsum(is_separator) - is_separator
+        num_segments = len(separators) + 1
+        has_data = np.zeros(num_segments, dtype=bool)
+        has_data[segment[(types == one_pulse_type) & (num_bits > 0)]] = True
+        if not has_data.any():
+            return empty
+
+        kept = has_data[segment] & ~is_separator
+        bits_per_pulse = np.where(kept, num_bits, 0)
+        bits = np.repeat((types == one_pulse_type).astype(np.uint8), bits_per_pulse)
+
+        message_segments = np.flatnonzero(has_data)
+        bits_per_segment = np.bincount(segment, weights=bits_per_pulse, minlength=num_segments).astype(np.int64)
+        bit_offsets = np.concatenate(([0], np.cumsum(bits_per_segment[message_segments])))
+
+        # Messages end at their separator, only the last segment ends with the signal
+        ends_with_separator = message_segments < len(separators)
+        pauses = np.zeros(len(message_segments), dtype=np.uint64)
+        pauses[ends_with_separator] = lengths[separators[message_segments[ends_with_separator]]]
+        if not ends_with_separator[-1] and pulse_types[-1] == pause_type:
+            pauses[-1] = pulse_lengths[-1]
+
+        if not write_bit_sample_pos:
+            return bits, bit_offsets, pauses, np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+
+        # Position of each bit: start of its pulse plus a multiple of bit_len
+        pulse_bit_offsets = np.cumsum(bits_per_pulse) - bits_per_pulse
+        bit_index_in_pulse = np.arange(len(bits)) - np.repeat(pulse_bit_offsets, bits_per_pulse)
+        bit_positions = np.repeat(starts, bits_per_pulse) + bit_index_in_pulse * bit_len
+
+        # Append start and end of the pause after each message, or the signal end for the last message
+        num_extra = np.where(ends_with_separator, 2, 1)
+        bit_sample_pos_offsets = np.concatenate(([0], np.cumsum(bits_per_segment[message_segments] + num_extra)))
+        bit_sample_pos = np.empty(bit_sample_pos_offsets[-1], dtype=np.uint64)
+
+        message_of_bit = np.repeat(np.arange(len(message_segments)), bits_per_segment[message_segments])
+        bit_sample_pos[np.arange(len(bits)) + bit_sample_pos_offsets[message_of_bit] - bit_offsets[message_of_bit]] = \
+            bit_positions
+
+        pause_ends = bit_sample_pos_offsets[1:] - 1
+        separator_indices = separators[message_segments[ends_with_separator]]
+        bit_sample_pos[pause_ends[ends_with_separator] - 1] = starts[separator_indices]
+        bit_sample_pos[pause_ends[ends_with_separator]] = starts[separator_indices] + lengths[separator_indices]
+        if not ends_with_separator[-1]:
+            bit_sample_pos[pause_ends[-1]] = total_samples
+
+        return bits, bit_offsets, pauses, bit_sample_pos, bit_sample_pos_offsets
 
     def get_samplepos_of_bitseq(self, start_message: int, start_index: int, end_message: int, end_index: int,
                                 include_pause: bool):
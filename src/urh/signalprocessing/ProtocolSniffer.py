@@ -2,26 +2,24 @@ import os
 from datetime import datetime
 
 import numpy as np
-from PyQt5.QtCore import pyqtSlot, pyqtSignal, QObject
 
-from urh.cythonext.signalFunctions import grab_pulse_lens
-from urh.dev.BackendHandler import BackendHandler, Backends
-from urh.dev.VirtualDevice import VirtualDevice, Mode
+from urh.cythonext.signalFunctions import grab_pulse_lens, grab_pulses, afp_demod_chunk
 from urh.signalprocessing.Message import Message
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
+from urh.util.Notifier import Notifier
 
 
-class ProtocolSniffer(ProtocolAnalyzer, QObject):
+class ProtocolSniffer(ProtocolAnalyzer):
     """
     This class is used for live sniffing a protocol
     with certain signal parameters.
     """
-    started = pyqtSignal()
-    stopped = pyqtSignal()
+    started = Notifier()
+    stopped = Notifier()
 
     def __init__(self, bit_len: int, center: float, noise: float, tolerance: int,
-                 modulation_type: int, device: str, backend_handler: BackendHandler):
+                 modulation_type: int, device: str, backend_handler):
         signal = Signal("", "LiveSignal")
         signal.bit_len = bit_len
         signal.qad_center = center
@@ -29,17 +27,13 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
         signal.tolerance = tolerance
         signal.silent_set_modulation_type(modulation_type)
         ProtocolAnalyzer.__init__(self, signal)
-        QObject.__init__(self, None)
 
         self.backend_handler = backend_handler
-        self.rcv_device = VirtualDevice(self.backend_handler, device, Mode.receive,
-                                        resume_on_full_receive_buffer=True, raw_mode=False)
-
-        self.rcv_device.index_changed.connect(self.on_rcv_thread_index_changed)
-        self.rcv_device.started.connect(self.__emit_started)
-        self.rcv_device.stopped.connect(self.__emit_stopped)
+        self.rcv_device = self.__create_rcv_device(device)
 
         self.data_cache = []
+        self.qad_cache = []  # demodulated data_cache, so it needs no second demodulation
+        self.__demod_state = None
         self.conseq_non_data = 0
         self.reading_data = False
 
@@ -77,17 +71,31 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
     def device_name(self, value: str):
         if value != self.rcv_device.name:
             self.rcv_device.free_data()
-            self.rcv_device = VirtualDevice(self.backend_handler, value, Mode.receive, device_ip="192.168.10.2",
-                                            resume_on_full_receive_buffer=True, raw_mode=False)
-            self.rcv_device.index_changed.connect(self.on_rcv_thread_index_changed)
-            self.rcv_device.started.connect(self.__emit_started)
-            self.rcv_device.stopped.connect(self.__emit_stopped)
+            self.rcv_device = self.__create_rcv_device(value, device_ip="192.168.10.2")
+
+    def __create_rcv_device(self, device_name: str, **kwargs):
+        """
+        Create the receiving device. The device layer is imported here, so
+        the sniffer itself can be imported without Qt.
+
+        :type device_name: str
+        :rtype: urh.dev.VirtualDevice.VirtualDevice
+        """
+        from urh.dev.VirtualDevice import VirtualDevice, Mode
+
+        rcv_device = VirtualDevice(self.backend_handler, device_name, Mode.receive,
+                                   resume_on_full_receive_buffer=True, raw_mode=False, **kwargs)
+        rcv_device.index_changed.connect(self.on_rcv_thread_index_changed)
+        rcv_device.started.connect(self.__emit_started)
+        rcv_device.stopped.connect(self.__emit_stopped)
+        return rcv_device
 
     def sniff(self):
         self.rcv_device.start()
 
-    @pyqtSlot(int, int)
     def on_rcv_thread_index_changed(self, old_index, new_index):
+        from urh.dev.BackendHandler import Backends
+
         old_nmsgs = len(self.messages)
         if self.rcv_device.backend in (Backends.native, Backends.grc):
             if old_index == new_index:
@@ -129,13 +137,15 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
 
         if self.reading_data:
             self.data_cache.append(data)
+            self.qad_cache.append(self.signal.qad)
             return
         elif len(self.data_cache) == 0:
             return
 
         self.signal._fulldata = np.concatenate(self.data_cache)
+        self.signal._qad = np.concatenate(self.qad_cache)
         self.data_cache.clear()
-        self.signal._qad = None
+        self.qad_cache.clear()
 
         bit_len = self.signal.bit_len
         ppseq = grab_pulse_lens(self.signal.qad, self.signal.qad_center,
@@ -162,22 +172,25 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
             i += 1
 
     def __are_bits_in_data(self, data):
+        # Continue the demodulation of cached data, so the concatenated chunks equal a demodulation of the whole
+        state = self.__demod_state if self.data_cache else None
+        qad, self.__demod_state = afp_demod_chunk(data, self.signal.noise_threshold, self.signal.modulation_type,
+                                                  state, self.signal.costa_reset_noise_samples)
         self.signal._fulldata = data
-        self.signal._qad = None
-
-        bit_len = self.signal.bit_len
-        ppseq = grab_pulse_lens(self.signal.qad, self.signal.qad_center,
-                                self.signal.tolerance, self.signal.modulation_type, self.signal.bit_len)
+        self.signal._qad = qad
 
-        bit_data, pauses, _ = self._ppseq_to_bits(ppseq, bit_len)
+        pulse_types, pulse_lengths, _ = grab_pulses(self.signal.qad, self.signal.qad_center, self.signal.tolerance,
+                                                    self.signal.modulation_type, self.signal.bit_len)
+        pauses = self.pulses_to_bits(pulse_types, pulse_lengths, self.signal.bit_len, write_bit_sample_pos=False)[2]
 
-        return bool(bit_data)
+        return len(pauses) > 0
 
     def stop(self):
         self.rcv_device.stop("Stopping receiving due to user interaction")
 
     def clear(self):
         self.data_cache.clear()
+        self.qad_cache.clear()
         self.messages.clear()
 
     def __emit_started(self):
@@ -5,43 +5,54 @@ import tarfile
 import wave
 
 import numpy as np
-from PyQt5.QtCore import pyqtSignal, QObject, QDir, Qt
-from PyQt5.QtWidgets import QApplication
 
 import urh.cythonext.signalFunctions as signal_functions
-from urh import constants
+from urh import core_constants
+from urh.signalprocessing.ChunkedDemodulator import ChunkedDemodulator
+from urh.signalprocessing.FFT import FFT
 from urh.signalprocessing.Filter import Filter
 from urh.util import FileOperator
+from urh.util.CompressedSignalFile import CompressedSignalFile
+from urh.util.LazySampleArray import LazySampleArray
 from urh.util.Logger import logger
+from urh.util.MinMaxPyramid import MinMaxPyramid
+from urh.util.Notifier import Notifier
+from urh.util.Settings import Settings
+from urh.util.SignalCache import SignalCache
 
 
-class Signal(QObject):
+class Signal(object):
     """
     Representation of a loaded signal (complex file).
     """
 
     MODULATION_TYPES = ["ASK", "FSK", "PSK", "QAM"]
 
-    bit_len_changed = pyqtSignal(int)
-    tolerance_changed = pyqtSignal(int)
-    noise_threshold_changed = pyqtSignal()
-    qad_center_changed = pyqtSignal(float)
-    name_changed = pyqtSignal(str)
-    sample_rate_changed = pyqtSignal(float)
-    modulation_type_changed = pyqtSignal(int)
+    WAV_BLOCK_SIZE = 2 ** 16  # frames converted at once when loading WAV files
+    CENTER_ESTIMATION_SAMPLES = 2 ** 24  # larger signals are subsampled for center estimation
 
-    saved_status_changed = pyqtSignal()
-    protocol_needs_update = pyqtSignal()
-    data_edited = pyqtSignal()  # On Crop/Mute/Delete etc.
+    bit_len_changed = Notifier(int)
+    tolerance_changed = Notifier(int)
+    noise_threshold_changed = Notifier()
+    qad_center_changed = Notifier(float)
+    name_changed = Notifier(str)
+    sample_rate_changed = Notifier(float)
+    modulation_type_changed = Notifier(int)
 
-    def __init__(self, filename: str, name: str, modulation: str = None, sample_rate: float = 1e6, parent=None):
-        super().__init__(parent)
+    saved_status_changed = Notifier()
+    protocol_needs_update = Notifier()
+    data_edited = Notifier()  # On Crop/Mute/Delete etc.
+
+    def __init__(self, filename: str, name: str, modulation: str = None, sample_rate: float = 1e6):
         self.__name = name
         self.__tolerance = 5
         self.__bit_len = 100
         self.__pause_threshold = 8
         self.__message_length_divisor = 1
         self._qad = None
+        self.__qad_chunks = None  # type: ChunkedDemodulator
+        self.__pulse_cache = None  # Key and pulse sequence of last protocol extraction
+        self.__min_max_pyramids = {}  # part -> (source array, MinMaxPyramid)
         self.__qad_center = 0
         self._noise_threshold = 0
         self.__sample_rate = sample_rate
@@ -55,37 +66,68 @@ class Signal(QObject):
         if modulation is None:
             modulation = "FSK"
         self.__modulation_type = self.MODULATION_TYPES.index(modulation)
+        self.__costa_reset_noise_samples = Settings.value("costa_reset_noise_samples", 0, int)
         self.__parameter_cache = {mod: {"qad_center": None, "bit_len": None} for mod in self.MODULATION_TYPES}
+        self.__cache = None  # type: SignalCache
+        self.__compressed_file = None  # type: CompressedSignalFile
 
         if len(filename) > 0:
+            stored_parameters = None
             if self.wav_mode:
                 self.__load_wav_file(filename)
             elif filename.endswith(".coco"):
-                self.__load_compressed_complex(filename)
+                stored_parameters = self.__load_compressed_complex(filename)
             else:
                 self.__load_complex_file(filename)
 
             self.filename = filename
-            self.noise_threshold = self.calc_noise_threshold(int(0.99 * self.num_samples), self.num_samples)
+            self.__cache = SignalCache.for_file(filename)
+            self.noise_threshold = self.__get_initial_noise_threshold()
+            if stored_parameters:
+                self.__apply_stored_parameters(stored_parameters)
         else:
             self.filename = ""
 
+    def __get_initial_noise_threshold(self):
+        noise_threshold = self.__cache.load_noise_threshold() if self.__cache is not None else None
+        if noise_threshold is None:
+            noise_threshold = self.calc_noise_threshold(int(0.99 * self.num_samples), self.num_samples)
+            if self.__cache is not None:
+                self.__cache.store_noise_threshold(noise_threshold)
+
+        return noise_threshold
+
     def __load_complex_file(self, filename: str):
+        # Converted block by block on access, a full complex64 copy would be four times the file size
         if filename.endswith(".complex16u"):
             # two 8 bit unsigned integers
-            raw = np.fromfile(filename, dtype=[('r', np.uint8), ('i', np.uint8)])
-            self._fulldata = np.empty(raw.shape[0], dtype=np.complex64)
-            self._fulldata.real = (raw['r'] / 127.5) - 1.0
-            self._fulldata.imag = (raw['i'] / 127.5) - 1.0
+            self._fulldata = LazySampleArray.from_iq_file(filename, np.uint8)
         elif filename.endswith(".complex16s"):
             # two 8 bit signed integers
-            raw = np.fromfile(filename, dtype=[('r', np.int8), ('i', np.int8)])
-            self._fulldata = np.empty(raw.shape[0], dtype=np.complex64)
-            self._fulldata.real = (raw['r'] + 0.5) / 127.5
-            self._fulldata.imag = (raw['i'] + 0.5) / 127.5
+            self._fulldata = LazySampleArray.from_iq_file(filename, np.int8)
         else:
-            # Uncompressed
-            self._fulldata = np.fromfile(filename, dtype=np.complex64)
+            # Uncompressed, map the file so only the regions we actually look at get paged in
+            self._fulldata = self._memory_map(filename, np.complex64)
+
+    @staticmethod
+    def _memory_map(filename: str, dtype, offset=0, num_samples=None) -> np.ndarray:
+        """
+        Map a raw sample file into memory instead of reading it.
+        The map is copy on write, so edits like mute or filter only change the data in memory.
+
+        :param filename: Path of the raw sample file
+        :param dtype: Data type of a single sample in the file
+        :param offset: Byte offset of the first sample in the file
+        :param num_samples: Number of samples to map, default is up to the end of the file
+        :return: Memory mapped array of samples
+        """
+        if num_samples is None:
+            num_samples = (os.path.getsize(filename) - offset) // np.dtype(dtype).itemsize
+        if num_samples <= 0:
+            # Empty files can not be mapped
+            return np.zeros(0, dtype=dtype)
+
+        return np.memmap(filename, dtype=dtype, mode="c", offset=offset, shape=(num_samples,))
 
     def __load_wav_file(self, filename: str):
         wav = wave.open(filename, "r")
@@ -100,30 +142,101 @@ class Signal(QObject):
         else:
             raise ValueError("Can't handle sample width {0}".format(sample_width))
 
+        if num_channels not in (1, 2):
+            raise ValueError("Cam't handle {0} channels".format(num_channels))
+
         params["center"] = (params["min"] + params["max"]) / 2
 
-        data = np.fromstring(wav.readframes(num_frames * num_channels), dtype=params["fmt"])
-        if num_channels == 1:
-            self._fulldata = np.zeros(num_frames, dtype=np.complex64, order="C")
-            self._fulldata.real = np.multiply(1 / params["max"], np.subtract(data, params["center"]))
-        elif num_channels == 2:
-            self._fulldata = np.zeros(num_frames, dtype=np.complex64, order="C")
-            self._fulldata.real = np.multiply(1 / params["max"], np.subtract(data[0::2], params["center"]))
-            self._fulldata.imag = np.multiply(1 / params["max"], np.subtract(data[1::2], params["center"]))
-        else:
-            raise ValueError("Cam't handle {0} channels".format(num_channels))
+        self._fulldata = np.zeros(num_frames, dtype=np.complex64, order="C")
+        # Real and imaginary part as columns, so the channels can be written directly into them
+        result = self._fulldata.view(np.float32).reshape((num_frames, 2))
+
+        pcm_data = self.__map_wav_data(filename, params["fmt"], num_frames * num_channels)
+        for start in range(0, num_frames, self.WAV_BLOCK_SIZE):
+            end = min(start + self.WAV_BLOCK_SIZE, num_frames)
+            if pcm_data is not None:
+                block = pcm_data[start * num_channels:end * num_channels]
+            else:
+                block = np.frombuffer(wav.readframes(end - start), dtype=params["fmt"])
+
+            block = np.subtract(block.reshape((end - start, num_channels)), params["center"])
+            np.multiply(1 / params["max"], block, out=result[start:end, :num_channels], casting="same_kind")
 
         wav.close()
 
         self.sample_rate = sample_rate
 
+    @staticmethod
+    def __map_wav_data(filename: str, dtype, num_values: int):
+        """
+        Memory map the PCM data chunk of a WAV file.
+
+        :return: Mapped values or None if the file layout does not allow mapping
+        """
+        try:
+            with open(filename, "rb") as f:
+                riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+                if riff != b"RIFF" or wave_id != b"WAVE":
+                    return None
+
+                while True:
+                    chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+                    if chunk_id == b"data":
+                        offset = f.tell()
+                        break
+                    f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+        except (OSError, struct.error):
+            return None
+
+        if offset + num_values * np.dtype(dtype).itemsize > os.path.getsize(filename):
+            return None
+
+        return Signal._memory_map(filename, np.dtype(dtype).newbyteorder("<"), offset=offset, num_samples=num_values)
+
     def __load_compressed_complex(self, filename: str):
-        obj = tarfile.open(filename, "r")
-        members = obj.getmembers()
-        obj.extract(members[0], QDir.tempPath())
-        extracted_filename = os.path.join(QDir.tempPath(), obj.getnames()[0])
-        self._fulldata = np.fromfile(extracted_filename, dtype=np.complex64)
-        os.remove(extracted_filename)
+        if CompressedSignalFile.is_compressed_signal_file(filename):
+            # Keep the file open and only decompress the chunks that get accessed
+            self.__compressed_file = CompressedSignalFile(filename)
+            self._fulldata = LazySampleArray.from_compressed_file(self.__compressed_file)
+            self.__sample_rate = self.__compressed_file.sample_rate
+            return self.__compressed_file.parameters
+
+        # Legacy format: complex file in a bz2 compressed tar
+        with tarfile.open(filename, "r") as obj:
+            member = obj.getmembers()[0]
+            self._fulldata = np.empty(member.size // 8, dtype=np.complex64)
+            obj.extractfile(member).readinto(memoryview(self._fulldata).cast("B"))
+
+        return None
+
+    @property
+    def stored_parameters(self) -> dict:
+        """
+        Parameters that are saved together with the samples in compressed signal files
+
+        :rtype: dict
+        """
+        return {"modulation_type": self.modulation_type_str, "bit_len": self.bit_len, "tolerance": self.tolerance,
+                "noise_threshold": self.noise_threshold, "qad_center": self.qad_center,
+                "pause_threshold": self.pause_threshold, "message_length_divisor": self.message_length_divisor}
+
+    def __apply_stored_parameters(self, parameters: dict):
+        if parameters.get("modulation_type") in self.MODULATION_TYPES:
+            self.__modulation_type = self.MODULATION_TYPES.index(parameters["modulation_type"])
+        if "noise_threshold" in parameters:
+            self._noise_threshold = parameters["noise_threshold"]
+            self.noise_min_plot = -self._noise_threshold
+            self.noise_max_plot = self._noise_threshold
+
+        self.__bit_len = parameters.get("bit_len", self.__bit_len)
+        self.__tolerance = parameters.get("tolerance", self.__tolerance)
+        self.__qad_center = parameters.get("qad_center", self.__qad_center)
+        self.__pause_threshold = parameters.get("pause_threshold", self.__pause_threshold)
+        self.__message_length_divisor = parameters.get("message_length_divisor", self.__message_length_divisor)
+
+        # Prevent auto detection from overwriting the stored values
+        self.__parameter_cache[self.modulation_type_str]["qad_center"] = self.__qad_center
+        self.__parameter_cache[self.modulation_type_str]["bit_len"] = self.__bit_len
 
     @property
     def sample_rate(self):
@@ -172,6 +285,30 @@ class Signal(QObject):
             if not self.block_protocol_update:
                 self.protocol_needs_update.emit()
 
+    @property
+    def costa_reset_noise_samples(self) -> int:
+        """
+        Number of noise samples after which the Costas loop of PSK and QAM is reset, 0 = never (default).
+        Bursts between such gaps are demodulated in parallel, but the loop may lock on with opposite phase
+        after a reset, so the bits of a burst can come out inverted.
+        """
+        return self.__costa_reset_noise_samples
+
+    @costa_reset_noise_samples.setter
+    def costa_reset_noise_samples(self, value: int):
+        if self.__costa_reset_noise_samples != value:
+            self.__costa_reset_noise_samples = value
+            if self.modulation_type in (2, 3):
+                self._qad = None
+                self.__qad_chunks = None
+                if not self.block_protocol_update:
+                    self.protocol_needs_update.emit()
+
+    @property
+    def __demod_costa_reset(self) -> int:
+        # Other modulation types have no Costas loop, so they share the cached demodulation
+        return self.costa_reset_noise_samples if self.modulation_type in (2, 3) else 0
+
     @property
     def modulation_type_str(self):
         return self.MODULATION_TYPES[self.modulation_type]
@@ -258,6 +395,7 @@ class Signal(QObject):
             self._qad = None
             self.clear_parameter_cache()
             self._noise_threshold = value
+            self.__load_cached_parameters()
             self.noise_min_plot = -value
             self.noise_max_plot = value
             self.noise_threshold_changed.emit()
@@ -266,15 +404,97 @@ class Signal(QObject):
 
     @property
     def qad(self):
+        if self._qad is None and self.__cache is not None:
+            self._qad = self.__cache.load_qad(self.modulation_type, self.noise_threshold, self.__demod_costa_reset)
+
         if self._qad is None:
             self._qad = self.quad_demod()
+            if self.__cache is not None:
+                self.__cache.store_qad(self._qad, self.modulation_type, self.noise_threshold,
+                                       self.__demod_costa_reset)
 
         return self._qad
 
+    @property
+    def pulse_cache_key(self) -> tuple:
+        """
+        Parameters the pulse sequence depends on. The bit length only matters for ASK, where it
+        decides whether a short pause is a zero pulse.
+        """
+        return (self.qad_center, self.tolerance, self.noise_threshold, self.modulation_type,
+                self.bit_len if self.modulation_type == 0 else None)
+
+    def get_cached_pulses(self):
+        """
+        Return pulse types and lengths stored with set_cached_pulses, if the demodulated data and
+        all parameters in pulse_cache_key are unchanged since then, otherwise None
+        """
+        if self.__pulse_cache is None:
+            return None
+
+        key, qad, pulses = self.__pulse_cache
+        if key != self.pulse_cache_key or qad is not self._qad:
+            self.__pulse_cache = None
+            return None
+
+        return pulses
+
+    def set_cached_pulses(self, pulse_types: np.ndarray, pulse_lengths: np.ndarray):
+        self.__pulse_cache = (self.pulse_cache_key, self._qad, (pulse_types, pulse_lengths))
+
+    def get_qad_section(self, start: int, end: int) -> np.ndarray:
+        """
+        Return the demodulated samples from start to end without demodulating the whole signal.
+        Blocks are demodulated on demand and the recently used ones are kept in memory.
+
+        The demodulated view of the signal frame keeps drawing from qad, since its min/max pyramid
+        and its y range cover the whole signal, so they need the complete demodulation anyway.
+        """
+        if self._qad is not None:
+            return self._qad[start:end]
+
+        chunks = self.__qad_chunks
+        if chunks is None or chunks.samples is not self._fulldata \
+                or chunks.noise_threshold != self.noise_threshold or chunks.modulation_type != self.modulation_type \
+                or chunks.costa_reset_noise_samples != self.__demod_costa_reset:
+            chunks = ChunkedDemodulator(self._fulldata, self.noise_threshold, self.modulation_type,
+                                        costa_reset_noise_samples=self.__demod_costa_reset)
+            self.__qad_chunks = chunks
+
+        return chunks.get_section(start, end)
+
     @property
     def data(self) -> np.ndarray:
         return self._fulldata
 
+    def get_min_max_pyramid(self, part: str) -> MinMaxPyramid:
+        """
+        Return the min/max pyramid for drawing a part of the signal. It is built lazily
+        and rebuilt, when the samples or the demodulation changed.
+
+        :param part: "real", "imag" or "qad"
+        """
+        source = self.qad if part == "qad" else self._fulldata
+        try:
+            cached_source, pyramid = self.__min_max_pyramids[part]
+            if cached_source is source:
+                return pyramid
+        except KeyError:
+            pass
+
+        if part == "qad":
+            samples = source
+        elif part == "real":
+            samples = self.real_plot_data
+        elif part == "imag":
+            samples = source.imag
+        else:
+            raise ValueError("Unknown signal part " + part)
+
+        pyramid = MinMaxPyramid(samples)
+        self.__min_max_pyramids[part] = (source, pyramid)
+        return pyramid
+
     @property
     def real_plot_data(self):
         try:
@@ -284,7 +504,7 @@ class Signal(QObject):
 
     @property
     def wave_data(self):
-        return (self.data.view(np.float32) * 32767).astype(np.int16)
+        return (np.asarray(self.data).view(np.float32) * 32767).astype(np.int16)
 
     @property
     def changed(self) -> bool:
@@ -306,12 +526,15 @@ class Signal(QObject):
             self.save_as(self.filename)
 
     def save_as(self, filename: str):
-        QApplication.instance().setOverrideCursor(Qt.WaitCursor)
+        source = self._fulldata.filename if isinstance(self._fulldata, LazySampleArray) else None
+        if source is not None and os.path.isfile(filename) and os.path.samefile(source, filename):
+            # Samples are read from the file that gets overwritten
+            self.__load_samples()
+
         self.filename = filename
         FileOperator.save_signal(self)
         self.name = os.path.splitext(os.path.basename(filename))[0]
         self.changed = False
-        QApplication.instance().restoreOverrideCursor()
 
     def get_signal_start(self) -> int:
         """
@@ -324,7 +547,14 @@ class Signal(QObject):
         return signal_functions.find_signal_end(self.qad, self.modulation_type)
 
     def quad_demod(self):
-        return signal_functions.afp_demod(self.data, self.noise_threshold, self.modulation_type)
+        if isinstance(self.data, np.ndarray):
+            return signal_functions.afp_demod(self.data, self.noise_threshold, self.modulation_type,
+                                              self.__demod_costa_reset)
+
+        # Samples are created on access, so demodulate them block by block
+        demodulator = ChunkedDemodulator(self.data, self.noise_threshold, self.modulation_type, max_chunks=1,
+                                         costa_reset_noise_samples=self.__demod_costa_reset)
+        return demodulator.get_section(0, self.num_samples)
 
     def calc_noise_threshold(self, noise_start: int, noise_end: int):
         num_digits = 4
@@ -346,17 +576,34 @@ class Signal(QObject):
         if bit_len is None:
             bit_len = signal_functions.estimate_bit_len(self.qad, self.qad_center, self.tolerance, self.modulation_type)
             self.__parameter_cache[self.modulation_type_str]["bit_len"] = bit_len
+            self.__store_cached_parameters()
         return bit_len
 
     def estimate_qad_center(self) -> float:
         center = self.__parameter_cache[self.modulation_type_str]["qad_center"]
         if center is None:
             noise_value = signal_functions.get_noise_for_mod_type(int(self.modulation_type))
-            qad = self.qad[np.where(self.qad > noise_value)] if noise_value < 0 else self.qad
-            center = signal_functions.estimate_qad_center(qad, constants.NUM_CENTERS)
+            min_value = noise_value if noise_value < 0 else -np.inf  # Ignore noise for FSK and PSK
+            block_step = max(1, self.num_samples // self.CENTER_ESTIMATION_SAMPLES)
+            center = signal_functions.estimate_qad_center(self.qad, core_constants.NUM_CENTERS, min_value, block_step)
             self.__parameter_cache[self.modulation_type_str]["qad_center"] = center
+            self.__store_cached_parameters()
         return center
 
+    def __load_cached_parameters(self):
+        if self.__cache is None:
+            return
+
+        cached_parameters = self.__cache.load_parameter_cache(self.noise_threshold)
+        if cached_parameters:
+            for mod, parameters in cached_parameters.items():
+                if mod in self.__parameter_cache:
+                    self.__parameter_cache[mod].update(parameters)
+
+    def __store_cached_parameters(self):
+        if self.__cache is not None:
+            self.__cache.store_parameter_cache(self.__parameter_cache, self.noise_threshold)
+
     def create_new(self, start=0, end=0, new_data=None):
         new_signal = Signal("", "New " + self.name)
 
@@ -404,11 +651,12 @@ class Signal(QObject):
         :param sample_rate: Sample rate of the signal
         :return:
         """
-        data = self.data[start:end]
+        # Double precision like numpy.fft, so the estimate does not depend on the FFT backend
+        data = np.asarray(self.data[start:end], dtype=np.complex128)
 
         try:
-            w = np.fft.fft(data)
-            frequencies = np.fft.fftfreq(len(w))
+            w = FFT.fft(data)
+            frequencies = FFT.fftfreq(len(w))
             idx = np.argmax(np.abs(w))
             freq = frequencies[idx]
             freq_in_hertz = abs(freq * sample_rate)
@@ -419,8 +667,15 @@ class Signal(QObject):
         return freq_in_hertz
 
     def eliminate(self):
+        self.__cache = None
         self._fulldata = None
+        if self.__compressed_file is not None:
+            self.__compressed_file.close()
+            self.__compressed_file = None
         self._qad = None
+        self.__qad_chunks = None
+        self.__pulse_cache = None
+        self.__min_max_pyramids.clear()
         self.parameter_cache.clear()
 
     def silent_set_modulation_type(self, mod_type: int):
@@ -433,18 +688,17 @@ class Signal(QObject):
         self.__invalidate_after_edit()
 
     def delete_range(self, start: int, end: int):
-        mask = np.ones(self.num_samples, dtype=bool)
-        mask[start:end] = False
-
         try:
-            self._fulldata = self._fulldata[mask]
-            self._qad = self._qad[mask] if self._qad is not None else None
+            self._fulldata = np.concatenate((self._fulldata[:start], self._fulldata[end:]))
+            if self._qad is not None:
+                self._qad = np.concatenate((self._qad[:start], self._qad[end:]))
         except IndexError as e:
             logger.warning("Could not delete data: " + str(e))
 
         self.__invalidate_after_edit()
 
     def mute_range(self, start: int, end: int):
+        self.__load_samples()
         self._fulldata[start:end] = 0
         if self._qad is not None:
             self._qad[start:end] = 0
@@ -458,12 +712,35 @@ class Signal(QObject):
         self.__invalidate_after_edit()
 
     def filter_range(self, start: int, end: int, fir_filter: Filter):
+        self.__load_samples()
         self._fulldata[start:end] = fir_filter.apply_fir_filter(self._fulldata[start:end])
-        self._qad[start:end] = signal_functions.afp_demod(self.data[start:end],
-                                                          self.noise_threshold, self.modulation_type)
+        if self._qad is not None and self.modulation_type in (2, 3):
+            # Costas loop state after the range changes as well, so PSK and QAM need a full demodulation
+            self._qad = None
+        elif self._qad is not None and end > start:
+            # Continue from the sample before the range like a demodulation of the whole signal
+            end = min(end + 1, len(self._fulldata))  # FSK uses the previous sample
+            state = None
+            if start > 0:
+                state = signal_functions.DemodulationState(self._fulldata[start - 1], num_samples=start)
+            self._qad[start:end] = signal_functions.afp_demod_chunk(self.data[start:end], self.noise_threshold,
+                                                                    self.modulation_type, state)[0]
         self.__invalidate_after_edit()
 
+    def __load_samples(self):
+        if not isinstance(self._fulldata, np.ndarray):
+            # Samples created on access can not be edited in place
+            self._fulldata = np.asarray(self._fulldata)
+        if self.__compressed_file is not None:
+            self.__compressed_file.close()
+            self.__compressed_file = None
+
     def __invalidate_after_edit(self):
+        self.__qad_chunks = None
+        self.__pulse_cache = None
+        self.__min_max_pyramids.clear()
+        # Data does not match the file anymore, so the disk cache can not be used for this signal
+        self.__cache = None
         self.clear_parameter_cache()
         self.changed = True
         self.data_edited.emit()
@@ -1,16 +1,19 @@
 import math
+import threading
 
 import numpy as np
-from PyQt5.QtGui import QImage
 
 from urh import colormaps
 from urh.cythonext import util
+from urh.signalprocessing.FFT import FFT
 from urh.util.Logger import logger
+from urh.util.TileCache import TileCache
 
 
 class Spectrogram(object):
     MAX_LINES_PER_VIEW = 1000
     DEFAULT_FFT_WINDOW_SIZE = 1024
+    MAX_SEGMENT_CACHE_BYTES = 256 * 1024 ** 2
 
     def __init__(self, samples: np.ndarray, window_size=DEFAULT_FFT_WINDOW_SIZE,
                  overlap_factor=0.5, window_function=np.hanning):
@@ -28,6 +31,10 @@ class Spectrogram(object):
 
         self.data_min, self.data_max = -140, 10
 
+        # dB values of segments, so changing the color range only needs the colormap lookup
+        self.__segment_cache = TileCache(self.MAX_SEGMENT_CACHE_BYTES)
+        self.__segment_cache_lock = threading.Lock()  # segments may be calculated in worker threads
+
     @property
     def samples(self):
         return self.__samples
@@ -35,6 +42,7 @@ class Spectrogram(object):
     @samples.setter
     def samples(self, value):
         self.__samples = value
+        self.clear_segment_cache()
 
     @property
     def window_size(self):
@@ -73,52 +81,116 @@ class Spectrogram(object):
         """
         hop size determines by how many samples the window is advanced
         """
-        return self.window_size - int(self.overlap_factor * self.window_size)
+        return self.calculate_hop_size(self.window_size, self.overlap_factor)
+
+    @staticmethod
+    def calculate_hop_size(window_size: int, overlap_factor: float) -> int:
+        return window_size - int(overlap_factor * window_size)
+
+    def parameters(self) -> tuple:
+        """
+        Return the current (window_size, overlap_factor, window_function).
+        Worker threads get such a snapshot, so changing the parameters meanwhile does not mix them up.
+        """
+        return self.window_size, self.overlap_factor, self.window_function
 
-    def stft(self, samples: np.ndarray):
+    def stft(self, samples: np.ndarray, parameters: tuple = None):
         """
         Perform Short-time Fourier transform to get the spectrogram for the given samples
+
+        :param parameters: (window_size, overlap_factor, window_function) or None for the current parameters
         :return: short-time Fourier transform of the given signal
         """
-        window = self.window_function(self.window_size)
-        hop_size = self.hop_size
+        window_size, overlap_factor, window_function = parameters or self.parameters()
+        window = FFT.get_window(window_function, window_size)
+        hop_size = self.calculate_hop_size(window_size, overlap_factor)
 
-        if len(samples) < self.window_size:
-            samples = np.append(samples, np.zeros(self.window_size - len(samples)))
+        if len(samples) < window_size:
+            samples = np.append(samples, np.zeros(window_size - len(samples)))
 
-        num_frames = max(1, (len(samples) - self.window_size) // hop_size + 1)
+        num_frames = max(1, (len(samples) - window_size) // hop_size + 1)
 
         # Get frames as numpy view with stride_tricks to save RAM
-        # Same as: frames = [padded_samples[i*hop_size:i*hop_size+self.window_size] for i in range(num_frames)]
-        shape = (num_frames, self.window_size)
+        # Same as: frames = [padded_samples[i*hop_size:i*hop_size+window_size] for i in range(num_frames)]
+        shape = (num_frames, window_size)
         strides = (hop_size * samples.strides[-1], samples.strides[-1])
         frames = np.lib.stride_tricks.as_strided(samples, shape=shape, strides=strides)
 
-        result = np.fft.fft(frames * window, self.window_size) / np.atleast_1d(self.window_size)
+        result = FFT.fft(frames * window, window_size) / np.atleast_1d(window_size)
         return result
 
-    def __calculate_spectrogram(self, samples: np.ndarray) -> np.ndarray:
-        # Only shift axis 1 (frequency) and not time
-        spectrogram = np.fft.fftshift(self.stft(samples), axes=(1,))
-        spectrogram = util.arr2decibel(spectrogram.astype(np.complex64))
+    def __calculate_spectrogram(self, samples: np.ndarray, parameters: tuple = None) -> np.ndarray:
+        # Shift frequency axis and flip it so Y axis goes from negative to positive
+        return util.stft_to_decibel(self.stft(samples, parameters))
 
-        # Flip Array so Y axis goes from negative to positive
-        return np.fliplr(spectrogram)
+    def __create_decibel_image(self, spectrogram: np.ndarray, transpose=False):
+        image_data = util.decibel_to_bgra(spectrogram, colormaps.chosen_colormap_numpy_bgra,
+                                          self.data_min, self.data_max, transpose=transpose)
+        return self.bgra_to_image(image_data)
 
     def create_spectrogram_image(self, sample_start: int=None, sample_end: int=None, step: int=None, transpose=False):
         spectrogram = self.__calculate_spectrogram(self.samples[sample_start:sample_end:step])
-        if transpose:
-            spectrogram = np.flipud(spectrogram.T)
-        return self.create_image(spectrogram, colormaps.chosen_colormap_numpy_bgra, self.data_min, self.data_max)
+        return self.__create_decibel_image(spectrogram, transpose=transpose)
+
+    def segment_ranges(self, parameters: tuple = None) -> list:
+        """
+        Return the sample ranges (start, end) of the segments the spectrogram is drawn in
+        """
+        window_size, overlap_factor, _ = parameters or self.parameters()
+        hop_size = self.calculate_hop_size(window_size, overlap_factor)
+        time_bins = int(math.ceil(len(self.samples) / hop_size))
+
+        n_segments = max(1, time_bins // self.MAX_LINES_PER_VIEW)
+        step = time_bins / n_segments
+        step = max(1, int((step / hop_size) * hop_size ** 2))
+
+        return [(i, min(i + step, len(self.samples))) for i in range(0, len(self.samples), step)]
+
+    def segment_width(self, start: int, end: int, parameters: tuple = None) -> int:
+        """
+        Return the number of time bins of the segment from start to end
+        """
+        window_size, overlap_factor, _ = parameters or self.parameters()
+        hop_size = self.calculate_hop_size(window_size, overlap_factor)
+        return max(1, (max(end - start, window_size) - window_size) // hop_size + 1)
+
+    def has_segment(self, start: int, end: int, parameters: tuple = None) -> bool:
+        with self.__segment_cache_lock:
+            return self.__segment_key(start, end, parameters or self.parameters()) in self.__segment_cache
+
+    def get_segment(self, start: int, end: int, parameters: tuple = None) -> np.ndarray:
+        """
+        Return the spectrogram in dB of the samples from start to end.
+        Segments are cached per window size, overlap and window function.
+
+        :param parameters: snapshot from parameters() the segment is calculated with, None for the current ones
+        """
+        parameters = parameters or self.parameters()
+        key = self.__segment_key(start, end, parameters)
+        with self.__segment_cache_lock:
+            spectrogram = self.__segment_cache.get(key)
+
+        if spectrogram is None:
+            spectrogram = self.__calculate_spectrogram(self.samples[start:end], parameters)
+            with self.__segment_cache_lock:
+                self.__segment_cache.put(key, spectrogram, spectrogram.nbytes)
+
+        return spectrogram
+
+    def create_segment_image(self, start: int, end: int, parameters: tuple = None):
+        return self.__create_decibel_image(self.get_segment(start, end, parameters))
 
     def create_image_segments(self):
-        n_segments = max(1, self.time_bins // self.MAX_LINES_PER_VIEW)
-        step = self.time_bins / n_segments
-        step = max(1, int((step / self.hop_size) * self.hop_size ** 2))
+        for start, end in self.segment_ranges():
+            yield self.create_segment_image(start, end)
 
-        for i in range(0, len(self.samples), step):
-            image = self.create_spectrogram_image(sample_start=i, sample_end=i+step)
-            yield image
+    def clear_segment_cache(self):
+        with self.__segment_cache_lock:
+            self.__segment_cache.clear()
+
+    @staticmethod
+    def __segment_key(start: int, end: int, parameters: tuple) -> tuple:
+        return parameters + (start, end)
 
     @staticmethod
     def apply_bgra_lookup(data: np.ndarray, colormap, data_min=None, data_max=None, normalize=True) -> np.ndarray:
@@ -133,14 +205,25 @@ class Spectrogram(object):
         return np.take(colormap, normalized_values.astype(np.int), axis=0, mode='clip')
 
     @staticmethod
-    def create_image(data: np.ndarray, colormap, data_min=None, data_max=None, normalize=True) -> QImage:
+    def create_image(data: np.ndarray, colormap, data_min=None, data_max=None, normalize=True):
         """
         Create QImage from ARGB array.
         The ARGB must have shape (width, height, 4) and dtype=ubyte.
         NOTE: The order of values in the 3rd axis must be (blue, green, red, alpha).
-        :return:
+        :rtype: QImage
         """
         image_data = Spectrogram.apply_bgra_lookup(data, colormap, data_min, data_max, normalize)
+        return Spectrogram.bgra_to_image(image_data)
+
+    @staticmethod
+    def bgra_to_image(image_data: np.ndarray):
+        """
+        Create QImage from BGRA array of shape (height, width, 4) and dtype=ubyte
+
+        :rtype: QImage
+        """
+        # Only images need Qt, so spectrograms can be calculated without it
+        from PyQt5.QtGui import QImage
 
         if not image_data.flags['C_CONTIGUOUS']:
             logger.debug("Array was not C_CONTIGUOUS. Converting it.")
@@ -157,7 +240,7 @@ class Spectrogram(object):
         return image
 
     @staticmethod
-    def create_colormap_image(colormap_name: str, height=100) -> QImage:
+    def create_colormap_image(colormap_name: str, height=100):
         colormap = colormaps.calculate_numpy_brga_for(colormap_name)
 
         indices = np.zeros((len(colormap), height), dtype=np.int64)
@@ -1,3 +1,4 @@
+from urh.cythonext import path_creator
 from urh.ui.painting.SceneManager import SceneManager
 from urh.util.RingBuffer import RingBuffer
 
@@ -20,6 +21,10 @@ class ContinuousSceneManager(SceneManager):
     def plot_data(self, value):
         pass
 
+    @property
+    def num_samples(self):
+        return self.ring_buffer.size
+
     @property
     def end(self):
         return self.ring_buffer.size
@@ -27,3 +32,17 @@ class ContinuousSceneManager(SceneManager):
     @end.setter
     def end(self, value):
         pass
+
+    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None, num_pixels=None):
+        # Draw both segments of the ring buffer in place instead of concatenating them on every refresh
+        start, end = max(0, int(x1)), min(self.num_samples, int(x2))
+        paths, offset = [], 0
+        for segment in self.ring_buffer.view_segments:
+            seg_start, seg_end = max(start - offset, 0), min(end - offset, len(segment))
+            if seg_start < seg_end:
+                path = path_creator.create_path(segment.real, seg_start, seg_end)[0]
+                path.translate(offset, 0)
+                paths.append(path)
+            offset += len(segment)
+
+        self.set_path(paths)
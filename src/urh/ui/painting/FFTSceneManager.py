@@ -20,7 +20,7 @@ class FFTSceneManager(SceneManager):
         self.peak_item = self.scene.addPath(QPainterPath(),
                                             QPen(constants.PEAK_COLOR, Qt.FlatCap))  # type: QGraphicsPathItem
 
-    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None):
+    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None, num_pixels=None):
         start = int(x1) if x1 > 0 else 0
         end = int(x2) if x2 < self.num_samples else self.num_samples
         paths = path_creator.create_path(np.log10(self.plot_data), start, end)
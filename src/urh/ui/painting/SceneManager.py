@@ -33,7 +33,22 @@ class SceneManager(QObject):
     def num_samples(self):
         return len(self.plot_data)
 
-    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None):
+    @property
+    def min_max_pyramid(self):
+        """
+        Min/max pyramid of plot_data for drawing zoomed out sections, None to always scan the samples
+
+        :rtype: urh.util.MinMaxPyramid.MinMaxPyramid
+        """
+        return None
+
+    def get_tile_source(self):
+        """
+        Return the samples and their min/max pyramid (or None) for rendering tiles of the current scene
+        """
+        return self.plot_data, self.min_max_pyramid
+
+    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None, num_pixels=None):
         """
 
         :param x1: start of section to show
@@ -42,13 +57,40 @@ class SceneManager(QObject):
         :type subpath_ranges: list of tuple
         :param colors: for coloring the subpaths
         :type color: list of QColor
+        :param num_pixels: width of the view the section is shown in, default is constants.PIXELS_PER_PATH
         :return:
         """
-        paths = path_creator.create_path(self.plot_data, start=self.__limit_value(x1),
-                                         end=self.__limit_value(x2),
-                                         subpath_ranges=subpath_ranges)
+        start, end = self.__limit_value(x1), self.__limit_value(x2)
+        num_pixels = num_pixels or constants.PIXELS_PER_PATH
+        pyramid = self.min_max_pyramid
+        section = pyramid.get_section(start, end, num_pixels) if pyramid is not None else None
+
+        if section is None:
+            paths = self.__create_path(start, end, subpath_ranges)
+        else:
+            # Drawing from the pyramid costs O(pixels) regardless of the number of samples in the section
+            x, values = section
+            paths = []
+            for sub_start, sub_end in [(start, end)] if subpath_ranges is None else subpath_ranges:
+                i = max(0, np.searchsorted(x, sub_start, side="right") - 2)
+                j = np.searchsorted(x, sub_end, side="left") + 2
+                paths.append(path_creator.array_to_QPath(x[i:j], values[i:j]))
+
         self.set_path(paths, colors=colors)
 
+    def __create_path(self, start: int, end: int, subpath_ranges=None) -> list:
+        if isinstance(self.plot_data, np.ndarray):
+            return path_creator.create_path(self.plot_data, start=start, end=end, subpath_ranges=subpath_ranges)
+
+        # Samples are created on access (e.g. decompressed), so only take the shown ones
+        samples = np.ascontiguousarray(self.plot_data[start:end], dtype=np.float32)
+        if subpath_ranges is not None:
+            subpath_ranges = [(sub_start - start, sub_end - start) for sub_start, sub_end in subpath_ranges]
+        paths = path_creator.create_path(samples, start=0, end=end - start, subpath_ranges=subpath_ranges)
+        for path in paths:
+            path.translate(start, 0)
+        return paths
+
     def set_path(self, paths: list, colors=None):
         self.clear_path()
         colors = [constants.LINECOLOR] * len(paths) if colors is None else colors
@@ -69,7 +111,8 @@ class SceneManager(QObject):
             return
 
         if math.isnan(self.minimum) or math.isnan(self.maximum):
-            minimum, maximum = util.minmax(self.plot_data)
+            pyramid = self.min_max_pyramid
+            minimum, maximum = util.minmax(self.plot_data) if pyramid is None else pyramid.minmax()
         else:
             minimum, maximum = self.minimum, self.maximum
 
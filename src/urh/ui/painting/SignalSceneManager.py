@@ -1,5 +1,3 @@
-import numpy as np
-
 from urh.cythonext import signalFunctions
 from urh.signalprocessing.Signal import Signal
 from urh.ui.painting.SceneManager import SceneManager
@@ -11,9 +9,22 @@ class SignalSceneManager(SceneManager):
         self.signal = signal
         self.scene_type = 0  # 0 = Analog Signal, 1 = QuadDemodView
 
-    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None):
+    @property
+    def min_max_pyramid(self):
+        return self.signal.get_min_max_pyramid("real" if self.scene_type == 0 else "qad")
+
+    def get_tile_source(self):
+        if self.signal is None:
+            return None, None
+
+        # The demodulated view uses the complete qad instead of Signal.get_qad_section,
+        # because its min/max pyramid for zoomed out tiles spans the whole signal
+        self.plot_data = self.signal.real_plot_data if self.scene_type == 0 else self.signal.qad
+        return super().get_tile_source()
+
+    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None, num_pixels=None):
         self.plot_data = self.signal.real_plot_data if self.scene_type == 0 else self.signal.qad
-        super().show_scene_section(x1, x2, subpath_ranges=subpath_ranges, colors=colors)
+        super().show_scene_section(x1, x2, subpath_ranges=subpath_ranges, colors=colors, num_pixels=num_pixels)
 
     def init_scene(self):
         stored_minimum, stored_maximum = self.minimum, self.maximum
@@ -26,7 +37,7 @@ class SignalSceneManager(SceneManager):
             # Bypass Min/Max calculation
             if noise_val == 0:
                 # ASK
-                self.minimum, self.maximum = 0, self.padding * np.max(self.signal.qad)
+                self.minimum, self.maximum = 0, self.padding * self.signal.get_min_max_pyramid("qad").minmax()[1]
             else:
                 self.minimum, self.maximum = 0, self.padding * noise_val
 
@@ -1,6 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtWidgets import QGraphicsPixmapItem, QApplication
+from PyQt5.QtCore import pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtWidgets import QGraphicsPixmapItem
 
 from urh.signalprocessing.Spectrogram import Spectrogram
 from urh.ui.painting.SceneManager import SceneManager
@@ -8,15 +12,35 @@ from urh.ui.painting.SpectrogramScene import SpectrogramScene
 
 
 class SpectrogramSceneManager(SceneManager):
+    __executor = None
+
+    # generation, x position, image; object keeps the numpy buffer of the image alive
+    segment_finished = pyqtSignal(int, int, object)
+
     def __init__(self, samples, parent):
         super().__init__(parent)
 
         self.samples_need_update = True
+        self.__generation = 0  # increased on redraw, so results of outdated calculations get dropped
+        self.__pending = []  # futures of segments being calculated
+
+        # Emitted from worker threads, so the slot runs queued in the GUI thread
+        self.segment_finished.connect(self.on_segment_finished)
 
         self.scene.clear()
         self.spectrogram = Spectrogram(samples)
         self.scene = SpectrogramScene()
 
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls.__executor is None:
+            cls.__executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return cls.__executor
+
+    @property
+    def num_pending_segments(self) -> int:
+        return sum(1 for future in self.__pending if not future.done())
+
     @property
     def num_samples(self):
         return len(self.spectrogram.samples)
@@ -45,32 +69,71 @@ class SpectrogramSceneManager(SceneManager):
 
         return redraw_needed
 
-    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None):
+    def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None, num_pixels=None):
         pass
 
     def update_scene_rect(self):
         self.scene.setSceneRect(0, 0, self.spectrogram.time_bins, self.spectrogram.freq_bins)
 
     def show_full_scene(self):
+        """
+        Draw the spectrogram segments. Cached segments are drawn immediately, the others are
+        calculated in worker threads and appear as soon as they are finished.
+        """
+        self.__cancel_pending()
+        self.__generation += 1
+
         for item in self.scene.items():
             if isinstance(item, QGraphicsPixmapItem):
                 self.scene.removeItem(item)
 
+        # Segments of this redraw are calculated and cached with the parameters at submission time
+        parameters = self.spectrogram.parameters()
+
         x_pos = 0
-        for image in self.spectrogram.create_image_segments():
-            item = self.scene.addPixmap(QPixmap.fromImage(image))
-            item.setPos(x_pos, 0)
-            x_pos += image.width()
-            QApplication.instance().processEvents()
+        for start, end in self.spectrogram.segment_ranges(parameters):
+            if self.spectrogram.has_segment(start, end, parameters):
+                self.__add_segment(x_pos, self.spectrogram.create_segment_image(start, end, parameters))
+            else:
+                self.__pending.append(self.executor().submit(self.__calculate_segment, self.spectrogram, parameters,
+                                                             self.__generation, x_pos, start, end))
+            x_pos += self.spectrogram.segment_width(start, end, parameters)
 
         # Estimated time_bins from update_scene_rect may be too many for small signals so we update the scene rect
-        # after we know how wide the spectrogram actually is
+        # with the actual width of the spectrogram
         self.scene.setSceneRect(0, 0, x_pos, self.spectrogram.freq_bins)
 
+    def __calculate_segment(self, spectrogram: Spectrogram, parameters: tuple, generation: int,
+                            x_pos: int, start: int, end: int):
+        image = spectrogram.create_segment_image(start, end, parameters)
+        try:
+            self.segment_finished.emit(generation, x_pos, image)
+        except RuntimeError:
+            # Scene manager was deleted while calculating
+            pass
+
+    def __add_segment(self, x_pos: int, image: QImage):
+        item = self.scene.addPixmap(QPixmap.fromImage(image))
+        item.setPos(x_pos, 0)
+
+    def __cancel_pending(self):
+        for future in self.__pending:
+            future.cancel()
+        self.__pending.clear()
+
     def init_scene(self, apply_padding=True):
         pass
 
+    @pyqtSlot(int, int, object)
+    def on_segment_finished(self, generation: int, x_pos: int, image: QImage):
+        if generation != self.__generation or self.spectrogram is None:
+            return
+
+        self.__add_segment(x_pos, image)
+
     def eliminate(self):
+        self.__cancel_pending()
+        self.__generation += 1
         self.spectrogram.samples = None
         self.spectrogram = None
         super().eliminate()
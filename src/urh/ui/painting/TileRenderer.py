@@ -0,0 +1,232 @@
+import itertools
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, Qt, QRectF
+from PyQt5.QtGui import QImage, QPainter, QPen
+
+from urh import constants
+from urh.cythonext import path_creator
+from urh.util.MinMaxPyramid import MinMaxPyramid
+from urh.util.TileCache import TileCache
+
+
+class TileRenderer(QObject):
+    """
+    Render a plot as horizontal tiles of fixed pixel width to QImages in worker threads.
+
+    The tiles of a zoom level cover TILE_WIDTH * 2 ** zoom samples, so panning and
+    zooming back to a level reuses the cached tiles. Missing tiles are rendered in the
+    background and tile_ready is emitted once they are available; until then the tiles
+    of the previous frame are drawn in their place.
+    """
+
+    TILE_WIDTH = 256  # pixels
+    MAX_TILE_HEIGHT = 2048  # pixels
+    MAX_CACHE_BYTES = 128 * 1024 ** 2
+
+    # Shared by all renderers, so the memory budget holds for the whole application
+    cache = TileCache(MAX_CACHE_BYTES)
+
+    __executor = None
+    __tokens = itertools.count()
+
+    tile_ready = pyqtSignal()
+    __tile_rendered = pyqtSignal(object, object)  # key, QImage
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__source = None
+        self.__plot_data = None  # type: np.ndarray
+        self.__pyramid = None  # type: MinMaxPyramid
+        self.__token = next(TileRenderer.__tokens)
+        self.__pending = dict()  # key -> future
+        self.__last_drawn = []  # (target rect, image) of previous frame for missing tiles
+
+        # Emitted from worker threads, so the slot runs queued in the thread of the renderer
+        self.__tile_rendered.connect(self.on_tile_rendered)
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls.__executor is None:
+            cls.__executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return cls.__executor
+
+    @classmethod
+    def zoom_for(cls, samples_per_pixel: float) -> int:
+        return int(round(math.log2(samples_per_pixel)))
+
+    @classmethod
+    def tile_samples(cls, zoom: int) -> float:
+        return cls.TILE_WIDTH * 2.0 ** zoom
+
+    @property
+    def num_pending(self) -> int:
+        return len(self.__pending)
+
+    def set_source(self, plot_data: np.ndarray, pyramid: MinMaxPyramid = None):
+        """
+        Set the samples to render. The cached tiles are dropped, when the samples changed.
+
+        :param pyramid: min/max pyramid of plot_data, if None one is created
+        """
+        source = plot_data if pyramid is None else pyramid
+        if source is self.__source:
+            return
+
+        self.clear()
+        self.__source = source
+        self.__plot_data = plot_data
+        self.__pyramid = MinMaxPyramid(plot_data) if pyramid is None else pyramid
+
+    def draw(self, painter: QPainter, start: float, end: float, samples_per_pixel: float,
+             height: int, scene_rect: QRectF, get_ranges_and_colors=None):
+        """
+        Draw the tiles covering samples start to end in scene coordinates and request missing tiles
+
+        :param samples_per_pixel: current horizontal zoom of the view
+        :param height: height of the tiles in pixels
+        :param scene_rect: vertical range of the scene is mapped to height
+        :param get_ranges_and_colors: function returning subpath ranges and colors for a sample range
+        """
+        if self.__plot_data is None or len(self.__plot_data) == 0:
+            return
+
+        zoom = self.zoom_for(samples_per_pixel)
+        tile_samples = self.tile_samples(zoom)
+        height = max(1, min(int(height), self.MAX_TILE_HEIGHT))
+        top, scene_height = scene_rect.top(), scene_rect.height()
+        start, end = max(0, start), min(end, len(self.__plot_data))
+
+        wanted = set()
+        drawn, missing = [], []
+        for index in range(int(start // tile_samples), int(end // tile_samples) + 1):
+            tile_start = index * tile_samples
+            tile_end = tile_start + tile_samples
+            if get_ranges_and_colors is None:
+                ranges, colors = None, None
+            else:
+                ranges, colors = get_ranges_and_colors(tile_start, tile_end)
+
+            key = (self.__token, zoom, index, height, top, scene_height, self.__colors_key(ranges, colors))
+            target = QRectF(tile_start, top, tile_samples, scene_height)
+            image = self.cache.get(key)
+            if image is not None:
+                drawn.append((target, image))
+                continue
+
+            wanted.add(key)
+            missing.append(target)
+            if key not in self.__pending:
+                self.__pending[key] = self.executor().submit(self.__render, key, self.__plot_data, self.__pyramid,
+                                                             tile_start, tile_end, height, top, scene_height,
+                                                             ranges, colors)
+
+        # Drop outdated requests, e.g. from zoom levels that were scrolled through
+        for key in [key for key in self.__pending if key not in wanted]:
+            self.__pending.pop(key).cancel()
+
+        placeholders = [(rect, image) for rect, image in self.__last_drawn
+                        if any(rect.intersects(target) for target in missing)]
+        for target in missing:
+            painter.save()
+            painter.setClipRect(target, Qt.IntersectClip)
+            for rect, image in placeholders:
+                if rect.intersects(target):
+                    painter.drawImage(rect, image)
+            painter.restore()
+
+        for target, image in drawn:
+            painter.drawImage(target, image)
+
+        self.__last_drawn = placeholders + drawn
+
+    def clear(self):
+        for future in self.__pending.values():
+            future.cancel()
+        self.__pending.clear()
+        self.__last_drawn = []
+
+        token = self.__token
+        self.cache.discard_where(lambda key: key[0] == token)
+        self.__token = next(TileRenderer.__tokens)
+
+    def eliminate(self):
+        self.clear()
+        self.__source = self.__plot_data = self.__pyramid = None
+
+    @staticmethod
+    def render_tile(plot_data: np.ndarray, pyramid: MinMaxPyramid, tile_start: float, tile_end: float,
+                    width: int, height: int, top: float, scene_height: float,
+                    subpath_ranges=None, colors=None) -> QImage:
+        """
+        Render samples tile_start to tile_end to a transparent image.
+        Uncolored subpaths are drawn in LINECOLOR below the colored ones.
+
+        :param top: scene y coordinate of the top of the image
+        :param scene_height: scene height covered by the image
+        """
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        samples_per_pixel = (tile_end - tile_start) / width
+        margin = 2 * int(math.ceil(samples_per_pixel)) + 2  # continue lines across tile borders
+        start = max(0, int(tile_start) - margin)
+        end = min(len(plot_data), int(math.ceil(tile_end)) + margin)
+        if end <= start:
+            return image
+
+        level = pyramid.level_for(samples_per_pixel) if pyramid is not None else -1
+        if level == -1:
+            x = np.arange(start, end, dtype=np.int64)
+            values = np.ascontiguousarray(plot_data[start:end], dtype=np.float32)
+        else:
+            x, values = pyramid.get_blocks(level, start, end)
+
+        if subpath_ranges is None:
+            subpath_ranges, colors = [(start, end)], [None]
+        subpaths = sorted(zip(subpath_ranges, colors), key=lambda subpath: subpath[1] is not None)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(width / (tile_end - tile_start), height / scene_height)
+        painter.translate(-tile_start, -top)
+        for (sub_start, sub_end), color in subpaths:
+            if sub_end < start or sub_start > end:
+                continue
+
+            i = max(0, np.searchsorted(x, sub_start, side="right") - 2)
+            j = np.searchsorted(x, sub_end, side="left") + 2
+            pen = QPen(color if color else constants.LINECOLOR, 0)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawPath(path_creator.array_to_QPath(x[i:j], values[i:j]))
+        painter.end()
+
+        return image
+
+    def __render(self, key, plot_data, pyramid, tile_start, tile_end, height, top, scene_height, ranges, colors):
+        image = self.render_tile(plot_data, pyramid, tile_start, tile_end, self.TILE_WIDTH, height, top, scene_height,
+                                 subpath_ranges=ranges, colors=colors)
+        try:
+            self.__tile_rendered.emit(key, image)
+        except RuntimeError:
+            # Renderer was deleted while the tile was rendered
+            pass
+
+    @staticmethod
+    def __colors_key(ranges, colors):
+        if ranges is None:
+            return None
+        return tuple(ranges), tuple(color.rgba() if color else None for color in colors)
+
+    @pyqtSlot(object, object)
+    def on_tile_rendered(self, key, image: QImage):
+        self.__pending.pop(key, None)
+        if key[0] != self.__token:
+            return  # Samples changed while rendering
+
+        self.cache.put(key, image, image.bytesPerLine() * image.height())
+        self.tile_ready.emit()
@@ -288,6 +288,49 @@ class Ui_DialogOptions(object):
         self.gridLayout_5.addWidget(self.labelRebuildNativeStatus, 3, 2, 1, 1)
         self.verticalLayout_8.addWidget(self.groupBoxNativeOptions)
         self.tabWidget.addTab(self.tabDevices, "")
+        self.tabPerformance = QtWidgets.QWidget()
+        self.tabPerformance.setObjectName("tabPerformance")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.tabPerformance)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.groupBoxDemodulation = QtWidgets.QGroupBox(self.tabPerformance)
+        self.groupBoxDemodulation.setObjectName("groupBoxDemodulation")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.groupBoxDemodulation)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.labelCostaResetNoiseSamples = QtWidgets.QLabel(self.groupBoxDemodulation)
+        self.labelCostaResetNoiseSamples.setObjectName("labelCostaResetNoiseSamples")
+        self.gridLayout_6.addWidget(self.labelCostaResetNoiseSamples, 0, 0, 1, 1)
+        self.spinBoxCostaResetNoiseSamples = QtWidgets.QSpinBox(self.groupBoxDemodulation)
+        self.spinBoxCostaResetNoiseSamples.setMaximum(999999999)
+        self.spinBoxCostaResetNoiseSamples.setObjectName("spinBoxCostaResetNoiseSamples")
+        self.gridLayout_6.addWidget(self.spinBoxCostaResetNoiseSamples, 0, 1, 1, 1)
+        self.verticalLayout_9.addWidget(self.groupBoxDemodulation)
+        self.groupBoxSignalCache = QtWidgets.QGroupBox(self.tabPerformance)
+        self.groupBoxSignalCache.setObjectName("groupBoxSignalCache")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.groupBoxSignalCache)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.checkBoxUseSignalCache = QtWidgets.QCheckBox(self.groupBoxSignalCache)
+        self.checkBoxUseSignalCache.setObjectName("checkBoxUseSignalCache")
+        self.gridLayout_7.addWidget(self.checkBoxUseSignalCache, 0, 0, 1, 2)
+        self.labelSignalCacheSize = QtWidgets.QLabel(self.groupBoxSignalCache)
+        self.labelSignalCacheSize.setObjectName("labelSignalCacheSize")
+        self.gridLayout_7.addWidget(self.labelSignalCacheSize, 1, 0, 1, 1)
+        self.spinBoxSignalCacheSize = QtWidgets.QSpinBox(self.groupBoxSignalCache)
+        self.spinBoxSignalCacheSize.setMinimum(16)
+        self.spinBoxSignalCacheSize.setMaximum(1048576)
+        self.spinBoxSignalCacheSize.setSingleStep(256)
+        self.spinBoxSignalCacheSize.setProperty("value", 1024)
+        self.spinBoxSignalCacheSize.setObjectName("spinBoxSignalCacheSize")
+        self.gridLayout_7.addWidget(self.spinBoxSignalCacheSize, 1, 1, 1, 1)
+        self.labelSignalCacheUsage = QtWidgets.QLabel(self.groupBoxSignalCache)
+        self.labelSignalCacheUsage.setObjectName("labelSignalCacheUsage")
+        self.gridLayout_7.addWidget(self.labelSignalCacheUsage, 2, 0, 1, 1)
+        self.btnClearSignalCache = QtWidgets.QPushButton(self.groupBoxSignalCache)
+        self.btnClearSignalCache.setObjectName("btnClearSignalCache")
+        self.gridLayout_7.addWidget(self.btnClearSignalCache, 2, 1, 1, 1)
+        self.verticalLayout_9.addWidget(self.groupBoxSignalCache)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_9.addItem(spacerItem3)
+        self.tabWidget.addTab(self.tabPerformance, "")
         self.verticalLayout_6.addWidget(self.tabWidget)
 
         self.retranslateUi(DialogOptions)
@@ -356,5 +399,19 @@ class Ui_DialogOptions(object):
         self.lineEditLibDirs.setPlaceholderText(_translate("DialogOptions", "Comma separated list of additional library directories"))
         self.labelRebuildNativeStatus.setText(_translate("DialogOptions", "Rebuild <x> new device extensions. Please restart URH to use them."))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabDevices), _translate("DialogOptions", "Device"))
+        self.groupBoxDemodulation.setTitle(_translate("DialogOptions", "Demodulation"))
+        self.labelCostaResetNoiseSamples.setToolTip(_translate("DialogOptions", "<html><head/><body><p>Reset the carrier recovery of PSK and QAM after this many noise samples. Bursts between such pauses are demodulated in parallel, which is much faster for signals with many bursts.</p><p><span style=\" font-weight:600;\">Note:</span> After a reset the carrier recovery may lock on with opposite phase, so the bits of a burst can be inverted.</p></body></html>"))
+        self.labelCostaResetNoiseSamples.setText(_translate("DialogOptions", "Demodulate PSK/QAM bursts separately after noise of:"))
+        self.spinBoxCostaResetNoiseSamples.setToolTip(_translate("DialogOptions", "<html><head/><body><p>Reset the carrier recovery of PSK and QAM after this many noise samples. Bursts between such pauses are demodulated in parallel, which is much faster for signals with many bursts.</p><p><span style=\" font-weight:600;\">Note:</span> After a reset the carrier recovery may lock on with opposite phase, so the bits of a burst can be inverted.</p></body></html>"))
+        self.spinBoxCostaResetNoiseSamples.setSpecialValueText(_translate("DialogOptions", "Never"))
+        self.spinBoxCostaResetNoiseSamples.setSuffix(_translate("DialogOptions", " samples"))
+        self.groupBoxSignalCache.setTitle(_translate("DialogOptions", "Signal cache"))
+        self.checkBoxUseSignalCache.setToolTip(_translate("DialogOptions", "<html><head/><body><p>Store demodulated data, detected parameters and noise threshold of opened signal files on disk, so they open faster next time.</p><p>When the cache exceeds its maximum size, the least recently used demodulated data gets removed.</p></body></html>"))
+        self.checkBoxUseSignalCache.setText(_translate("DialogOptions", "Cache demodulated signals on disk"))
+        self.labelSignalCacheSize.setText(_translate("DialogOptions", "Maximum cache size:"))
+        self.spinBoxSignalCacheSize.setSuffix(_translate("DialogOptions", " MiB"))
+        self.labelSignalCacheUsage.setText(_translate("DialogOptions", "Currently used: 0 MiB"))
+        self.btnClearSignalCache.setText(_translate("DialogOptions", "Clear cache"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabPerformance), _translate("DialogOptions", "Performance"))
 
 from urh.ui.KillerDoubleSpinBox import KillerDoubleSpinBox
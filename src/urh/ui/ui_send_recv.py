@@ -533,6 +533,9 @@ class Ui_SendRecvDialog(object):
         self.graphicsViewReceive.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.graphicsViewReceive.setObjectName("graphicsViewReceive")
         self.verticalLayout_2.addWidget(self.graphicsViewReceive)
+        self.checkBoxRecordToDisk = QtWidgets.QCheckBox(self.page_receive)
+        self.checkBoxRecordToDisk.setObjectName("checkBoxRecordToDisk")
+        self.verticalLayout_2.addWidget(self.checkBoxRecordToDisk)
         self.stackedWidget.addWidget(self.page_receive)
         self.page_send = QtWidgets.QWidget()
         self.page_send.setObjectName("page_send")
@@ -741,6 +744,8 @@ class Ui_SendRecvDialog(object):
         self.labelNRepeat.setText(_translate("SendRecvDialog", "Repeat:"))
         self.spinBoxNRepeat.setSpecialValueText(_translate("SendRecvDialog", "Infinite"))
         self.btnLockBWSR.setText(_translate("SendRecvDialog", "..."))
+        self.checkBoxRecordToDisk.setToolTip(_translate("SendRecvDialog", "<html><head/><body><p>Stream the received samples to a file instead of keeping them in memory. Only the most recent samples are shown during recording.</p><p>This allows recordings much longer than your RAM permits.</p></body></html>"))
+        self.checkBoxRecordToDisk.setText(_translate("SendRecvDialog", "Record to disk"))
         self.label_7.setText(_translate("SendRecvDialog", "Hint: You can edit the raw signal before sending."))
         self.btnAccept.setToolTip(_translate("SendRecvDialog", "<html><head/><body><p>Accept the sniffed data and load it into <span style=\" font-weight:600;\">Analysis</span> tab.</p></body></html>"))
         self.btnAccept.setText(_translate("SendRecvDialog", "Accept data (Open in Analysis)"))
@@ -21,6 +21,7 @@ class EpicGraphicView(EditableGraphicView):
         self.participants_assign_enabled = True
         self.cache_qad = True
         self.y_sep = 0
+        self.tile_rendering = True
 
         self.save_action = QAction(self.tr("Save"), self)  # type: QAction
         self.save_action.setIcon(QIcon.fromTheme("document-save"))
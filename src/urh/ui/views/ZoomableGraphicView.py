@@ -1,8 +1,9 @@
-from PyQt5.QtCore import QTimer, pyqtSlot, Qt, pyqtSignal
-from PyQt5.QtGui import QIcon, QKeySequence, QWheelEvent, QCursor, QContextMenuEvent
+from PyQt5.QtCore import QTimer, pyqtSlot, Qt, pyqtSignal, QRectF
+from PyQt5.QtGui import QIcon, QKeySequence, QWheelEvent, QCursor, QContextMenuEvent, QPainter
 from PyQt5.QtWidgets import QAction, QMenu
 
 from urh.ui.painting.SceneManager import SceneManager
+from urh.ui.painting.TileRenderer import TileRenderer
 from urh.ui.views.SelectableGraphicView import SelectableGraphicView
 from urh.util.Logger import logger
 
@@ -52,6 +53,21 @@ class ZoomableGraphicView(SelectableGraphicView):
 
         self.scene_x_zoom_stretch = 1
 
+        # Draw the plot from cached tiles rendered in background instead of scene path items
+        self.tile_rendering = False
+        self.tile_renderer = None  # type: TileRenderer
+
+    @property
+    def scene_type(self):
+        return self.__scene_type
+
+    @scene_type.setter
+    def scene_type(self, value: int):
+        self.__scene_type = value
+        if self.scene_manager is not None:
+            # Tiles are drawn from the scene manager outside of redraw_view, so keep it in sync right away
+            self.scene_manager.scene_type = value
+
     @property
     def y_center(self):
         try:
@@ -173,16 +189,47 @@ class ZoomableGraphicView(SelectableGraphicView):
             if reinitialize:
                 self.scene_manager.init_scene()
 
+            if self.tile_rendering:
+                # Tiles are composited in drawBackground
+                self.scene_manager.clear_path()
+                self.viewport().update()
+                return
+
             vr = self.view_rect()
             start, end = vr.x(), vr.x() + vr.width()
-            self.scene_manager.show_scene_section(start, end, *self._get_sub_path_ranges_and_colors(start, end))
+            self.scene_manager.show_scene_section(start, end, *self._get_sub_path_ranges_and_colors(start, end),
+                                                  num_pixels=self.viewport().width())
 
     def _get_sub_path_ranges_and_colors(self, start: float, end: float):
         # Overwritten in Epic Graphic View
         return None, None
 
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        super().drawBackground(painter, rect)
+
+        if self.tile_rendering and self.scene_manager is not None:
+            self.__draw_tiles(painter)
+
+    def __draw_tiles(self, painter: QPainter):
+        if self.tile_renderer is None:
+            self.tile_renderer = TileRenderer(self)
+            self.tile_renderer.tile_ready.connect(self.viewport().update)
+
+        plot_data, pyramid = self.scene_manager.get_tile_source()
+        if plot_data is None or self.transform().m11() <= 0:
+            return
+
+        self.tile_renderer.set_source(plot_data, pyramid)
+        vr = self.view_rect()
+        scene_rect = self.sceneRect()
+        self.tile_renderer.draw(painter, vr.x(), vr.x() + vr.width(), samples_per_pixel=1 / self.transform().m11(),
+                                height=round(scene_rect.height() * self.transform().m22()), scene_rect=scene_rect,
+                                get_ranges_and_colors=self._get_sub_path_ranges_and_colors)
+
     def eliminate(self):
         self.redraw_timer.stop()
+        if self.tile_renderer is not None:
+            self.tile_renderer.eliminate()
         super().eliminate()
 
     @pyqtSlot()
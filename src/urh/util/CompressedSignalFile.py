@@ -0,0 +1,189 @@
+import bz2
+import json
+import lzma
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class CompressedSignalFile(object):
+    """
+    Seekable container for compressed complex signals (.coco).
+
+    The samples are split into fixed size chunks which are compressed independently,
+    so they can be compressed in parallel and a range of samples can be read
+    without decompressing the whole file.
+
+    Layout:
+        MAGIC | header length (uint32) | JSON header | chunk_0 ... chunk_n | index | index offset (uint64) | MAGIC
+
+    The index holds offset and compressed length (both uint64) for every chunk.
+    """
+
+    MAGIC = b"URHCOCO1"
+    VERSION = 1
+    CODECS = OrderedDict([("zlib", zlib), ("lzma", lzma), ("bz2", bz2)])
+    DEFAULT_CODEC = "zlib"
+    DEFAULT_CHUNK_SIZE = 2 ** 20  # samples per chunk
+    DTYPE = np.complex64
+
+    __FOOTER_SIZE = 8 + len(MAGIC)
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.__file = open(filename, "rb")
+        self.__file_lock = threading.Lock()  # chunks may be read from several threads
+
+        try:
+            if self.__file.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError("{} is not a compressed signal file".format(filename))
+
+            header_len = struct.unpack("<I", self.__file.read(4))[0]
+            self.header = json.loads(self.__file.read(header_len).decode("utf-8"))
+            if self.header["codec"] not in self.CODECS:
+                raise ValueError("Unknown codec {}".format(self.header["codec"]))
+
+            self.__file.seek(-self.__FOOTER_SIZE, os.SEEK_END)
+            index_offset = struct.unpack("<Q", self.__file.read(8))[0]
+            self.__file.seek(index_offset)
+            num_chunks = self.__num_chunks(self.num_samples, self.chunk_size)
+            self.index = np.frombuffer(self.__file.read(16 * num_chunks), dtype="<u8").reshape((num_chunks, 2))
+        except Exception:
+            self.__file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.__file.close()
+
+    @property
+    def num_samples(self) -> int:
+        return self.header["num_samples"]
+
+    @property
+    def chunk_size(self) -> int:
+        return self.header["chunk_size"]
+
+    @property
+    def sample_rate(self) -> float:
+        return self.header["sample_rate"]
+
+    @property
+    def parameters(self) -> dict:
+        """
+        Signal parameters (e.g. modulation type or bit length) stored with the samples
+
+        :rtype: dict
+        """
+        return self.header["parameters"]
+
+    def read_chunk(self, chunk_index: int) -> bytes:
+        offset, length = self.index[chunk_index]
+        with self.__file_lock:
+            self.__file.seek(int(offset))
+            return self.__file.read(int(length))
+
+    def read(self, start=0, end=None, out: np.ndarray = None, num_workers: int = None) -> np.ndarray:
+        """
+        Read samples from start to end. Only the chunks covering this range get decompressed.
+
+        :param out: Optional complex64 buffer with at least end - start samples the result is written to
+        :param num_workers: Number of threads for decompression, default is number of CPUs
+        :return: The samples
+        """
+        end = self.num_samples if end is None else min(end, self.num_samples)
+        start = max(0, min(start, end))
+
+        if out is None:
+            out = np.empty(end - start, dtype=self.DTYPE)
+        elif len(out) < end - start:
+            raise ValueError("Output buffer too small for {} samples".format(end - start))
+
+        chunk_size = self.chunk_size
+        codec = self.CODECS[self.header["codec"]]
+        chunks = range(start // chunk_size, self.__num_chunks(end, chunk_size))
+
+        def decompress(chunk_index: int, compressed: bytes):
+            chunk = np.frombuffer(codec.decompress(compressed), dtype=self.DTYPE)
+            chunk_start = chunk_index * chunk_size
+            lo, hi = max(start, chunk_start), min(end, chunk_start + len(chunk))
+            out[lo - start:hi - start] = chunk[lo - chunk_start:hi - chunk_start]
+
+        # The stdlib codecs release the GIL, so threads decompress in parallel
+        num_workers = num_workers or os.cpu_count() or 1
+        window = 2 * num_workers
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for window_start in range(0, len(chunks), window):
+                futures = [executor.submit(decompress, i, self.read_chunk(i))
+                           for i in chunks[window_start:window_start + window]]
+                for future in futures:
+                    future.result()
+
+        return out[:end - start]
+
+    @staticmethod
+    def is_compressed_signal_file(filename: str) -> bool:
+        try:
+            with open(filename, "rb") as f:
+                return f.read(len(CompressedSignalFile.MAGIC)) == CompressedSignalFile.MAGIC
+        except OSError:
+            return False
+
+    @staticmethod
+    def write(filename: str, data: np.ndarray, sample_rate=1e6, parameters: dict = None,
+              codec: str = DEFAULT_CODEC, chunk_size: int = DEFAULT_CHUNK_SIZE, num_workers: int = None):
+        """
+        Compress the samples chunk by chunk in parallel and write them to filename.
+
+        :param data: complex64 samples, can also be a lazy array as only chunks of it are accessed
+        :param parameters: Signal parameters to store in header
+        :param codec: One of CODECS
+        :param num_workers: Number of threads for compression, default is number of CPUs
+        """
+        if codec not in CompressedSignalFile.CODECS:
+            raise ValueError("Unknown codec {}".format(codec))
+
+        compress = CompressedSignalFile.CODECS[codec].compress
+        num_workers = num_workers or os.cpu_count() or 1
+        num_chunks = CompressedSignalFile.__num_chunks(len(data), chunk_size)
+
+        header = json.dumps({"version": CompressedSignalFile.VERSION, "codec": codec, "chunk_size": chunk_size,
+                             "num_samples": len(data), "sample_rate": sample_rate,
+                             "parameters": parameters if parameters is not None else {}}).encode("utf-8")
+
+        index = np.empty((num_chunks, 2), dtype="<u8")
+        with open(filename, "wb") as f, ThreadPoolExecutor(max_workers=num_workers) as executor:
+            f.write(CompressedSignalFile.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+
+            # Only keep a few chunks per worker in flight to bound memory for big signals
+            window = 2 * num_workers
+            for window_start in range(0, num_chunks, window):
+                chunks = range(window_start, min(window_start + window, num_chunks))
+                futures = [executor.submit(compress, np.asarray(data[i * chunk_size:(i + 1) * chunk_size],
+                                                             dtype=CompressedSignalFile.DTYPE).tobytes())
+                           for i in chunks]
+                for i, future in zip(chunks, futures):
+                    compressed = future.result()
+                    index[i] = f.tell(), len(compressed)
+                    f.write(compressed)
+
+            index_offset = f.tell()
+            f.write(index.tobytes())
+            f.write(struct.pack("<Q", index_offset))
+            f.write(CompressedSignalFile.MAGIC)
+
+    @staticmethod
+    def __num_chunks(num_samples: int, chunk_size: int) -> int:
+        return (num_samples + chunk_size - 1) // chunk_size
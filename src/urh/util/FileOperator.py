@@ -6,11 +6,10 @@ import wave
 import zipfile
 
 import numpy as np
-from PyQt5.QtCore import QDir
-from PyQt5.QtWidgets import QFileDialog, QMessageBox
 
-from urh.models.FileIconProvider import FileIconProvider
-from urh.util.Errors import Errors
+from urh.util.CompressedSignalFile import CompressedSignalFile
+
+# Qt is imported in the functions showing dialogs, so signals can be saved without it
 
 VIEW_TYPES = ["Bits", "Hex", "ASCII"]
 
@@ -18,10 +17,20 @@ archives = {}
 """:type: dict of [str, str]
    :param: archives[extracted_filename] = filename"""
 
-RECENT_PATH = QDir.homePath()
+RECENT_PATH = os.path.expanduser("~")
+
+WAV_BLOCK_SIZE = 2 ** 16  # frames written at once when saving WAV files
+IN_PLACE_BLOCK_SIZE = 2 ** 16  # samples written at once when overwriting a mapped file in place
 
 
-def get_open_dialog(directory_mode=False, parent=None, name_filter="full") -> QFileDialog:
+def get_open_dialog(directory_mode=False, parent=None, name_filter="full"):
+    """
+
+    :rtype: QFileDialog
+    """
+    from PyQt5.QtWidgets import QFileDialog
+    from urh.models.FileIconProvider import FileIconProvider
+
     fip = FileIconProvider()
     dialog = QFileDialog(parent)
     dialog.setIconProvider(fip)
@@ -92,6 +101,8 @@ def uncompress_archives(file_names, temp_dir):
 
 
 def get_save_file_name(initial_name: str, wav_only=False, caption="Save signal"):
+    from PyQt5.QtWidgets import QFileDialog
+
     global RECENT_PATH
     if caption == "Save signal":
         name_filter = "Complex files (*.complex);;Complex16 files (2 unsigned int8) " \
@@ -127,6 +138,8 @@ def get_save_file_name(initial_name: str, wav_only=False, caption="Save signal")
 
 
 def save_data_dialog(signal_name: str, data, wav_only=False, parent=None) -> str:
+    from PyQt5.QtWidgets import QMessageBox
+
     filename = get_save_file_name(signal_name, wav_only)
 
     if filename:
@@ -141,24 +154,30 @@ def save_data_dialog(signal_name: str, data, wav_only=False, parent=None) -> str
     return filename
 
 
-def save_data(data, filename: str, sample_rate=1e6):
+def save_data(data, filename: str, sample_rate=1e6, parameters: dict = None):
     if filename.endswith(".wav"):
         f = wave.open(filename, "w")
         f.setnchannels(2)
         f.setsampwidth(2)
         f.setframerate(sample_rate)
-        f.writeframes(data)
+        if isinstance(data, np.ndarray) and data.dtype == np.complex64:
+            # Convert to 16 bit PCM block-wise instead of creating a full int16 copy
+            values = data.view(np.float32)
+            for i in range(0, len(values), 2 * WAV_BLOCK_SIZE):
+                f.writeframes((values[i:i + 2 * WAV_BLOCK_SIZE] * 32767).astype(np.int16))
+        else:
+            f.writeframes(data)
         f.close()
     elif filename.endswith(".coco"):
-        with tarfile.open(filename, 'w:bz2') as tar_write:
-            tmp_name = os.path.join(QDir.tempPath(), "tmpfile")
-            data.tofile(tmp_name)
-            tar_write.add(tmp_name)
-        os.remove(tmp_name)
+        CompressedSignalFile.write(filename, data, sample_rate=sample_rate, parameters=parameters)
     else:
         try:
-            data.tofile(filename)
+            if is_mapped_from(data, filename):
+                save_mapped_data(data, filename)
+            else:
+                data.tofile(filename)
         except Exception as e:
+            from urh.util.Errors import Errors
             Errors.write_error(e)
 
     if filename in archives.keys():
@@ -169,18 +188,52 @@ def save_data(data, filename: str, sample_rate=1e6):
             rewrite_tar(archive)
 
 
+def is_mapped_from(data, filename: str) -> bool:
+    if not isinstance(data, np.memmap) or data.filename is None or not os.path.isfile(filename):
+        return False
+    return os.path.samefile(data.filename, filename)
+
+
+def save_mapped_data(data: np.memmap, filename: str):
+    """
+    Save data to the file it is memory mapped from.
+    Truncating the file would invalidate the map, so data is written to a temporary file that replaces it.
+    Windows can not replace a file while it is mapped, in this case data is written in place.
+    """
+    tmp_name = filename + ".tmp"
+    data.tofile(tmp_name)
+    try:
+        os.replace(tmp_name, filename)
+    except PermissionError:
+        os.remove(tmp_name)
+        write_in_place(data, filename)
+
+
+def write_in_place(data: np.memmap, filename: str):
+    """
+    Overwrite the mapped file with data block by block without changing its size.
+    Each block is read from the copy on write map before the same region of the file is overwritten,
+    so the blocks not written yet still show the original samples.
+    """
+    assert data.offset == 0, "Only samples mapped from the start of the file can be written in place"
+    with open(filename, "r+b") as f:
+        for i in range(0, len(data), IN_PLACE_BLOCK_SIZE):
+            f.write(np.ascontiguousarray(data[i:i + IN_PLACE_BLOCK_SIZE]).tobytes())
+
+
 def save_signal(signal):
     filename = signal.filename
-    if filename.endswith(".wav"):
-        data = signal.wave_data
+    if filename.endswith(".coco"):
+        # Written chunk by chunk, so samples that are created on access need not be loaded at once
+        data = signal.data
     elif filename.endswith(".complex16u"):
-        data = (127.5 * (signal.data.view(np.float32) + 1.0)).astype(np.uint8)
+        data = (127.5 * (np.asarray(signal.data).view(np.float32) + 1.0)).astype(np.uint8)
     elif filename.endswith(".complex16s"):
-        data = (127.5 * ((signal.data.view(np.float32)) - 0.5 / 127.5)).astype(np.int8)
+        data = (127.5 * ((np.asarray(signal.data).view(np.float32)) - 0.5 / 127.5)).astype(np.int8)
     else:
-        data = signal.data
+        data = np.asanyarray(signal.data)  # keep memory maps, so they are not truncated while being read
 
-    save_data(data, filename, sample_rate=signal.sample_rate)
+    save_data(data, filename, sample_rate=signal.sample_rate, parameters=signal.stored_parameters)
 
 
 def rewrite_zip(zip_name):
@@ -216,6 +269,8 @@ def rewrite_tar(tar_name: str):
 
 
 def get_directory():
-    directory = QFileDialog.getExistingDirectory(None, "Choose Directory", QDir.homePath(),
+    from PyQt5.QtWidgets import QFileDialog
+
+    directory = QFileDialog.getExistingDirectory(None, "Choose Directory", os.path.expanduser("~"),
                                                  QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks)
     return directory
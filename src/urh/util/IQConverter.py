@@ -0,0 +1,113 @@
+import numpy as np
+
+
+class IQConverter(object):
+    """
+    Convert interleaved integer IQ data (files and device buffers) to complex64.
+    Conversion runs in fixed size blocks, so no full length float64 temporaries are created.
+    """
+    BLOCK_SIZE = 2 ** 16  # number of I/Q values converted per block
+
+    __lookup_tables = {}
+
+    @staticmethod
+    def lookup_table(dtype) -> np.ndarray:
+        """
+        Get the float32 values for all 256 byte values of an 8 bit type.
+        The table is indexed with the raw bytes, so int8 data needs to be viewed as uint8 first.
+
+        :param dtype: np.uint8 or np.int8
+        :rtype: np.ndarray
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in IQConverter.__lookup_tables:
+            values = np.arange(256, dtype=np.uint8).view(dtype)
+            if dtype == np.uint8:
+                table = (values / 127.5) - 1.0
+            elif dtype == np.int8:
+                table = (values + 0.5) / 127.5
+            else:
+                raise ValueError("Can't create lookup table for {}".format(dtype))
+
+            IQConverter.__lookup_tables[dtype] = table.astype(np.float32)
+
+        return IQConverter.__lookup_tables[dtype]
+
+    @staticmethod
+    def convert_to_complex64(raw: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert interleaved I/Q values to complex samples in range -1 to 1.
+
+        :param raw: I/Q values of type uint8, int8, uint16 or int16
+        :param out: Optional contiguous complex64 buffer the samples are written to
+        :return: The part of the output buffer holding the converted samples
+        """
+        num_samples = len(raw) // 2
+        if out is None:
+            out = np.empty(num_samples, dtype=np.complex64)
+        elif len(out) < num_samples:
+            raise ValueError("Output buffer too small for {} samples".format(num_samples))
+
+        out = out[:num_samples]
+        result = out.view(np.float32)
+        raw = raw[:2 * num_samples]
+        n = len(raw)
+
+        if raw.dtype in (np.uint8, np.int8):
+            table = IQConverter.lookup_table(raw.dtype)
+            indices = raw.view(np.uint8)
+            for i in range(0, n, IQConverter.BLOCK_SIZE):
+                np.take(table, indices[i:i + IQConverter.BLOCK_SIZE],
+                        out=result[i:i + IQConverter.BLOCK_SIZE], mode="clip")
+        elif raw.dtype in (np.uint16, np.int16):
+            signed = raw.dtype == np.int16
+            for i in range(0, n, IQConverter.BLOCK_SIZE):
+                block = result[i:i + IQConverter.BLOCK_SIZE]
+                if signed:
+                    np.add(raw[i:i + IQConverter.BLOCK_SIZE], 0.5, out=block)
+                    np.divide(block, 32767.5, out=block)
+                else:
+                    np.divide(raw[i:i + IQConverter.BLOCK_SIZE], 32767.5, out=block)
+                    np.subtract(block, 1.0, out=block)
+        else:
+            raise ValueError("Can't convert IQ data of type {}".format(raw.dtype))
+
+        return out
+
+    @staticmethod
+    def convert_from_complex64(samples: np.ndarray, dtype, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert complex samples back to interleaved 8 bit I/Q values.
+        This is the inverse of convert_to_complex64, so converted device samples get their raw values back.
+
+        :param samples: contiguous complex64 samples
+        :param dtype: np.uint8 or np.int8
+        :param out: Optional buffer for at least 2 * len(samples) values of dtype
+        :return: The part of the output buffer holding the I/Q values
+        """
+        dtype = np.dtype(dtype)
+        if dtype == np.uint8:
+            offset, minimum, maximum = 127.5, 0, 255
+        elif dtype == np.int8:
+            offset, minimum, maximum = -0.5, -128, 127
+        else:
+            raise ValueError("Can't convert IQ data to type {}".format(dtype))
+
+        values = samples.view(np.float32)
+        n = len(values)
+        if out is None:
+            out = np.empty(n, dtype=dtype)
+        elif len(out) < n:
+            raise ValueError("Output buffer too small for {} values".format(n))
+
+        out = out[:n]
+        block = np.empty(min(n, IQConverter.BLOCK_SIZE), dtype=np.float32)
+        for i in range(0, n, IQConverter.BLOCK_SIZE):
+            tmp = block[:min(IQConverter.BLOCK_SIZE, n - i)]
+            np.multiply(values[i:i + IQConverter.BLOCK_SIZE], 127.5, out=tmp)
+            np.add(tmp, offset, out=tmp)
+            np.rint(tmp, out=tmp)
+            np.clip(tmp, minimum, maximum, out=tmp)
+            out[i:i + len(tmp)] = tmp
+
+        return out
@@ -0,0 +1,160 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from urh.util.IQConverter import IQConverter
+
+
+class LazySampleArray(object):
+    """
+    Read only array of complex64 samples that are created block by block when they are accessed,
+    e.g. decompressed from a compressed signal file or converted from 8 bit I/Q values.
+    The recently used blocks are kept in memory.
+
+    Slicing returns numpy arrays, so code working on sections of a signal can use it like an array.
+    Code that needs all samples at once gets them with np.asarray.
+    """
+
+    DEFAULT_MAX_BLOCKS = 16
+
+    dtype = np.dtype(np.complex64)
+    ndim = 1
+
+    def __init__(self, num_samples: int, block_size: int, read, max_blocks=DEFAULT_MAX_BLOCKS, filename=None):
+        """
+
+        :param read: function returning the samples from start to end as complex64 array
+        :param max_blocks: maximum number of blocks kept in memory, larger reads bypass the cache
+        :param filename: file the samples are read from, if any
+        """
+        self.num_samples = num_samples
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.__read = read
+        self.filename = filename
+
+        self.__blocks = OrderedDict()  # block index -> samples, least recently used first
+        self.__lock = threading.Lock()  # sections may be requested from render threads
+
+    @classmethod
+    def from_iq_file(cls, filename: str, dtype, block_size=2 ** 20):
+        """
+        Convert a file of interleaved 8 bit I/Q values on access
+
+        :param dtype: np.uint8 or np.int8
+        """
+        # Empty files can not be mapped
+        raw = np.memmap(filename, dtype=dtype, mode="r") if os.path.getsize(filename) > 0 else np.zeros(0, dtype)
+
+        def read(start: int, end: int) -> np.ndarray:
+            return IQConverter.convert_to_complex64(raw[2 * start:2 * end])
+
+        return cls(len(raw) // 2, block_size, read, filename=filename)
+
+    @classmethod
+    def from_compressed_file(cls, compressed_file):
+        """
+        Decompress the chunks of a compressed signal file on access
+
+        :type compressed_file: urh.util.CompressedSignalFile.CompressedSignalFile
+        """
+        return cls(compressed_file.num_samples, compressed_file.chunk_size, compressed_file.read,
+                   filename=compressed_file.filename)
+
+    def __len__(self):
+        return self.num_samples
+
+    @property
+    def shape(self) -> tuple:
+        return self.num_samples,
+
+    @property
+    def size(self) -> int:
+        return self.num_samples
+
+    @property
+    def real(self):
+        return _LazyPart(self, "real")
+
+    @property
+    def imag(self):
+        return _LazyPart(self, "imag")
+
+    def __array__(self, dtype=None):
+        result = self[:]
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, end, step = key.indices(self.num_samples)
+            if step < 0:
+                return self.__get_range(end + 1, start + 1)[::-1][::-step]
+            return self.__get_range(start, end)[::step]
+
+        index = int(key)
+        if index < 0:
+            index += self.num_samples
+        if not 0 <= index < self.num_samples:
+            raise IndexError("index {} is out of bounds for size {}".format(key, self.num_samples))
+
+        return self.__get_block(index // self.block_size)[index % self.block_size]
+
+    def __get_range(self, start: int, end: int) -> np.ndarray:
+        if end <= start:
+            return np.zeros(0, dtype=self.dtype)
+
+        first, last = start // self.block_size, -(-end // self.block_size)
+        if last - first > self.max_blocks:
+            # Long scans like a demodulation of the whole signal would only evict the cached blocks
+            return self.__read(start, end)
+
+        offset = first * self.block_size
+        if last - first == 1:
+            return self.__get_block(first)[start - offset:end - offset].copy()
+
+        result = np.concatenate([self.__get_block(i) for i in range(first, last)])
+        return result[start - offset:end - offset]
+
+    def __get_block(self, index: int) -> np.ndarray:
+        with self.__lock:
+            try:
+                self.__blocks.move_to_end(index)
+                return self.__blocks[index]
+            except KeyError:
+                pass
+
+            block = self.__read(index * self.block_size, min((index + 1) * self.block_size, self.num_samples))
+            self.__blocks[index] = block
+            while len(self.__blocks) > self.max_blocks:
+                self.__blocks.popitem(last=False)
+
+            return block
+
+
+class _LazyPart(object):
+    """
+    Real or imaginary part of a LazySampleArray
+    """
+
+    dtype = np.dtype(np.float32)
+    ndim = 1
+
+    def __init__(self, samples: LazySampleArray, part: str):
+        self.samples = samples
+        self.part = part
+
+    def __len__(self):
+        return len(self.samples)
+
+    @property
+    def shape(self) -> tuple:
+        return self.samples.shape
+
+    def __array__(self, dtype=None):
+        result = self[:]
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        return getattr(self.samples[key], self.part)
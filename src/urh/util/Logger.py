@@ -4,7 +4,7 @@ import os
 import sys
 import tempfile
 
-from urh.constants import color
+from urh.core_constants import color
 
 logger_conf = {
     "level": logging.WARNING,
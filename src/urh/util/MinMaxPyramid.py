@@ -0,0 +1,129 @@
+import threading
+
+import numpy as np
+
+
+class MinMaxPyramid(object):
+    """
+    Minimum and maximum of sample blocks with block sizes at powers of two.
+    Levels are built lazily from the level below, so a zoomed out view can be drawn
+    from a level with about one block per pixel instead of scanning all visible samples.
+    """
+
+    MIN_BLOCK_SIZE = 16  # Block size of level 0, finer views are drawn from the samples
+    SCAN_SIZE = 2 ** 20  # samples reduced at once when building level 0
+
+    def __init__(self, samples: np.ndarray):
+        self.samples = samples
+        self.__levels = []  # (minimums, maximums) per level
+        self.__lock = threading.Lock()  # levels may be requested from render threads
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.samples)
+
+    @property
+    def num_levels(self) -> int:
+        """
+        Number of levels up to the one with a single block
+        """
+        num_levels, block_size = 1, self.MIN_BLOCK_SIZE
+        while block_size < self.num_samples:
+            block_size *= 2
+            num_levels += 1
+        return num_levels
+
+    def block_size(self, level: int) -> int:
+        return self.MIN_BLOCK_SIZE * 2 ** level
+
+    def get_level(self, level: int):
+        """
+        :return: minimums and maximums of the blocks of level
+        :rtype: tuple of np.ndarray
+        """
+        with self.__lock:
+            while len(self.__levels) <= level:
+                if len(self.__levels) == 0:
+                    self.__levels.append(self.__build_first_level())
+                else:
+                    minimums, maximums = self.__levels[-1]
+                    self.__levels.append(self.__reduce(minimums, maximums, 2))
+
+            return self.__levels[level]
+
+    def level_for(self, samples_per_pixel: float) -> int:
+        """
+        Return the coarsest level with blocks not larger than samples_per_pixel or -1,
+        if the samples should be drawn directly
+        """
+        if samples_per_pixel < self.MIN_BLOCK_SIZE:
+            return -1
+
+        level = int(np.log2(samples_per_pixel / self.MIN_BLOCK_SIZE))
+        return min(level, self.num_levels - 1)
+
+    def get_section(self, start: int, end: int, num_pixels: int):
+        """
+        Return x coordinates and values of a min/max line for samples start to end,
+        with at most four values per pixel.
+
+        :return: x (int64) and values (float32) or None, if the samples should be drawn directly
+        """
+        if end <= start or num_pixels <= 0:
+            return None
+
+        level = self.level_for((end - start) / num_pixels)
+        if level == -1:
+            return None
+
+        return self.get_blocks(level, start, end)
+
+    def get_blocks(self, level: int, start: int, end: int):
+        """
+        Return x coordinates and interleaved minimums and maximums of the blocks of level
+        that overlap the samples start to end
+        """
+        block_size = self.block_size(level)
+        first_block, last_block = start // block_size, -(-end // block_size)
+        minimums, maximums = self.get_level(level)
+
+        x = np.repeat(np.arange(first_block, last_block, dtype=np.int64) * block_size, 2)
+        values = np.empty(len(x), dtype=np.float32)
+        values[0::2] = minimums[first_block:last_block]
+        values[1::2] = maximums[first_block:last_block]
+        return x, values
+
+    def minmax(self):
+        """
+        Minimum and maximum of all samples
+        """
+        if self.num_samples == 0:
+            return 0, 0
+
+        minimums, maximums = self.get_level(self.num_levels - 1)
+        return float(minimums.min()), float(maximums.max())
+
+    def __build_first_level(self):
+        # Samples may be created on access (e.g. decompressed), so only reduce a section of them at once
+        if self.num_samples <= self.SCAN_SIZE:
+            return self.__reduce(self.samples[:], self.samples[:], self.MIN_BLOCK_SIZE)
+
+        minimums, maximums = [], []
+        for i in range(0, self.num_samples, self.SCAN_SIZE):
+            section = self.samples[i:i + self.SCAN_SIZE]
+            section_min, section_max = self.__reduce(section, section, self.MIN_BLOCK_SIZE)
+            minimums.append(section_min)
+            maximums.append(section_max)
+
+        return np.concatenate(minimums), np.concatenate(maximums)
+
+    @staticmethod
+    def __reduce(minimums: np.ndarray, maximums: np.ndarray, factor: int):
+        num_full = len(minimums) // factor
+        result_min = np.minimum.reduce(minimums[:num_full * factor].reshape(-1, factor), axis=1)
+        result_max = np.maximum.reduce(maximums[:num_full * factor].reshape(-1, factor), axis=1)
+        if num_full * factor < len(minimums):
+            result_min = np.append(result_min, minimums[num_full * factor:].min())
+            result_max = np.append(result_max, maximums[num_full * factor:].max())
+
+        return result_min.astype(np.float32, copy=False), result_max.astype(np.float32, copy=False)
@@ -0,0 +1,76 @@
+class Notifier(object):
+    """
+    Qt free notification for signal processing classes, declared as class attribute like pyqtSignal.
+    Every instance of the owning class gets its own BoundNotifier providing connect, disconnect and emit.
+
+    Callbacks are called synchronously in the emitting thread, so the core classes work
+    in worker processes and scripts without Qt. Controllers should receive notifications
+    through a QtNotifierAdapter, which turns them into real Qt signals.
+    """
+
+    def __init__(self, *types):
+        self.types = types  # For documentation only, arguments are passed as they are
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        key = "_Notifier__bound_{}".format(id(self))
+        try:
+            return instance.__dict__[key]
+        except KeyError:
+            bound_notifier = BoundNotifier()
+            instance.__dict__[key] = bound_notifier
+            return bound_notifier
+
+    @staticmethod
+    def block_all(instance, block: bool):
+        """
+        Block or unblock all notifications of instance, similar to QObject.blockSignals
+
+        :param instance: Object with Notifier class attributes
+        """
+        for cls in type(instance).__mro__:
+            for attr in cls.__dict__.values():
+                if isinstance(attr, Notifier):
+                    attr.__get__(instance, type(instance)).blocked = block
+
+
+class BoundNotifier(object):
+    def __init__(self):
+        self.callbacks = []
+        self.blocked = False
+
+    def connect(self, callback):
+        self.callbacks.append(callback)
+
+    def disconnect(self, callback=None):
+        """
+        Disconnect callback or all callbacks, if callback is None
+
+        :raises TypeError: if callback is not connected like for pyqtSignal
+        """
+        if callback is None:
+            self.callbacks.clear()
+            return
+
+        try:
+            self.callbacks.remove(callback)
+        except ValueError:
+            raise TypeError("{} is not connected".format(callback))
+
+    def emit(self, *args):
+        if self.blocked:
+            return
+
+        # Copy so callbacks may connect or disconnect while we are emitting
+        for callback in list(self.callbacks):
+            callback(*args)
+
+    def __deepcopy__(self, memo):
+        # Connections belong to the original object
+        return BoundNotifier()
+
+    def __getstate__(self):
+        # Callbacks are usually bound to GUI objects, which can not be sent to other processes
+        return {"callbacks": [], "blocked": self.blocked}
@@ -0,0 +1,76 @@
+from functools import partial
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class QtNotifierAdapter(QObject):
+    """
+    Forward the notifications of a Qt free signal processing object as Qt signals with the same name.
+
+    Controllers connect to the adapter instead of the object itself, so slots are called
+    in the thread of the controller and the forwarding ends when the adapter is destroyed
+    together with its parent. Subclasses declare a pyqtSignal for every name in NOTIFICATIONS.
+    """
+
+    NOTIFICATIONS = ()
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+
+        forwards = [(getattr(source, name), getattr(self, name).emit) for name in self.NOTIFICATIONS]
+        for notifier, emit in forwards:
+            notifier.connect(emit)
+
+        self.__forwards = forwards
+        self.destroyed.connect(partial(QtNotifierAdapter.__disconnect_forwards, forwards))
+
+    def disconnect_source(self):
+        self.__disconnect_forwards(self.__forwards)
+
+    @staticmethod
+    def __disconnect_forwards(forwards: list):
+        for notifier, emit in forwards:
+            try:
+                notifier.disconnect(emit)
+            except TypeError:
+                pass
+        forwards.clear()
+
+
+class SignalQtAdapter(QtNotifierAdapter):
+    NOTIFICATIONS = ("bit_len_changed", "tolerance_changed", "noise_threshold_changed", "qad_center_changed",
+                     "name_changed", "sample_rate_changed", "modulation_type_changed", "saved_status_changed",
+                     "protocol_needs_update", "data_edited")
+
+    bit_len_changed = pyqtSignal(int)
+    tolerance_changed = pyqtSignal(int)
+    noise_threshold_changed = pyqtSignal()
+    qad_center_changed = pyqtSignal(float)
+    name_changed = pyqtSignal(str)
+    sample_rate_changed = pyqtSignal(float)
+    modulation_type_changed = pyqtSignal(int)
+
+    saved_status_changed = pyqtSignal()
+    protocol_needs_update = pyqtSignal()
+    data_edited = pyqtSignal()
+
+
+class ProtocolAnalyzerQtAdapter(QtNotifierAdapter):
+    """
+    Adapter for the qt_signals of a ProtocolAnalyzer
+    """
+    NOTIFICATIONS = ("protocol_updated", "show_state_changed", "data_sniffed", "sniff_device_errors_changed",
+                     "line_duplicated", "fuzzing_started", "current_fuzzing_message_changed", "fuzzing_finished")
+
+    protocol_updated = pyqtSignal()
+    show_state_changed = pyqtSignal()
+    data_sniffed = pyqtSignal(int)
+    sniff_device_errors_changed = pyqtSignal(str)
+    line_duplicated = pyqtSignal()
+    fuzzing_started = pyqtSignal(int)
+    current_fuzzing_message_changed = pyqtSignal(int)
+    fuzzing_finished = pyqtSignal()
+
+    def __init__(self, protocol, parent=None):
+        super().__init__(protocol.qt_signals, parent)
@@ -1,36 +1,41 @@
 import numpy as np
-from multiprocessing import Value, Array
+from multiprocessing import RawValue, RawArray
 
 
 class RingBuffer(object):
     """
-    A RingBuffer containing complex values.
+    A RingBuffer containing complex values in shared memory.
+
+    It is meant for a single producer (push) and a single consumer (pop), which may live in different processes.
+    The producer only advances the number of pushed values and the consumer only advances the number of popped values.
+    Both counters increase monotonically, so no locks are needed.
+    Clearing only marks the values pushed so far as discarded, the consumer skips them on its next pop.
+    Producers that must not wait for the consumer use push_or_drop, which counts the values that did not fit.
     """
     def __init__(self, size: int):
-        self.__data = Array("f", 2*size)
+        self.__data = RawArray("f", 2*size)
         self.size = size
-        self.__left_index = Value("L", 0)
-        self.__right_index = Value("L", 0)
-        self.__length = Value("L", 0)
+        self.__num_pushed = RawValue("Q", 0)  # only changed by the producer
+        self.__num_popped = RawValue("Q", 0)  # only changed by the consumer
+        self.__num_cleared = RawValue("Q", 0)  # only changed by clear, values before are discarded
+        self.__num_dropped = RawValue("Q", 0)  # only changed by the producer in push_or_drop
+        self.__view = None  # type: np.ndarray
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_RingBuffer__view"] = None  # a numpy view would be pickled as a copy
+        return state
 
     def __len__(self):
-        return self.__length.value
+        return self.__num_pushed.value - max(self.__num_popped.value, self.__num_cleared.value)
 
     @property
     def left_index(self):
-        return self.__left_index.value
-
-    @left_index.setter
-    def left_index(self, value):
-        self.__left_index.value = value % self.size
+        return max(self.__num_popped.value, self.__num_cleared.value) % self.size
 
     @property
     def right_index(self):
-        return self.__right_index.value
-
-    @right_index.setter
-    def right_index(self, value):
-        self.__right_index.value = value % self.size
+        return self.__num_pushed.value % self.size
 
     @property
     def is_empty(self) -> bool:
@@ -38,11 +43,28 @@ class RingBuffer(object):
 
     @property
     def space_left(self):
-        return self.size - len(self)
+        # Discarded values occupy the buffer until the consumer skipped them
+        return self.size - (self.__num_pushed.value - self.__num_popped.value)
+
+    @property
+    def num_dropped(self) -> int:
+        return self.__num_dropped.value
 
     @property
     def data(self):
-        return np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
+        if self.__view is None:
+            self.__view = np.frombuffer(self.__data, dtype=np.complex64)
+        return self.__view
+
+    @property
+    def view_segments(self):
+        """
+        Get the ring buffer as two views starting at the next value to pop, so it can be plotted without copying.
+
+        :rtype: tuple of np.ndarray
+        """
+        left = self.left_index
+        return self.data[left:], self.data[:left]
 
     @property
     def view_data(self):
@@ -50,16 +72,14 @@ class RingBuffer(object):
         Get a representation of the ring buffer for plotting. This is expensive, so it should only be used in frontend
         :return:
         """
-        left, right = self.left_index, self.left_index + len(self)
-        if left > right:
-            left, right = right, left
-
-        data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
-        return np.concatenate((data[left:right], data[right:], data[:left]))
+        return np.concatenate(self.view_segments)
 
     def clear(self):
-        self.left_index = 0
-        self.right_index = 0
+        """
+        Discard all values pushed so far. The counter of the consumer is not touched,
+        so this is safe while the consumer pops in another process.
+        """
+        self.__num_cleared.value = self.__num_pushed.value
 
     def will_fit(self, number_values: int) -> bool:
         return number_values <= self.space_left
@@ -68,48 +88,65 @@ class RingBuffer(object):
         """
         Push values to buffer. If buffer can't store all values a ValueError is raised
         """
-        n = len(values)
-        if len(self) + n > self.size:
+        if len(values) > self.space_left:
             raise ValueError("Too much data to push to RingBuffer")
 
-        slide_1 = np.s_[self.right_index:min(self.right_index + n, self.size)]
-        slide_2 = np.s_[:max(self.right_index + n - self.size, 0)]
-        with self.__data.get_lock():
-            data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
-            data[slide_1] = values[:slide_1.stop - slide_1.start]
-            data[slide_2] = values[slide_1.stop - slide_1.start:]
-            self.right_index += n
+        self.__write(values)
 
-        self.__length.value += n
-
-    def pop(self, number: int, ensure_even_length=False):
+    def push_or_drop(self, values: np.ndarray) -> int:
         """
-        Pop number of elements. If there are not enough elements, all remaining elements are returned and the
-        buffer is cleared afterwards. If buffer is empty, an empty numpy array is returned.
+        Push as many values as fit into the buffer. The remaining values are dropped and added to num_dropped.
+
+        :return: number of pushed values
         """
-        if ensure_even_length:
-            number -= number % 2
+        n = min(len(values), self.space_left)
+        if n < len(values):
+            self.__num_dropped.value += len(values) - n
 
-        if len(self) == 0 or number == 0:
-            return np.array([], dtype=np.complex64)
+        self.__write(values[:n])
+        return n
 
-        number = min(number, len(self))
+    def __write(self, values: np.ndarray):
+        n = len(values)
+        right = self.right_index
+        end = min(n, self.size - right)
+        self.data[right:right + end] = values[:end]
+        self.data[:n - end] = values[end:]
 
-        with self.__data.get_lock():
-            data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
+        # Make the values visible to the consumer after they are written
+        self.__num_pushed.value += n
 
-            result = np.empty(number, dtype=np.complex64)
+    def pop_into(self, out: np.ndarray, ensure_even_length=False) -> int:
+        """
+        Pop as many elements as fit into out.
 
-            if self.left_index + number > len(data):
-                end = len(data) - self.left_index
-            else:
-                end = number
+        :param out: caller owned buffer the elements are written to
+        :return: number of popped elements
+        """
+        if self.__num_popped.value < self.__num_cleared.value:
+            # Skip discarded values, only the consumer changes num_popped
+            self.__num_popped.value = self.__num_cleared.value
 
-            result[:end] = data[self.left_index:self.left_index + end]
-            if end < number:
-                result[end:] = data[:number-end]
+        number = min(len(out), len(self))
+        if ensure_even_length:
+            number -= number % 2
+
+        if number <= 0:
+            return 0
 
-        self.left_index += number
-        self.__length.value -= number
+        left = self.left_index
+        end = min(number, self.size - left)
+        out[:end] = self.data[left:left + end]
+        out[end:number] = self.data[:number - end]
 
-        return result
+        # Release the space to the producer after the values are read
+        self.__num_popped.value += number
+        return number
+
+    def pop(self, number: int, ensure_even_length=False):
+        """
+        Pop number of elements. If there are not enough elements, all remaining elements are returned and the
+        buffer is cleared afterwards. If buffer is empty, an empty numpy array is returned.
+        """
+        result = np.empty(max(0, min(number, len(self))), dtype=np.complex64)
+        return result[:self.pop_into(result, ensure_even_length=ensure_even_length)]
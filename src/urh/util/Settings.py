@@ -0,0 +1,49 @@
+import os
+import sys
+
+
+class Settings(object):
+    """
+    Settings for the signal processing core.
+
+    The GUI injects its QSettings as backend (see urh.constants), so the core reads the configured values
+    without importing Qt itself. Scripts and worker processes without a backend get the default values.
+    """
+
+    backend = None  # object with value(key, defaultValue, type) and setValue(key, value) like QSettings
+
+    # Directory of the settings file, where e.g. field types and the signal cache are stored
+    if sys.platform == "win32":
+        config_dir = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), "urh")
+    else:
+        config_dir = os.path.join(os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")), "urh")
+
+    @classmethod
+    def set_backend(cls, backend):
+        """
+
+        :type backend: PyQt5.QtCore.QSettings
+        """
+        cls.backend = backend
+        cls.config_dir = os.path.realpath(os.path.dirname(backend.fileName()))
+
+    @classmethod
+    def value(cls, key: str, default=None, type=None):
+        """
+        Return the value of key like QSettings.value, or default if no backend is set
+        """
+        if cls.backend is None:
+            return type() if default is None and type is not None else default
+
+        if type is None:
+            return cls.backend.value(key, default)
+        return cls.backend.value(key, default, type)
+
+    @classmethod
+    def set_value(cls, key: str, value):
+        if cls.backend is not None:
+            cls.backend.setValue(key, value)
+
+    @classmethod
+    def field_type_settings(cls) -> str:
+        return os.path.join(cls.config_dir, "fieldtypes.xml")
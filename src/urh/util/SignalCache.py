@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from urh.util.Logger import logger
+from urh.util.Settings import Settings
+
+
+class SignalCache(object):
+    """
+    Persistent on disk cache for the quad demodulated data, the auto detected parameters
+    and the noise threshold of a signal file.
+
+    Entries are keyed by a hash of the path, size and modification time of the file and some sampled blocks
+    of its content, so opening a file does not read it completely.
+    Quad demodulated data is keyed additionally by modulation type and noise threshold
+    and gets memory mapped when it is loaded again.
+
+    The cache is disabled by default, the GUI enables it depending on the use_signal_cache setting.
+    Its size is limited by the signal_cache_size_mb setting, least recently used demodulated data is evicted first.
+    """
+
+    VERSION = 4  # Increase when demodulation or parameter estimation changes to invalidate old entries
+    HASH_BLOCK_SIZE = 2 ** 16
+    HASH_NUM_BLOCKS = 16  # Blocks sampled evenly across the file for the content hash
+
+    ENABLED = False
+    CACHE_DIR = None  # None = signal_cache in the settings directory
+    DEFAULT_SIZE_MB = 1024
+
+    def __init__(self, filename: str, cache_dir: str = None):
+        self.cache_dir = cache_dir or SignalCache.get_cache_dir()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.content_hash = self.__get_content_hash(filename)
+
+    @staticmethod
+    def for_file(filename: str):
+        """
+        Get the cache for a signal file or None if caching is disabled or not possible
+
+        :rtype: SignalCache or None
+        """
+        if not SignalCache.ENABLED:
+            return None
+
+        try:
+            return SignalCache(filename)
+        except OSError as e:
+            logger.warning("Could not create signal cache for {}: {}".format(filename, e))
+            return None
+
+    @staticmethod
+    def get_cache_dir() -> str:
+        return SignalCache.CACHE_DIR or os.path.join(Settings.config_dir, "signal_cache")
+
+    @staticmethod
+    def total_size(cache_dir: str = None) -> int:
+        """
+        :return: Number of bytes currently used by the cache
+        """
+        cache_dir = cache_dir or SignalCache.get_cache_dir()
+        try:
+            names = os.listdir(cache_dir)
+        except OSError:
+            return 0
+
+        result = 0
+        for name in names:
+            try:
+                result += os.path.getsize(os.path.join(cache_dir, name))
+            except OSError:
+                continue
+        return result
+
+    @staticmethod
+    def clear(cache_dir: str = None):
+        """
+        Remove all entries from the cache. Files still mapped by open signals may not be removable on Windows,
+        they are skipped then.
+        """
+        cache_dir = cache_dir or SignalCache.get_cache_dir()
+        try:
+            names = os.listdir(cache_dir)
+        except OSError:
+            return
+
+        for name in names:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError as e:
+                logger.warning("Could not remove {} from signal cache: {}".format(name, e))
+
+    @property
+    def max_size(self) -> int:
+        # Setting is in MiB as QSettings can not handle integers above 32 bit
+        return Settings.value("signal_cache_size_mb", self.DEFAULT_SIZE_MB, int) * 1024 ** 2
+
+    @property
+    def metadata_filename(self) -> str:
+        return os.path.join(self.cache_dir, "{}_v{}.json".format(self.content_hash, self.VERSION))
+
+    def qad_filename(self, mod_type: int, noise_threshold: float, costa_reset_noise_samples=0) -> str:
+        suffix = "_r{}".format(costa_reset_noise_samples) if costa_reset_noise_samples else ""
+        return os.path.join(self.cache_dir, "{}_v{}_{}_{}{}.qad".format(self.content_hash, self.VERSION, mod_type,
+                                                                        float(noise_threshold), suffix))
+
+    def load_qad(self, mod_type: int, noise_threshold: float, costa_reset_noise_samples=0):
+        """
+        :return: Memory mapped quad demodulated data or None, if it is not cached
+        :rtype: np.ndarray or None
+        """
+        filename = self.qad_filename(mod_type, noise_threshold, costa_reset_noise_samples)
+        try:
+            num_samples = os.path.getsize(filename) // np.dtype(np.float32).itemsize
+            if num_samples == 0:
+                return np.zeros(0, dtype=np.float32)
+
+            qad = np.memmap(filename, dtype=np.float32, mode="c", shape=(num_samples,))
+            os.utime(filename)  # Mark as recently used for eviction
+            return qad
+        except OSError:
+            return None
+
+    def store_qad(self, qad: np.ndarray, mod_type: int, noise_threshold: float, costa_reset_noise_samples=0):
+        filename = self.qad_filename(mod_type, noise_threshold, costa_reset_noise_samples)
+        try:
+            self.__write_atomic(filename, lambda f: qad.astype(np.float32, copy=False).tofile(f))
+            self.__evict()
+        except OSError as e:
+            logger.warning("Could not cache demodulated data: " + str(e))
+
+    def load_noise_threshold(self):
+        """
+        :rtype: float or None
+        """
+        return self.__read_metadata().get("noise_threshold", None)
+
+    def store_noise_threshold(self, noise_threshold: float):
+        metadata = self.__read_metadata()
+        metadata["noise_threshold"] = float(noise_threshold)
+        self.__write_metadata(metadata)
+
+    def load_parameter_cache(self, noise_threshold: float):
+        """
+        :return: Cached parameter cache of the signal for this noise threshold or None
+        :rtype: dict or None
+        """
+        return self.__read_metadata().get("parameter_cache", {}).get(str(float(noise_threshold)), None)
+
+    def store_parameter_cache(self, parameter_cache: dict, noise_threshold: float):
+        metadata = self.__read_metadata()
+        metadata.setdefault("parameter_cache", {})[str(float(noise_threshold))] = parameter_cache
+        self.__write_metadata(metadata)
+
+    def __read_metadata(self) -> dict:
+        try:
+            with open(self.metadata_filename, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return dict()
+
+    def __write_metadata(self, metadata: dict):
+        try:
+            # numpy scalars are converted to their python equivalent
+            content = json.dumps(metadata, default=lambda o: o.item()).encode("utf-8")
+            self.__write_atomic(self.metadata_filename, lambda f: f.write(content))
+        except OSError as e:
+            logger.warning("Could not write signal cache metadata: " + str(e))
+
+    def __get_content_hash(self, filename: str) -> str:
+        """
+        Hash path, size and modification time of the file together with blocks sampled evenly across it.
+        The effort is independent of the file size.
+        """
+        stat = os.stat(filename)
+        content_hash = hashlib.sha1()
+        content_hash.update("{}\n{}\n{}\n".format(os.path.realpath(filename), stat.st_size,
+                                                   stat.st_mtime_ns).encode("utf-8"))
+
+        with open(filename, "rb") as f:
+            if stat.st_size <= self.HASH_NUM_BLOCKS * self.HASH_BLOCK_SIZE:
+                content_hash.update(f.read())
+            else:
+                step = (stat.st_size - self.HASH_BLOCK_SIZE) // (self.HASH_NUM_BLOCKS - 1)
+                for i in range(self.HASH_NUM_BLOCKS):
+                    f.seek(i * step)
+                    content_hash.update(f.read(self.HASH_BLOCK_SIZE))
+
+        return content_hash.hexdigest()
+
+    def __evict(self):
+        """
+        Remove least recently used demodulated data until the cache fits into max_size
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".qad"):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                total_size -= size
+            except OSError:
+                # File may be mapped on Windows
+                continue
+
+    @staticmethod
+    def __write_atomic(filename: str, write_func):
+        tmp_name = filename + ".tmp{}".format(os.getpid())
+        with open(tmp_name, "wb") as f:
+            write_func(f)
+        os.replace(tmp_name, filename)
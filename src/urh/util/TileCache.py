@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+
+class TileCache(object):
+    """
+    Least recently used cache for rendered tiles with a memory budget.
+    Tiles are evicted, when the summed size of all tiles exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.__tiles = OrderedDict()  # key -> (tile, size in bytes), least recently used first
+        self.__num_bytes = 0
+
+    def __len__(self):
+        return len(self.__tiles)
+
+    def __contains__(self, key):
+        return key in self.__tiles
+
+    @property
+    def num_bytes(self) -> int:
+        return self.__num_bytes
+
+    def get(self, key, default=None):
+        try:
+            self.__tiles.move_to_end(key)
+            return self.__tiles[key][0]
+        except KeyError:
+            return default
+
+    def put(self, key, tile, num_bytes: int):
+        self.pop(key)
+        self.__tiles[key] = (tile, num_bytes)
+        self.__num_bytes += num_bytes
+
+        # Keep at least the new tile even if it alone exceeds the budget
+        while self.__num_bytes > self.max_bytes and len(self.__tiles) > 1:
+            _, (_, size) = self.__tiles.popitem(last=False)
+            self.__num_bytes -= size
+
+    def pop(self, key):
+        try:
+            tile, size = self.__tiles.pop(key)
+        except KeyError:
+            return None
+
+        self.__num_bytes -= size
+        return tile
+
+    def discard_where(self, predicate):
+        """
+        Remove all tiles whose key fulfills predicate
+
+        :type predicate: callable
+        """
+        for key in [key for key in self.__tiles if predicate(key)]:
+            self.pop(key)
+
+    def clear(self):
+        self.__tiles.clear()
+        self.__num_bytes = 0
@@ -2,15 +2,15 @@ import array
 import os
 import sys
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFontDatabase, QFont
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit, QTableWidgetItem, QApplication
-
-from urh import constants
 from urh.util.Logger import logger
 
+# Qt is imported in the functions creating widgets, so the signal processing core can use this module without it
+
 
 def set_icon_theme():
+    from PyQt5.QtGui import QIcon
+    from urh import constants
+
     if sys.platform != "linux" or constants.SETTINGS.value("icon_theme_index", 0, int) == 0:
         # noinspection PyUnresolvedReferences
         import urh.ui.xtra_icons_rc
@@ -113,7 +113,13 @@ def hex2bit(hex_str: str) -> array.array:
     return result
 
 
-def create_textbox_dialog(content: str, title: str, parent) -> QDialog:
+def create_textbox_dialog(content: str, title: str, parent):
+    """
+
+    :rtype: QDialog
+    """
+    from PyQt5.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit
+
     d = QDialog(parent)
     d.resize(800, 600)
     d.setWindowTitle(title)
@@ -164,12 +170,22 @@ def file_can_be_opened(filename: str):
 
 
 def create_table_item(content):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QTableWidgetItem
+
     item = QTableWidgetItem(str(content))
     item.setFlags(item.flags() & ~Qt.ItemIsEditable)
     return item
 
 
-def get_monospace_font() -> QFont:
+def get_monospace_font():
+    """
+
+    :rtype: QFont
+    """
+    from PyQt5.QtGui import QFontDatabase
+    from PyQt5.QtWidgets import QApplication
+
     fixed_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
     fixed_font.setPointSize(QApplication.instance().font().pointSize())
     return fixed_font
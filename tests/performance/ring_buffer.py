@@ -0,0 +1,150 @@
+import time
+from multiprocessing import Array, Process, Value
+
+import numpy as np
+
+from urh.util.RingBuffer import RingBuffer
+
+
+class LockedRingBuffer(object):
+    """
+    Previous RingBuffer implementation with locked indices for comparison
+    """
+
+    def __init__(self, size: int):
+        self.__data = Array("f", 2 * size)
+        self.size = size
+        self.__left_index = Value("L", 0)
+        self.__right_index = Value("L", 0)
+        self.__length = Value("L", 0)
+
+    def __len__(self):
+        return self.__length.value
+
+    @property
+    def left_index(self):
+        return self.__left_index.value
+
+    @left_index.setter
+    def left_index(self, value):
+        self.__left_index.value = value % self.size
+
+    @property
+    def right_index(self):
+        return self.__right_index.value
+
+    @right_index.setter
+    def right_index(self, value):
+        self.__right_index.value = value % self.size
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    @property
+    def view_data(self):
+        left, right = self.left_index, self.left_index + len(self)
+        if left > right:
+            left, right = right, left
+
+        data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
+        return np.concatenate((data[left:right], data[right:], data[:left]))
+
+    def will_fit(self, number_values: int) -> bool:
+        return number_values <= self.size - len(self)
+
+    def push(self, values: np.ndarray):
+        n = len(values)
+        if len(self) + n > self.size:
+            raise ValueError("Too much data to push to RingBuffer")
+
+        slide_1 = np.s_[self.right_index:min(self.right_index + n, self.size)]
+        slide_2 = np.s_[:max(self.right_index + n - self.size, 0)]
+        with self.__data.get_lock():
+            data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
+            data[slide_1] = values[:slide_1.stop - slide_1.start]
+            data[slide_2] = values[slide_1.stop - slide_1.start:]
+            self.right_index += n
+
+        self.__length.value += n
+
+    def pop(self, number: int, ensure_even_length=False):
+        if ensure_even_length:
+            number -= number % 2
+
+        if len(self) == 0 or number == 0:
+            return np.array([], dtype=np.complex64)
+
+        number = min(number, len(self))
+
+        with self.__data.get_lock():
+            data = np.frombuffer(self.__data.get_obj(), dtype=np.complex64)
+
+            result = np.empty(number, dtype=np.complex64)
+
+            if self.left_index + number > len(data):
+                end = len(data) - self.left_index
+            else:
+                end = number
+
+            result[:end] = data[self.left_index:self.left_index + end]
+            if end < number:
+                result[end:] = data[:number - end]
+
+        self.left_index += number
+        self.__length.value -= number
+
+        return result
+
+
+def produce(ring_buffer, num_chunks: int, chunk_size: int):
+    chunk = np.ones(chunk_size, dtype=np.complex64)
+    for _ in range(num_chunks):
+        while not ring_buffer.will_fit(chunk_size):
+            time.sleep(0)
+        ring_buffer.push(chunk)
+
+
+def consume(ring_buffer, num_samples: int, chunk_size: int):
+    received = 0
+    if isinstance(ring_buffer, RingBuffer):
+        out = np.empty(chunk_size, dtype=np.complex64)
+        while received < num_samples:
+            received += ring_buffer.pop_into(out)
+    else:
+        while received < num_samples:
+            received += len(ring_buffer.pop(chunk_size))
+
+
+def measure(cls, buffer_size: int, num_chunks: int, chunk_size: int):
+    ring_buffer = cls(buffer_size)
+    producer = Process(target=produce, args=(ring_buffer, num_chunks, chunk_size))
+
+    t = time.perf_counter()
+    producer.start()
+    consume(ring_buffer, num_chunks * chunk_size, chunk_size)
+    producer.join()
+    throughput = num_chunks * chunk_size / (time.perf_counter() - t)
+
+    # ContinuousSceneManager plots the two segments of the new RingBuffer without concatenating them
+    t = time.perf_counter()
+    for _ in range(10):
+        if isinstance(ring_buffer, RingBuffer):
+            ring_buffer.view_segments
+        else:
+            ring_buffer.view_data
+    view_time = (time.perf_counter() - t) / 10
+
+    return throughput, view_time
+
+
+if __name__ == '__main__':
+    buffer_size = int(100 * 10 ** 6) // 8  # same as ContinuousModulator
+    num_chunks = 2000
+
+    print("Class\t\t\tChunk size\tMSamples/s\tView for plot [ms]")
+    for chunk_size in (1024, 32768, 262144):
+        for cls in (LockedRingBuffer, RingBuffer):
+            throughput, view_time = measure(cls, buffer_size, num_chunks, chunk_size)
+            print("{0:<16}\t{1}\t\t{2:.1f}\t\t{3:.3f}".format(cls.__name__, chunk_size,
+                                                              throughput / 1e6, view_time * 1e3))
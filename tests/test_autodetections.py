@@ -1,7 +1,10 @@
 import unittest
 
+import numpy as np
+
 from tests.QtTestCase import QtTestCase
 from tests.utils_testing import get_path_for_data_file
+from urh.cythonext.signalFunctions import estimate_qad_center, get_noise_for_mod_type
 from urh.signalprocessing.Signal import Signal
 
 class TestAutodetections(QtTestCase):
@@ -48,5 +51,19 @@ class TestAutodetections(QtTestCase):
         for i in range(10):
             self.assertEqual(qad_center, signal.estimate_qad_center())
 
+    def test_center_estimation_ignores_noise(self):
+        signal = Signal(get_path_for_data_file("esaver.complex"), "ESaver")
+        signal.modulation_type = 1
+        qad = signal.qad
+        noise = get_noise_for_mod_type(1)
+
+        center = estimate_qad_center(qad, 16, noise)
+        self.assertEqual(center, estimate_qad_center(qad[qad > noise], 16))
+        self.assertEqual(center, signal.estimate_qad_center())
+
+        # Subsampling blocks of the signal only changes the center slightly
+        long_qad = np.tile(qad, 16)
+        self.assertAlmostEqual(estimate_qad_center(long_qad, 16, noise, 4), center, delta=0.05)
+
 if __name__ == '__main__':
     unittest.main()
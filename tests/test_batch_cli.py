@@ -0,0 +1,46 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.utils_testing import get_path_for_data_file
+from urh.cli import batch
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+
+
+class TestBatchCLI(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_given_parameters(self):
+        args = batch.create_parser().parse_args([get_path_for_data_file("ask.complex"), "-o", self.output_dir,
+                                                 "-m", "ASK", "-b", "295", "-c", "-0.1667", "-j", "1"])
+        results = batch.run_batch(args.filenames, args)
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[0].num_messages, 1)
+        self.assertEqual(list(results[0].timings.keys()), ["load", "detect", "demodulate", "write"])
+
+        proto_analyzer = ProtocolAnalyzer(None)
+        proto_analyzer.from_xml_file(os.path.join(self.output_dir, "ask.proto.xml"), read_bits=True)
+        self.assertEqual(proto_analyzer.plain_hex_str[0], "b25b6db6c80")
+
+    def test_process_pool(self):
+        filenames = [get_path_for_data_file("ask.complex"), get_path_for_data_file("fsk.complex"),
+                     os.path.join(self.output_dir, "does_not_exist.complex")]
+        args = batch.create_parser().parse_args(filenames + ["-o", self.output_dir, "-f", "pcap", "-j", "2"])
+        results = batch.run_batch(args.filenames, args)
+
+        self.assertEqual([r.filename for r in results], filenames)
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].error)
+        self.assertIsNotNone(results[2].error)
+        self.assertTrue(os.path.isfile(os.path.join(self.output_dir, "ask.pcap")))
+        self.assertTrue(os.path.isfile(os.path.join(self.output_dir, "fsk.pcap")))
+
+        summary = batch.format_summary(results, 1.0)
+        self.assertIn("ERROR", summary)
+        self.assertIn("Processed 3 files (1 failed)", summary)
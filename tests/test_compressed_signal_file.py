@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from tests.utils_testing import get_path_for_data_file
+from urh.signalprocessing.Signal import Signal
+from urh.util import FileOperator
+from urh.util.CompressedSignalFile import CompressedSignalFile
+from urh.util.LazySampleArray import LazySampleArray
+
+
+class TestCompressedSignalFile(unittest.TestCase):
+    def setUp(self):
+        self.filename = os.path.join(tempfile.gettempdir(), "test_compressed_signal.coco")
+
+    def tearDown(self):
+        if os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+    def test_partial_read(self):
+        data = (np.arange(10000) * (1 + 1j)).astype(np.complex64)
+        for codec in CompressedSignalFile.CODECS:
+            CompressedSignalFile.write(self.filename, data, codec=codec, chunk_size=1000, num_workers=4)
+            self.assertTrue(CompressedSignalFile.is_compressed_signal_file(self.filename))
+            with CompressedSignalFile(self.filename) as f:
+                self.assertEqual(f.num_samples, len(data))
+                self.assertTrue(np.array_equal(f.read(), data))
+                self.assertTrue(np.array_equal(f.read(1500, 3700), data[1500:3700]))
+                self.assertTrue(np.array_equal(f.read(9990, 20000), data[9990:]))
+                self.assertEqual(len(f.read(5000, 5000)), 0)
+
+    def test_save_and_load_signal(self):
+        signal = Signal(get_path_for_data_file("esaver.complex"), "esaver", modulation="FSK", sample_rate=2e6)
+        signal.bit_len = 123
+        signal.noise_threshold = 0.1
+        signal.filename = self.filename
+        FileOperator.save_signal(signal)
+
+        loaded = Signal(self.filename, "loaded")
+        self.assertTrue(np.array_equal(signal.data, loaded.data))
+        self.assertEqual(loaded.sample_rate, 2e6)
+        self.assertEqual(loaded.modulation_type_str, "FSK")
+        self.assertEqual(loaded.bit_len, 123)
+        self.assertAlmostEqual(loaded.noise_threshold, 0.1)
+
+        loaded.auto_detect()
+        self.assertEqual(loaded.bit_len, 123)
+        loaded.eliminate()
+
+    def test_lazy_signal(self):
+        data = np.fromfile(get_path_for_data_file("esaver.complex"), dtype=np.complex64)
+        CompressedSignalFile.write(self.filename, data, chunk_size=1000)
+
+        signal = Signal(self.filename, "lazy", modulation="FSK")
+        self.assertIsInstance(signal.data, LazySampleArray)
+        self.assertEqual(signal.num_samples, len(data))
+        self.assertTrue(np.array_equal(signal.data[1500:3700], data[1500:3700]))
+        self.assertTrue(np.array_equal(signal.data[3700:1500:-3], data[3700:1500:-3]))
+        self.assertEqual(signal.data[-1], data[-1])
+        self.assertTrue(np.array_equal(signal.real_plot_data[10:20], data.real[10:20]))
+
+        self.assertTrue(np.array_equal(signal.get_min_max_pyramid("real").get_level(0)[1],
+                                       np.maximum.reduceat(data.real, np.arange(0, len(data), 16))))
+
+        for mod_type in range(4):
+            signal.modulation_type = mod_type
+            signal._qad = None
+            expected = Signal("", "expected", modulation=Signal.MODULATION_TYPES[mod_type])
+            expected._fulldata = data
+            expected.noise_threshold = signal.noise_threshold
+            self.assertTrue(np.array_equal(signal.qad, expected.qad))
+
+        signal.mute_range(100, 200)
+        self.assertIsInstance(signal.data, np.ndarray)
+        self.assertFalse(np.any(signal.data[100:200]))
+
+        signal.save_as(self.filename)
+        data[100:200] = 0
+        loaded = Signal(self.filename, "loaded")
+        self.assertTrue(np.array_equal(loaded.data, data))
+        loaded.eliminate()
+        signal.eliminate()
+
+    def test_load_legacy_format(self):
+        self.assertFalse(CompressedSignalFile.is_compressed_signal_file(get_path_for_data_file("pwm.coco")))
+        signal = Signal(get_path_for_data_file("pwm.coco"), "pwm")
+        self.assertGreater(signal.num_samples, 0)
+        self.assertEqual(signal.data.dtype, np.complex64)
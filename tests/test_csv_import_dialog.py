@@ -2,6 +2,8 @@ import os
 import random
 import tempfile
 
+import numpy as np
+
 from tests.QtTestCase import QtTestCase
 from urh.controller.CSVImportDialogController import CSVImportDialogController
 
@@ -87,3 +89,28 @@ class TestCSVImportDialog(QtTestCase):
         i, _ = map(float, last_preview_line.split(";"))
         self.assertEqual(self.dialog.ui.tableWidgetPreview.item(20, self.i_column).text(), str(i))
         self.assertEqual(self.dialog.ui.tableWidgetPreview.item(20, self.q_column).text(), "0.0")
+
+    def test_blockwise_import(self):
+        filename = os.path.join(tempfile.gettempdir(), "blockwise.csv")
+        with open(filename, "w") as f:
+            f.write("Timestamp,I,Q\n")
+
+            for i in range(250):
+                if i == 120:
+                    f.write("invalid row in the middle\n")
+                f.write("{},{},{}\n".format(i / 1e6, i - 125, random.uniform(-1, 1)))
+
+        iq_data, sample_rate = CSVImportDialogController.parse_csv_file(filename, ",", 1, 2, 0)
+        self.assertEqual(len(iq_data), 250)
+
+        target_filename = os.path.join(tempfile.gettempdir(), "blockwise.complex")
+        block_size = CSVImportDialogController.CSV_BLOCK_SIZE
+        CSVImportDialogController.CSV_BLOCK_SIZE = 32
+        try:
+            imported_sample_rate = CSVImportDialogController.import_csv_file(filename, target_filename, ",", 1, 2, 0)
+        finally:
+            CSVImportDialogController.CSV_BLOCK_SIZE = block_size
+
+        self.assertAlmostEqual(sample_rate, 1e6, places=-1)
+        self.assertEqual(sample_rate, imported_sample_rate)
+        self.assertTrue(np.array_equal(np.fromfile(target_filename, dtype=np.complex64), iq_data))
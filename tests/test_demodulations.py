@@ -1,5 +1,9 @@
+import numpy as np
+
 from tests.QtTestCase import QtTestCase
 from tests.utils_testing import get_path_for_data_file
+from urh.cythonext.signalFunctions import afp_demod, afp_demod_chunk, grab_pulse_lens, grab_pulses
+from urh.signalprocessing.ChunkedDemodulator import ChunkedDemodulator
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 
@@ -52,3 +56,106 @@ class TestDemodulations(QtTestCase):
         proto_analyzer = ProtocolAnalyzer(signal)
         proto_analyzer.get_protocol_from_signal()
         self.assertEqual(proto_analyzer.plain_bits_str[0], "101100")
+
+    def test_chunked_demodulation(self):
+        for filename, mod_type in [("ask.complex", 0), ("fsk.complex", 1), ("psk_gen_noisy.complex", 2),
+                                   ("psk_gen_noisy.complex", 3)]:
+            samples = Signal(get_path_for_data_file(filename), "").data
+            demodulated = afp_demod(samples, 0.01, mod_type)
+
+            state, chunks = None, []
+            for i in range(0, len(samples), 1000):
+                chunk, state = afp_demod_chunk(samples[i:i + 1000], 0.01, mod_type, state)
+                chunks.append(chunk)
+            self.assertTrue(np.array_equal(np.concatenate(chunks), demodulated), msg=filename)
+
+            chunked_demodulator = ChunkedDemodulator(samples, 0.01, mod_type, chunk_size=777, max_chunks=2)
+            for start, end in [(5000, 5100), (0, 2000), (len(samples) - 1500, len(samples)), (1200, 4000)]:
+                self.assertTrue(np.array_equal(chunked_demodulator.get_section(start, end), demodulated[start:end]),
+                                msg="{} {}-{}".format(filename, start, end))
+
+    def test_psk_multiple_bursts(self):
+        samples = Signal(get_path_for_data_file("psk_gen_noisy.complex"), "").data
+        gap = np.zeros(1500, dtype=np.complex64)
+        bursts = np.concatenate((samples, gap, 1j * samples[::-1], gap, samples))
+
+        # The Costas loop is carried across the gaps, so the result equals the original sequential loop
+        for mod_type in (2, 3):
+            expected = self.__costa_demod_reference(bursts, 0.01, qam=mod_type == 3)
+            demodulated = afp_demod(bursts, 0.01, mod_type)
+            self.assertTrue(np.allclose(demodulated, expected, rtol=0, atol=1e-4))
+            self.assertTrue(np.array_equal(np.sign(demodulated), np.sign(expected)))
+
+        # With an opt-in reset, bursts after long gaps are independent and demodulated in parallel
+        two_bursts = np.concatenate((samples, gap, samples))
+        demodulated = afp_demod(two_bursts, 0.01, 2, costa_reset_noise_samples=1000)
+        first, second = demodulated[:len(samples)], demodulated[len(samples) + len(gap):]
+        self.assertTrue(np.array_equal(first, afp_demod(samples, 0.01, 2)))
+        self.assertTrue(np.array_equal(first, second))
+
+        state, chunks = None, []
+        for i in range(0, len(two_bursts), 1000):
+            chunk, state = afp_demod_chunk(two_bursts[i:i + 1000], 0.01, 2, state, costa_reset_noise_samples=1000)
+            chunks.append(chunk)
+        self.assertTrue(np.array_equal(np.concatenate(chunks), demodulated))
+
+        chunked_demodulator = ChunkedDemodulator(two_bursts, 0.01, 2, chunk_size=777, costa_reset_noise_samples=1000)
+        self.assertTrue(np.array_equal(chunked_demodulator.get_section(500, 4000), demodulated[500:4000]))
+
+        # Signals read the reset from the settings, changing it invalidates the demodulation
+        signal = Signal("", "bursts", modulation="PSK")
+        signal._fulldata = two_bursts
+        signal.noise_threshold = 0.01
+        self.assertEqual(signal.costa_reset_noise_samples, 0)
+        self.assertTrue(np.array_equal(signal.qad, afp_demod(two_bursts, 0.01, 2)))
+        signal.costa_reset_noise_samples = 1000
+        self.assertTrue(np.array_equal(signal.qad, demodulated))
+
+    @staticmethod
+    def __costa_demod_reference(samples, noise_mag, qam):
+        """
+        Costas loop of the original afp_demod in single precision
+        """
+        f32 = np.float32
+        bw, damp = f32(2 * np.pi / 100), f32(1 / np.sqrt(2))
+        alpha = f32((4 * damp * bw) / (1 + 2 * damp * bw + bw * bw))
+        beta = f32((4 * bw * bw) / (1 + 2 * damp * bw + bw * bw))
+        noise_sqrd = f32(noise_mag) * f32(noise_mag)
+
+        phase, freq = f32(0), f32(0)
+        result = np.empty(len(samples), dtype=np.float32)
+        for i, c in enumerate(samples):
+            real, imag = c.real, c.imag
+            magnitude = real * real + imag * imag
+            if magnitude <= noise_sqrd:
+                result[i] = -4
+                continue
+
+            nco_real, nco_imag = f32(np.cos(-float(phase))), f32(np.sin(-float(phase)))
+            product_real = nco_real * real - nco_imag * imag
+            phase_error = (nco_real * imag + nco_imag * real) * product_real
+            freq += beta * phase_error
+            phase += freq + alpha * phase_error
+            result[i] = magnitude * product_real if qam else product_real
+
+        return result
+
+    def test_chunked_pulse_extraction(self):
+        signal = Signal(get_path_for_data_file("steckdose_anlernen.complex"), "RWE")
+        signal.noise_threshold = 0.06
+        ppseq = np.asarray(grab_pulse_lens(signal.qad, 0, 5, 1, 100))
+
+        types, lengths, _ = grab_pulses(signal.qad, 0, 5, 1, 100)
+        self.assertEqual(types.dtype, np.uint8)
+        self.assertTrue(np.array_equal(types, ppseq[:, 0]))
+        self.assertTrue(np.array_equal(lengths, ppseq[:, 1]))
+
+        state, chunk_types, chunk_lengths = None, [], []
+        for i in range(0, signal.num_samples, 333):
+            types, lengths, state = grab_pulses(signal.qad[i:i + 333], 0, 5, 1, 100, state,
+                                                finish=i + 333 >= signal.num_samples)
+            chunk_types.append(types)
+            chunk_lengths.append(lengths)
+
+        self.assertTrue(np.array_equal(np.concatenate(chunk_types), ppseq[:, 0]))
+        self.assertTrue(np.array_equal(np.concatenate(chunk_lengths), ppseq[:, 1]))
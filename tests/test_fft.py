@@ -0,0 +1,67 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+from urh.signalprocessing.FFT import FFT
+from urh.signalprocessing.Filter import Filter
+
+
+class TestFFT(unittest.TestCase):
+    def setUp(self):
+        self.backend = FFT.backend
+        self.samples = np.random.normal(size=2 * 4096).astype(np.float32).view(np.complex64)
+
+    def tearDown(self):
+        FFT.set_backend(self.backend)
+
+    def test_backends(self):
+        for backend in FFT.BACKENDS:
+            if backend != "numpy" and importlib.util.find_spec(backend) is None:
+                continue
+
+            FFT.set_backend(backend)
+            self.assertEqual(FFT.backend, backend)
+            np.testing.assert_allclose(FFT.fft(self.samples), np.fft.fft(self.samples), rtol=1e-3, atol=1e-3)
+            np.testing.assert_allclose(FFT.ifft(FFT.fft(self.samples, n=5000))[:4096], self.samples, atol=1e-5)
+            np.testing.assert_allclose(FFT.irfft(FFT.rfft(self.samples.real)), self.samples.real, atol=1e-5)
+
+        with self.assertRaises(ValueError):
+            FFT.set_backend("unknown")
+
+    def test_fft_convolution_in_double_precision(self):
+        h = Filter.design_windowed_sinc_lpf(0.1, 0.05)
+        expected = np.convolve(self.samples, h, "same")
+        for backend in FFT.BACKENDS:
+            if backend != "numpy" and importlib.util.find_spec(backend) is None:
+                continue
+
+            FFT.set_backend(backend)
+            result = Filter.fft_convolve_1d(self.samples, h)
+            self.assertEqual(result.dtype, np.complex128)
+            np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_cached_window(self):
+        window = FFT.get_window(np.hanning, 1024)
+        self.assertEqual(window.dtype, np.float32)
+        self.assertIs(FFT.get_window(np.hanning, 1024), window)
+        self.assertFalse(window.flags.writeable)
+        np.testing.assert_allclose(window, np.hanning(1024), atol=1e-7)
+
+        # Windowing keeps complex64 samples in single precision
+        self.assertEqual((self.samples[:1024] * window).dtype, np.complex64)
+
+    def test_magnitude_spectrum(self):
+        sample_rate = 1e6
+        freqs, magnitudes = FFT.magnitude_spectrum(self.samples, sample_rate)
+
+        w = np.abs(np.fft.fft(self.samples))
+        expected_freqs = np.fft.fftfreq(len(w), 1 / sample_rate)
+        idx = np.argsort(expected_freqs)
+        np.testing.assert_array_equal(freqs, expected_freqs[idx].astype(np.float32))
+        np.testing.assert_allclose(magnitudes, w[idx].astype(np.float32), rtol=1e-3, atol=1e-3)
+        self.assertIs(FFT.magnitude_spectrum(self.samples, sample_rate)[0], freqs)
+
+
+if __name__ == '__main__':
+    unittest.main()
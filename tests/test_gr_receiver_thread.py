@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import zmq
+from PyQt5.QtCore import Qt
+
+from urh.dev.gr.ReceiverThread import ReceiverThread
+from urh.util.SettingsProxy import SettingsProxy
+
+
+class TestReceiverThread(unittest.TestCase):
+    def setUp(self):
+        self.context = zmq.Context()
+        self.push_socket = self.context.socket(zmq.PUSH)
+        self.push_socket.bind("inproc://test_receiver_thread")
+
+        self.receiver = ReceiverThread(433e6, 1e6, 1e6, 20, 20, 20)
+        self.receiver.socket = self.context.socket(zmq.PULL)
+        self.receiver.socket.connect("inproc://test_receiver_thread")
+        self.indices = []
+        self.receiver.index_changed.connect(lambda old, new: self.indices.append((old, new)), Qt.DirectConnection)
+
+    def tearDown(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = None
+        self.receiver.socket.close()
+        self.push_socket.close()
+        self.context.term()
+
+    def send(self, data: bytes, split_positions):
+        for start, end in zip([0] + split_positions, split_positions + [len(data)]):
+            self.push_socket.send(data[start:end])
+
+    def test_receive_split_samples(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = 1000
+        samples = np.arange(100, dtype=np.float32).astype(np.complex64) * (1 + 2j)
+        self.send(samples.tobytes(), [3, 13, 100, 101, 555])
+
+        self.receiver.recv_chunk_size = 200
+        self.assertTrue(self.receiver.receive_chunk())
+        self.assertEqual(self.indices, [(0, 69)])
+        self.assertTrue(self.receiver.receive_chunk())
+        self.assertEqual(self.receiver.current_index, 100)
+        self.assertEqual(self.indices[-1], (69, 100))
+        self.assertTrue(np.array_equal(self.receiver.data[:100], samples))
+
+    def test_resume_on_full_receive_buffer(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = 50
+        self.receiver.resume_on_full_receive_buffer = True
+        samples = np.arange(80, dtype=np.float32).astype(np.complex64)
+        self.send(samples.tobytes(), [i for i in range(20, 640, 20)])
+
+        self.assertTrue(self.receiver.receive_chunk())
+        self.assertEqual(self.receiver.current_index, 80 - 47)
+        self.assertEqual(self.indices, [(0, 47), (0, 80 - 47)])
+        self.assertTrue(np.array_equal(self.receiver.data[:80 - 47], samples[47:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
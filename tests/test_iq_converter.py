@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from urh.signalprocessing.Signal import Signal
+from urh.util.IQConverter import IQConverter
+from urh.util.LazySampleArray import LazySampleArray
+
+
+class TestIQConverter(unittest.TestCase):
+    def test_convert_uint8(self):
+        raw = np.random.randint(0, 256, 2 * IQConverter.BLOCK_SIZE + 10, dtype=np.uint8)
+        result = IQConverter.convert_to_complex64(raw)
+
+        self.assertEqual(result.dtype, np.complex64)
+        self.assertEqual(len(result), len(raw) // 2)
+        self.assertTrue(np.array_equal(result.real, ((raw[0::2] / 127.5) - 1.0).astype(np.float32)))
+        self.assertTrue(np.array_equal(result.imag, ((raw[1::2] / 127.5) - 1.0).astype(np.float32)))
+
+    def test_convert_int8(self):
+        raw = np.random.randint(-128, 128, 1001, dtype=np.int8)
+        result = IQConverter.convert_to_complex64(raw)
+
+        self.assertEqual(len(result), 500)
+        self.assertTrue(np.array_equal(result.real, ((raw[0:-1:2] + 0.5) / 127.5).astype(np.float32)))
+        self.assertTrue(np.array_equal(result.imag, ((raw[1::2] + 0.5) / 127.5).astype(np.float32)))
+
+    def test_convert_int16(self):
+        raw = np.array([-32768, 32767, 0, -1], dtype=np.int16)
+        result = IQConverter.convert_to_complex64(raw)
+        self.assertTrue(np.allclose(result, [-1 + 1j, (0.5 - 0.5j) / 32767.5]))
+
+    def test_convert_into_buffer(self):
+        out = np.zeros(100, dtype=np.complex64)
+        raw = np.full(20, 255, dtype=np.uint8)
+        result = IQConverter.convert_to_complex64(raw, out=out[10:])
+
+        self.assertEqual(len(result), 10)
+        self.assertTrue(np.all(out[10:20] == 1 + 1j))
+        self.assertTrue(np.all(out[:10] == 0))
+        self.assertTrue(np.all(out[20:] == 0))
+
+        self.assertRaises(ValueError, IQConverter.convert_to_complex64, raw, np.zeros(5, dtype=np.complex64))
+
+    def test_convert_back_from_complex64(self):
+        for dtype in (np.uint8, np.int8):
+            raw = np.tile(np.arange(256, dtype=np.uint8).view(dtype), 2 * IQConverter.BLOCK_SIZE // 256 + 2)
+            samples = IQConverter.convert_to_complex64(raw)
+            result = IQConverter.convert_from_complex64(samples, dtype)
+            self.assertEqual(result.dtype, dtype)
+            self.assertTrue(np.array_equal(result, raw))
+
+        self.assertRaises(ValueError, IQConverter.convert_from_complex64, samples, np.int16)
+
+    def test_load_complex16_files(self):
+        raw = np.random.randint(-128, 128, 2000, dtype=np.int8)
+        filename = os.path.join(tempfile.gettempdir(), "test_iq_converter.complex16s")
+        raw.tofile(filename)
+        signal = Signal(filename, "test")
+        self.assertIsInstance(signal.data, LazySampleArray)
+        self.assertEqual(signal.num_samples, 1000)
+        self.assertTrue(np.array_equal(signal.data.real, ((raw[0::2] + 0.5) / 127.5).astype(np.float32)))
+        self.assertTrue(np.array_equal(signal.data[100:300], IQConverter.convert_to_complex64(raw[200:600])))
+
+        # Overwrite the file the samples are converted from
+        expected = np.asarray(signal.data).copy()
+        expected[:10] = 0
+        signal.mute_range(0, 10)
+        signal.save_as(filename)
+        signal.eliminate()
+        loaded = Signal(filename, "loaded")
+        self.assertTrue(np.allclose(loaded.data, expected, atol=1 / 127.5))
+        loaded.eliminate()
+        os.remove(filename)
+
+    def test_lazy_conversion(self):
+        raw = np.random.randint(0, 256, 2 * 1000, dtype=np.uint8)
+        filename = os.path.join(tempfile.gettempdir(), "test_iq_converter.complex16u")
+        raw.tofile(filename)
+        expected = IQConverter.convert_to_complex64(raw)
+
+        samples = LazySampleArray.from_iq_file(filename, np.uint8, block_size=64)
+        samples.max_blocks = 4
+        self.assertEqual(len(samples), 1000)
+        self.assertEqual(samples[-3], expected[-3])
+        for start, end in [(0, 10), (60, 70), (100, 300), (0, 1000), (999, 1000), (500, 400)]:
+            self.assertTrue(np.array_equal(samples[start:end], expected[start:end]))
+        self.assertTrue(np.array_equal(samples[::7], expected[::7]))
+        self.assertTrue(np.array_equal(samples[900:10:-3], expected[900:10:-3]))
+        self.assertTrue(np.array_equal(samples.imag[5:500], expected.imag[5:500]))
+        self.assertTrue(np.array_equal(np.asarray(samples), expected))
+        self.assertRaises(IndexError, samples.__getitem__, 1000)
+
+        del samples
+        os.remove(filename)
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from urh.util.MinMaxPyramid import MinMaxPyramid
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def test_levels(self):
+        samples = np.random.uniform(-1, 1, 100003).astype(np.float32)
+        pyramid = MinMaxPyramid(samples)
+
+        for level in (0, 1, 5):
+            block_size = pyramid.block_size(level)
+            minimums, maximums = pyramid.get_level(level)
+            self.assertEqual(len(minimums), -(-len(samples) // block_size))
+            for i in (0, 17, len(minimums) - 1):
+                block = samples[i * block_size:(i + 1) * block_size]
+                self.assertEqual(minimums[i], block.min())
+                self.assertEqual(maximums[i], block.max())
+
+        self.assertEqual(pyramid.minmax(), (float(samples.min()), float(samples.max())))
+
+    def test_get_section(self):
+        samples = np.sin(np.arange(10 ** 6, dtype=np.float32) / 1000)
+        pyramid = MinMaxPyramid(samples)
+
+        self.assertIsNone(pyramid.get_section(0, 1000, 500))  # Close zoom uses the samples directly
+
+        x, values = pyramid.get_section(1234, 987654, 1000)
+        self.assertLessEqual(len(values), 4 * 1000 + 4)
+        self.assertLessEqual(x[0], 1234)
+        self.assertGreaterEqual(x[-1] + pyramid.block_size(pyramid.level_for((987654 - 1234) / 1000)), 987654)
+        self.assertAlmostEqual(values.max(), samples[1234:987654].max(), places=3)
+        self.assertAlmostEqual(values.min(), samples[1234:987654].min(), places=3)
+
+    def test_strided_source(self):
+        data = (np.arange(1000) + 1j * -np.arange(1000)).astype(np.complex64)
+        pyramid = MinMaxPyramid(data.imag)
+        self.assertEqual(pyramid.minmax(), (-999, 0))
+
+    def test_first_level_in_sections(self):
+        samples = np.random.uniform(-1, 1, 10003).astype(np.float32)
+        expected = MinMaxPyramid(samples).get_level(0)
+
+        pyramid = MinMaxPyramid(samples)
+        pyramid.SCAN_SIZE = 1024
+        minimums, maximums = pyramid.get_level(0)
+        self.assertTrue(np.array_equal(minimums, expected[0]))
+        self.assertTrue(np.array_equal(maximums, expected[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import socket
+import time
+import unittest
+
+import numpy as np
+
+from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import NetworkSDRInterfacePlugin
+from urh.util.SettingsProxy import SettingsProxy
+
+
+class TestNetworkSDRInterface(unittest.TestCase):
+    TIMEOUT = 5
+
+    def setUp(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = 1000
+        self.plugin = NetworkSDRInterfacePlugin(raw_mode=True)
+        self.plugin.server_port = self.get_free_port()
+        # Cleanups run in reverse order, so the server is stopped after all client sockets are closed
+        self.addCleanup(self.plugin.stop_tcp_server)
+
+    def tearDown(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = None
+
+    @staticmethod
+    def get_free_port():
+        s = socket.socket()
+        s.bind(("", 0))
+        port = s.getsockname()[1]
+        s.close()
+        return port
+
+    def wait_for_index(self, index: int):
+        t = time.time()
+        while self.plugin.current_receive_index != index and time.time() - t < self.TIMEOUT:
+            time.sleep(0.01)
+        self.assertEqual(self.plugin.current_receive_index, index)
+
+    def test_receive_tcp_stream(self):
+        self.plugin.use_udp = False
+        self.plugin.start_tcp_server_for_receiving()
+
+        samples = np.arange(300, dtype=np.float32).astype(np.complex64) * (1 - 1j)
+        data = samples.tobytes()
+
+        sock = socket.create_connection(("127.0.0.1", self.plugin.server_port))
+        self.addCleanup(sock.close)
+        sock.sendall(data[:805])
+
+        # Samples show up while the connection is still open, the incomplete sample is kept back
+        self.wait_for_index(100)
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[:100], samples[:100]))
+
+        sock.sendall(data[805:])
+        self.wait_for_index(300)
+        sock.close()
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[:300], samples))
+
+        # The receive buffer wraps around, when it is full
+        sock = socket.create_connection(("127.0.0.1", self.plugin.server_port))
+        self.addCleanup(sock.close)
+        sock.sendall(data + data)
+        self.wait_for_index(900)
+        sock.sendall(data)
+        self.wait_for_index(200)
+        sock.close()
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[900:], samples[:100]))
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[:200], samples[100:]))
+
+    def test_receive_udp_datagrams(self):
+        self.plugin.use_udp = True
+        self.plugin.start_tcp_server_for_receiving()
+
+        samples = np.arange(200, dtype=np.float32).astype(np.complex64) * (2 + 1j)
+        data = samples.tobytes()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(sock.close)
+        for i in range(0, len(data), 400):
+            sock.sendto(data[i:i + 400], ("127.0.0.1", self.plugin.server_port))
+            self.wait_for_index((i + 400) // 8)
+
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[:200], samples))
+
+        # The incomplete sample at the end of a datagram is dropped and not continued by the next one
+        sock.sendto(data[:805], ("127.0.0.1", self.plugin.server_port))
+        self.wait_for_index(300)
+        sock.sendto(data[:80], ("127.0.0.1", self.plugin.server_port))
+        self.wait_for_index(310)
+        sock.close()
+
+        self.assertEqual(self.plugin.server.num_partial_bytes, 0)
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[200:300], samples[:100]))
+        self.assertTrue(np.array_equal(self.plugin.receive_buffer[300:310], samples[:10]))
+
+
+if __name__ == '__main__':
+    unittest.main()
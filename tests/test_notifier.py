@@ -0,0 +1,93 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+import urh
+from tests.utils_testing import get_path_for_data_file
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.Signal import Signal
+from urh.util.Notifier import Notifier
+from urh.util.QtNotifierAdapter import SignalQtAdapter, ProtocolAnalyzerQtAdapter
+
+
+class TestNotifier(unittest.TestCase):
+    def test_connect_emit_disconnect(self):
+        signal = Signal("", "test")
+        other_signal = Signal("", "other")
+        received = []
+
+        signal.bit_len_changed.connect(received.append)
+        signal.bit_len = 42
+        other_signal.bit_len = 24
+        self.assertEqual(received, [42])
+
+        signal.bit_len_changed.disconnect(received.append)
+        signal.bit_len = 43
+        self.assertEqual(received, [42])
+
+        with self.assertRaises(TypeError):
+            signal.bit_len_changed.disconnect(received.append)
+
+    def test_block_all(self):
+        signal = Signal("", "test")
+        received = []
+        signal.bit_len_changed.connect(received.append)
+        signal.protocol_needs_update.connect(lambda: received.append("update"))
+
+        Notifier.block_all(signal, True)
+        signal.bit_len = 42
+        self.assertEqual(received, [])
+
+        Notifier.block_all(signal, False)
+        signal.bit_len = 43
+        self.assertEqual(received, [43, "update"])
+
+    def test_copy_and_pickle_drop_connections(self):
+        signal = Signal(get_path_for_data_file("ask.complex"), "ASK")
+        signal.bit_len_changed.connect(lambda value: None)
+
+        proto_analyzer = ProtocolAnalyzer(signal)
+        proto_analyzer.qt_signals.protocol_updated.connect(lambda: None)
+        proto_analyzer.get_protocol_from_signal()
+
+        self.assertEqual(len(copy.deepcopy(proto_analyzer).qt_signals.protocol_updated.callbacks), 0)
+
+        unpickled = pickle.loads(pickle.dumps(proto_analyzer.messages))
+        self.assertEqual(unpickled[0].plain_bits_str, proto_analyzer.messages[0].plain_bits_str)
+
+        # Signals are not QObjects anymore, so they can be sent to worker processes
+        self.assertEqual(len(pickle.loads(pickle.dumps(Signal("", "test"))).bit_len_changed.callbacks), 0)
+
+    def test_qt_adapter(self):
+        signal = Signal("", "test")
+        proto_analyzer = ProtocolAnalyzer(signal)
+        signal_adapter = SignalQtAdapter(signal)
+        protocol_adapter = ProtocolAnalyzerQtAdapter(proto_analyzer)
+
+        received = []
+        signal_adapter.bit_len_changed.connect(received.append)
+        signal_adapter.protocol_needs_update.connect(lambda: received.append("update"))
+        protocol_adapter.protocol_updated.connect(lambda: received.append("protocol"))
+
+        signal.bit_len = 42
+        proto_analyzer.qt_signals.protocol_updated.emit()
+        self.assertEqual(received, [42, "update", "protocol"])
+
+        signal_adapter.disconnect_source()
+        signal.bit_len = 43
+        self.assertEqual(received, [42, "update", "protocol"])
+        self.assertEqual(len(signal.bit_len_changed.callbacks), 0)
+
+    def test_core_without_qt(self):
+        # Import in a fresh interpreter, since the test process already loaded Qt
+        code = "import sys\n" \
+               "import urh.signalprocessing.Signal, urh.signalprocessing.ProtocolAnalyzer\n" \
+               "import urh.signalprocessing.Spectrogram, urh.signalprocessing.ContinuousModulator\n" \
+               "import urh.signalprocessing.ProtocolSniffer\n" \
+               "assert 'PyQt5' not in sys.modules, [m for m in sys.modules if m.startswith('PyQt5')]"
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(urh.__file__)))
+        result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
@@ -1,7 +1,13 @@
+import os
+import shutil
+import tempfile
+
 from tests.QtTestCase import QtTestCase
+from urh import constants
 from urh.controller.OptionsController import OptionsController
 from urh.models.PluginListModel import PluginListModel
 from urh.plugins.PluginManager import PluginManager
+from urh.util.SignalCache import SignalCache
 
 class TestOptionsGUI(QtTestCase):
     def setUp(self):
@@ -62,3 +68,49 @@ class TestOptionsGUI(QtTestCase):
         self.assertFalse(self.dialog.ui.radioButtonGnuradioDirectory.isChecked())
         self.assertFalse(self.dialog.ui.lineEditGnuradioDirectory.isEnabled())
         self.assertTrue(self.dialog.ui.lineEditPython2Interpreter.isEnabled())
+
+    def test_performance_tab(self):
+        self.dialog.ui.tabWidget.setCurrentIndex(5)
+        self.assertEqual(self.dialog.ui.tabWidget.tabText(5), "Performance")
+
+        old_value = constants.SETTINGS.value("costa_reset_noise_samples", 0, int)
+        self.assertEqual(self.dialog.ui.spinBoxCostaResetNoiseSamples.value(), old_value)
+
+        changed_options = []
+        self.dialog.values_changed.connect(changed_options.append)
+        self.dialog.ui.spinBoxCostaResetNoiseSamples.setValue(old_value + 1000)
+        self.dialog.close()
+        self.dialog.ui.spinBoxCostaResetNoiseSamples.setValue(old_value)  # tearDown closes the dialog again
+        constants.SETTINGS.setValue("costa_reset_noise_samples", old_value)
+        self.assertEqual(changed_options[-1]["costa_reset_noise_samples"], old_value + 1000)
+
+    def test_signal_cache_settings(self):
+        SignalCache.CACHE_DIR = tempfile.mkdtemp()
+        old_enabled = SignalCache.ENABLED
+        old_use_cache = constants.SETTINGS.value("use_signal_cache", True, bool)
+        old_size = constants.SETTINGS.value("signal_cache_size_mb", SignalCache.DEFAULT_SIZE_MB, int)
+        try:
+            with open(os.path.join(SignalCache.CACHE_DIR, "entry.qad"), "wb") as f:
+                f.write(bytes(2 * 1024 ** 2))
+            self.dialog.show_signal_cache_usage()
+            self.assertEqual(self.dialog.ui.labelSignalCacheUsage.text(), "Currently used: 2 MiB")
+
+            self.dialog.ui.btnClearSignalCache.click()
+            self.assertEqual(os.listdir(SignalCache.CACHE_DIR), [])
+            self.assertEqual(self.dialog.ui.labelSignalCacheUsage.text(), "Currently used: 0 MiB")
+
+            self.dialog.ui.checkBoxUseSignalCache.setChecked(not old_use_cache)
+            self.dialog.ui.spinBoxSignalCacheSize.setValue(512)
+            self.dialog.close()
+            self.assertEqual(SignalCache.ENABLED, not old_use_cache)
+            self.assertEqual(constants.SETTINGS.value("use_signal_cache", type=bool), not old_use_cache)
+            self.assertEqual(constants.SETTINGS.value("signal_cache_size_mb", type=int), 512)
+        finally:
+            # tearDown closes the dialog again
+            self.dialog.ui.checkBoxUseSignalCache.setChecked(old_use_cache)
+            self.dialog.ui.spinBoxSignalCacheSize.setValue(old_size)
+            constants.SETTINGS.setValue("use_signal_cache", old_use_cache)
+            constants.SETTINGS.setValue("signal_cache_size_mb", old_size)
+            SignalCache.ENABLED = old_enabled
+            shutil.rmtree(SignalCache.CACHE_DIR)
+            SignalCache.CACHE_DIR = None
@@ -1,6 +1,9 @@
+import numpy as np
+
 from tests.QtTestCase import QtTestCase
 from tests.utils_testing import get_path_for_data_file
 from urh import constants
+from urh.cythonext.signalFunctions import grab_pulses
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 
@@ -38,3 +41,64 @@ class TestProtocolAnalyzer(QtTestCase):
         self.assertAlmostEqual(1, freq / 10000, places = 1)  # Freq for 1 is 10K
         freq = pa.estimate_frequency_for_zero(1e6)
         self.assertAlmostEqual(3, freq / 10000, places = 1)  # Freq for 0 is 30K
+
+    def test_pulses_to_bits(self):
+        # Leading pause, message 1 with short pause, long pause, pause only segment, message 2
+        pulse_types = np.array([42, 1, 0, 42, 1, 42, 0, 42, 1, 0, 42], dtype=np.uint8)
+        pulse_lengths = np.array([50, 20, 10, 20, 10, 100, 30, 100, 10, 20, 15], dtype=np.uint64)
+
+        bits, bit_offsets, pauses, bit_sample_pos, bit_sample_pos_offsets = \
+            ProtocolAnalyzer.pulses_to_bits(pulse_types, pulse_lengths, 10, pause_threshold=8)
+
+        self.assertEqual(bits.tolist(), [1, 1, 0, 0, 0, 1, 1, 0, 0, 0])
+        self.assertEqual(bit_offsets.tolist(), [0, 6, 10])
+        self.assertEqual(pauses.tolist(), [100, 15])
+        self.assertEqual(bit_sample_pos_offsets.tolist(), [0, 8, 13])
+        self.assertEqual(bit_sample_pos.tolist(), [50, 60, 70, 80, 90, 100, 110, 210,
+                                                   340, 350, 360, 370, 385])
+
+        bits_without_pos, _, _, bit_sample_pos, _ = \
+            ProtocolAnalyzer.pulses_to_bits(pulse_types, pulse_lengths, 10, write_bit_sample_pos=False)
+        self.assertTrue(np.array_equal(bits_without_pos, bits))
+        self.assertEqual(len(bit_sample_pos), 0)
+
+    def test_parallel_pulse_extraction(self):
+        signal = Signal(get_path_for_data_file("steckdose_anlernen.complex"), "RWE")
+        signal.noise_threshold = 0.06
+        qad = np.concatenate([signal.qad] * 4)
+
+        types, lengths, _ = grab_pulses(qad, 0, 5, 1, 100)
+        for num_threads in (2, 3, 8):
+            parallel_types, parallel_lengths = ProtocolAnalyzer.grab_pulses_parallel(qad, 0, 5, 1, 100,
+                                                                                     min_samples_per_thread=1000,
+                                                                                     num_threads=num_threads)
+            self.assertTrue(np.array_equal(parallel_types, types))
+            self.assertTrue(np.array_equal(parallel_lengths, lengths))
+
+    def test_pulse_cache(self):
+        signal = Signal(get_path_for_data_file("steckdose_anlernen.complex"), "RWE")
+        signal.noise_threshold = 0.06
+        signal.qad_center = 0
+        signal.bit_len = 100
+        proto_analyzer = ProtocolAnalyzer(signal)
+        proto_analyzer.get_protocol_from_signal()
+        pulses = signal.get_cached_pulses()
+        self.assertIsNotNone(pulses)
+
+        signal.bit_len = 50
+        signal.pause_threshold = 4
+        self.assertIs(signal.get_cached_pulses(), pulses)
+        proto_analyzer.get_protocol_from_signal()
+        cached_bits = proto_analyzer.plain_bits_str
+
+        signal.tolerance = 6
+        self.assertIsNone(signal.get_cached_pulses())
+        signal.tolerance = 5
+        proto_analyzer.get_protocol_from_signal()
+        self.assertEqual(proto_analyzer.plain_bits_str, cached_bits)
+
+        signal.mute_range(0, 10)
+        self.assertIsNone(signal.get_cached_pulses())
+
+        signal.modulation_type = 0
+        self.assertIsNone(signal.get_cached_pulses())
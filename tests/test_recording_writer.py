@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from urh.dev.RecordingWriter import RecordingWriter
+from urh.dev.native.Device import Device
+from urh.signalprocessing.Signal import Signal
+from urh.util.IQConverter import IQConverter
+from urh.util.SettingsProxy import SettingsProxy
+
+
+class Int8Device(Device):
+    NATIVE_DTYPE = np.int8
+    NUM_CHUNKS = 20
+
+    @classmethod
+    def init_device(cls, ctrl_connection, is_tx: bool, parameters):
+        cls.num_sent = 0
+        return True
+
+    @classmethod
+    def prepare_sync_receive(cls, ctrl_connection):
+        pass
+
+    @classmethod
+    def receive_sync(cls, data_conn):
+        if cls.num_sent < cls.NUM_CHUNKS:
+            data_conn.send_bytes(np.arange(-128, 128, dtype=np.int8).tobytes())
+            cls.num_sent += 1
+        else:
+            time.sleep(0.01)
+
+    @classmethod
+    def shutdown_device(cls, ctrl_connection, is_tx: bool):
+        pass
+
+    @staticmethod
+    def unpack_complex(buffer):
+        return IQConverter.convert_to_complex64(np.frombuffer(buffer, dtype=np.int8))
+
+
+class TestRecordingWriter(unittest.TestCase):
+    def setUp(self):
+        self.block_size = RecordingWriter.BLOCK_SIZE
+        RecordingWriter.BLOCK_SIZE = 1000
+        self.filenames = []
+
+    def tearDown(self):
+        RecordingWriter.BLOCK_SIZE = self.block_size
+        for filename in self.filenames:
+            if os.path.isfile(filename):
+                os.remove(filename)
+
+    def get_filename(self, extension: str):
+        filename = os.path.join(tempfile.gettempdir(), "test_recording_writer" + extension)
+        self.filenames.append(filename)
+        return filename
+
+    def test_write_complex(self):
+        filename = self.get_filename(".complex")
+        writer = RecordingWriter(filename)
+        samples = np.arange(4321, dtype=np.float32).astype(np.complex64)
+        for i in range(0, len(samples), 700):
+            writer.write(samples[i:i + 700])
+        writer.close()
+        writer.write(samples)  # ignored after close
+
+        self.assertEqual(writer.num_samples, len(samples))
+        self.assertTrue(np.array_equal(np.fromfile(filename, dtype=np.complex64), samples))
+
+    def test_write_native_format(self):
+        filename = self.get_filename(RecordingWriter.file_extension(np.uint8))
+        self.assertTrue(filename.endswith(".complex16u"))
+
+        raw = np.random.randint(0, 256, 2 * 2500, dtype=np.uint8)
+        writer = RecordingWriter(filename, np.uint8)
+        writer.write(IQConverter.convert_to_complex64(raw))
+        writer.close()
+
+        self.assertEqual(os.path.getsize(filename), len(raw))
+        self.assertTrue(np.array_equal(np.fromfile(filename, dtype=np.uint8), raw))
+        self.assertRaises(ValueError, RecordingWriter, filename, np.int16)
+
+    def test_device_record_to_file(self):
+        filename = self.get_filename(".complex16s")
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = 1000
+        try:
+            device = Int8Device(center_freq=433e6, sample_rate=1e6, bandwidth=1e6, gain=20)
+            device.record_filename = filename
+            device.start_rx_mode()
+
+            num_samples = Int8Device.NUM_CHUNKS * 128
+            for _ in range(100):
+                if device.recording_writer.num_samples == num_samples:
+                    break
+                time.sleep(0.05)
+            device.stop_rx_mode("Test finished")
+        finally:
+            SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = None
+
+        # Samples are only read from the shared receive buffer by one thread at once
+        self.assertFalse(device.read_recv_buffer_thread.is_alive())
+
+        # Receive buffer only holds a window of the recording
+        self.assertEqual(len(device.receive_buffer), 1000)
+        self.assertTrue(device.recording_writer.is_closed)
+
+        raw = np.tile(np.arange(-128, 128, dtype=np.int8), Int8Device.NUM_CHUNKS)
+        self.assertTrue(np.array_equal(np.fromfile(filename, dtype=np.int8), raw))
+
+        signal = Signal(filename, "recording")
+        self.assertEqual(signal.num_samples, num_samples)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,18 @@
 import unittest
+from multiprocessing import Process
 
 import numpy as np
 
 from urh.util.RingBuffer import RingBuffer
 
 
+def push_chunks(ring_buffer: RingBuffer, num_chunks: int, chunk_size: int):
+    for i in range(num_chunks):
+        while not ring_buffer.will_fit(chunk_size):
+            pass
+        ring_buffer.push(np.arange(i * chunk_size, (i + 1) * chunk_size, dtype=np.complex64))
+
+
 class TestRingBuffer(unittest.TestCase):
     def test_push(self):
         ring_buffer = RingBuffer(size=10)
@@ -75,5 +83,87 @@ class TestRingBuffer(unittest.TestCase):
         self.assertTrue(ring_buffer.will_fit(4))
         self.assertFalse(ring_buffer.will_fit(5))
 
+    def test_pop_into(self):
+        ring_buffer = RingBuffer(size=8)
+        out = np.zeros(6, dtype=np.complex64)
+        self.assertEqual(ring_buffer.pop_into(out), 0)
+
+        ring_buffer.push(np.arange(5, dtype=np.complex64))
+        self.assertEqual(ring_buffer.pop_into(out[:4], ensure_even_length=True), 4)
+        np.testing.assert_array_equal(out[:4], [0, 1, 2, 3])
+        self.assertEqual(ring_buffer.pop_into(out, ensure_even_length=True), 0)
+
+        # Wrap around the end of the buffer
+        ring_buffer.push(np.arange(10, 15, dtype=np.complex64))
+        self.assertEqual(ring_buffer.left_index, 4)
+        self.assertEqual(ring_buffer.right_index, 2)
+        self.assertEqual(ring_buffer.pop_into(out), 6)
+        np.testing.assert_array_equal(out, [4, 10, 11, 12, 13, 14])
+        self.assertTrue(ring_buffer.is_empty)
+
+    def test_view_segments(self):
+        ring_buffer = RingBuffer(size=6)
+        ring_buffer.push(np.arange(5, dtype=np.complex64))
+        ring_buffer.pop(4)
+
+        first, second = ring_buffer.view_segments
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 4)
+        self.assertTrue(np.shares_memory(first, ring_buffer.data))
+        np.testing.assert_array_equal(ring_buffer.view_data, np.concatenate((ring_buffer.data[4:],
+                                                                              ring_buffer.data[:4])))
+
+    def test_clear(self):
+        ring_buffer = RingBuffer(size=6)
+        ring_buffer.push(np.arange(5, dtype=np.complex64))
+        ring_buffer.pop(1)
+
+        ring_buffer.clear()
+        self.assertTrue(ring_buffer.is_empty)
+        self.assertEqual(len(ring_buffer.pop(5)), 0)
+
+        # Space of discarded values is released by the consumer only
+        self.assertEqual(ring_buffer.space_left, 6)
+        ring_buffer.push(np.arange(10, 13, dtype=np.complex64))
+        ring_buffer.clear()
+        ring_buffer.push(np.arange(20, 22, dtype=np.complex64))
+        self.assertEqual(ring_buffer.space_left, 1)
+        self.assertFalse(ring_buffer.will_fit(2))
+        self.assertEqual(len(ring_buffer), 2)
+
+        np.testing.assert_array_equal(ring_buffer.pop(6), [20, 21])
+        self.assertEqual(ring_buffer.space_left, 6)
+
+    def test_push_or_drop(self):
+        ring_buffer = RingBuffer(size=10)
+        self.assertEqual(ring_buffer.push_or_drop(np.arange(7, dtype=np.complex64)), 7)
+        out = np.zeros(5, dtype=np.complex64)
+        self.assertEqual(ring_buffer.pop_into(out), 5)
+        np.testing.assert_array_equal(out, np.arange(5))
+
+        # Wraps around and drops what does not fit
+        self.assertEqual(ring_buffer.push_or_drop(np.arange(10, 20, dtype=np.complex64)), 8)
+        self.assertEqual(ring_buffer.num_dropped, 2)
+        out = np.zeros(20, dtype=np.complex64)
+        self.assertEqual(ring_buffer.pop_into(out), 10)
+        np.testing.assert_array_equal(out[:10], [5, 6, 10, 11, 12, 13, 14, 15, 16, 17])
+        self.assertTrue(ring_buffer.is_empty)
+
+    def test_push_from_process(self):
+        ring_buffer = RingBuffer(size=1000)
+        num_chunks, chunk_size = 500, 300
+        process = Process(target=push_chunks, args=(ring_buffer, num_chunks, chunk_size))
+        process.start()
+
+        result = np.empty(num_chunks * chunk_size, dtype=np.complex64)
+        received = 0
+        while received < len(result):
+            received += ring_buffer.pop_into(result[received:received + 128])
+
+        process.join()
+        np.testing.assert_array_equal(result, np.arange(num_chunks * chunk_size))
+        self.assertTrue(ring_buffer.is_empty)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,99 @@
+import time
+import unittest
+from multiprocessing import Pipe, Process
+
+import numpy as np
+from PyQt5.QtCore import Qt
+
+from urh.dev.native.Device import Device
+from urh.dev.native.SharedReceiveBuffer import SharedReceiveBuffer, SharedReceiveBufferWriter
+from urh.util.SettingsProxy import SettingsProxy
+
+
+def unpack_complex(buffer):
+    return np.frombuffer(buffer, dtype=np.complex64)
+
+
+def write_chunks(writer: SharedReceiveBufferWriter, num_chunks: int, chunk_size: int):
+    for i in range(num_chunks):
+        writer.send_bytes(np.arange(i * chunk_size, (i + 1) * chunk_size, dtype=np.complex64).tobytes())
+    writer.close()
+
+
+class DummyDevice(Device):
+    CHUNK_SIZE = 1000
+
+    @classmethod
+    def init_device(cls, ctrl_connection, is_tx: bool, parameters):
+        cls.num_sent = 0
+        return True
+
+    @classmethod
+    def prepare_sync_receive(cls, ctrl_connection):
+        pass
+
+    @classmethod
+    def receive_sync(cls, data_conn):
+        if cls.num_sent < 10:
+            start = cls.num_sent * cls.CHUNK_SIZE
+            data_conn.send_bytes(np.arange(start, start + cls.CHUNK_SIZE, dtype=np.complex64).tobytes())
+            cls.num_sent += 1
+        else:
+            time.sleep(0.01)
+
+    @classmethod
+    def shutdown_device(cls, ctrl_connection, is_tx: bool):
+        pass
+
+    @staticmethod
+    def unpack_complex(buffer):
+        return unpack_complex(buffer)
+
+
+class TestSharedReceiveBuffer(unittest.TestCase):
+    def test_write_from_process(self):
+        buffer = SharedReceiveBuffer(size=100000)
+        parent_conn, child_conn = Pipe(duplex=False)
+        process = Process(target=write_chunks, args=(SharedReceiveBufferWriter(buffer, child_conn, unpack_complex),
+                                                     10, 5000))
+        process.start()
+        process.join(10)
+        child_conn.close()
+
+        received = np.zeros(100000, dtype=np.complex64)
+        self.assertEqual(buffer.pop_into(received), 50000)
+        np.testing.assert_array_equal(received[:50000], np.arange(50000))
+
+        num_notifications = 0
+        try:
+            while True:
+                self.assertEqual(len(parent_conn.recv_bytes()), 1)
+                num_notifications += 1
+        except EOFError:
+            pass
+        self.assertEqual(num_notifications, 10)
+
+    def test_device_receive(self):
+        SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = 50000
+        try:
+            device = DummyDevice(center_freq=433e6, sample_rate=1e6, bandwidth=1e6, gain=20)
+            indices = []
+            device.rcv_index_changed.connect(lambda old, new: indices.append((old, new)), Qt.DirectConnection)
+            device.start_rx_mode()
+
+            for _ in range(100):
+                if device.current_recv_index == 10000:
+                    break
+                time.sleep(0.05)
+            device.stop_rx_mode("Test finished")
+        finally:
+            SettingsProxy.OVERWRITE_RECEIVE_BUFFER_SIZE = None
+
+        self.assertEqual(device.current_recv_index, 10000)
+        np.testing.assert_array_equal(device.received_data, np.arange(10000))
+        self.assertEqual(indices[0][0], 0)
+        self.assertEqual(indices[-1][1], 10000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,15 @@
+import os
+import tempfile
+import wave
+
+import numpy as np
+
 from tests.QtTestCase import QtTestCase
 from tests.utils_testing import get_path_for_data_file
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
+from urh.util import FileOperator
+
 
 class TestSignal(QtTestCase):
     def setUp(self):
@@ -24,3 +32,79 @@ class TestSignal(QtTestCase):
         start, nsamples = pa.get_samplepos_of_bitseq(0, 0, 0, 1, False)
         freq = s.estimate_frequency(start, start + nsamples, 1e6)
         self.assertEqual(freq, 10000)  # Freq for 1 is 10K
+
+    def test_memory_mapped_complex_file(self):
+        filename = get_path_for_data_file("steckdose_anlernen.complex")
+        orig_data = np.fromfile(filename, dtype=np.complex64)
+        s = Signal(filename, "RWE")
+        self.assertIsInstance(s.data, np.memmap)
+        self.assertEqual(s.num_samples, len(orig_data))
+
+        s.mute_range(0, 100)
+        self.assertTrue(np.all(s.data[:100] == 0))
+        self.assertTrue(np.array_equal(np.fromfile(filename, dtype=np.complex64), orig_data))
+
+        new_signal = s.create_new(100, 1000)
+        self.assertTrue(np.array_equal(new_signal.data, orig_data[100:1000]))
+
+        s.crop_to_range(500, 600)
+        self.assertEqual(s.num_samples, 100)
+        self.assertTrue(np.array_equal(s.data, orig_data[500:600]))
+
+    def test_save_memory_mapped_signal(self):
+        filename = os.path.join(tempfile.gettempdir(), "test_save_memory_mapped.complex")
+        np.arange(1000, dtype=np.complex64).tofile(filename)
+
+        s = Signal(filename, "test")
+        s.mute_range(10, 20)
+        FileOperator.save_signal(s)
+
+        saved = np.fromfile(filename, dtype=np.complex64)
+        self.assertEqual(len(saved), 1000)
+        self.assertTrue(np.all(saved[10:20] == 0))
+        self.assertEqual(saved[20], 20)
+        os.remove(filename)
+
+    def test_write_memory_mapped_signal_in_place(self):
+        # Used on Windows, where a mapped file can not be replaced
+        filename = os.path.join(tempfile.gettempdir(), "test_write_in_place.complex")
+        np.arange(3 * FileOperator.IN_PLACE_BLOCK_SIZE + 10, dtype=np.complex64).tofile(filename)
+
+        s = Signal(filename, "test")
+        s.mute_range(10, 20)
+        expected = np.array(s.data)
+        FileOperator.write_in_place(s.data, filename)
+
+        self.assertTrue(np.array_equal(s.data, expected))
+        self.assertTrue(np.array_equal(np.fromfile(filename, dtype=np.complex64), expected))
+        s.eliminate()
+        os.remove(filename)
+
+    def test_wav_round_trip(self):
+        filename = os.path.join(tempfile.gettempdir(), "test_wav_round_trip.wav")
+        data = np.empty(3 * Signal.WAV_BLOCK_SIZE + 17, dtype=np.complex64)
+        data.real = np.sin(np.arange(len(data)) / 10)
+        data.imag = np.cos(np.arange(len(data)) / 10)
+        FileOperator.save_data(data, filename, sample_rate=48000)
+
+        s = Signal(filename, "wav")
+        self.assertEqual(s.sample_rate, 48000)
+        self.assertEqual(s.num_samples, len(data))
+        expected = (data.view(np.float32) * 32767).astype(np.int16)
+        self.assertTrue(np.allclose(s.data.real, (expected[0::2] + 0.5) / 32767))
+        self.assertTrue(np.allclose(s.data.imag, (expected[1::2] + 0.5) / 32767))
+        os.remove(filename)
+
+    def test_mono_wav(self):
+        filename = os.path.join(tempfile.gettempdir(), "test_mono.wav")
+        samples = np.arange(0, 256, dtype=np.uint8)
+        with wave.open(filename, "w") as f:
+            f.setnchannels(1)
+            f.setsampwidth(1)
+            f.setframerate(1000)
+            f.writeframes(samples)
+
+        s = Signal(filename, "mono")
+        self.assertTrue(np.array_equal(s.data.real, ((samples - 127.5) / 255).astype(np.float32)))
+        self.assertTrue(np.all(s.data.imag == 0))
+        os.remove(filename)
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tests.utils_testing import get_path_for_data_file
+from urh.signalprocessing.Signal import Signal
+from urh.util.SignalCache import SignalCache
+
+
+class TestSignalCache(unittest.TestCase):
+    def setUp(self):
+        SignalCache.CACHE_DIR = tempfile.mkdtemp()
+        SignalCache.ENABLED = True
+
+    def tearDown(self):
+        shutil.rmtree(SignalCache.CACHE_DIR)
+        SignalCache.CACHE_DIR = None
+        SignalCache.ENABLED = False
+
+    def test_reuse_cached_data(self):
+        filename = get_path_for_data_file("esaver.complex")
+        signal = Signal(filename, "esaver")
+        signal.auto_detect()
+        qad = np.array(signal.qad)
+
+        cached_signal = Signal(filename, "esaver")
+        self.assertEqual(cached_signal.noise_threshold, signal.noise_threshold)
+        self.assertEqual(cached_signal.parameter_cache, signal.parameter_cache)
+        self.assertIsInstance(cached_signal.qad, np.memmap)
+        self.assertTrue(np.array_equal(cached_signal.qad, qad))
+
+        cached_signal.auto_detect()
+        self.assertEqual(cached_signal.bit_len, signal.bit_len)
+        self.assertEqual(cached_signal.qad_center, signal.qad_center)
+
+    def test_cache_key(self):
+        filename = get_path_for_data_file("esaver.complex")
+        signal = Signal(filename, "esaver")
+        _ = signal.qad
+        cache = SignalCache(filename)
+        self.assertIsNotNone(cache.load_qad(signal.modulation_type, signal.noise_threshold))
+        self.assertIsNone(cache.load_qad(signal.modulation_type, signal.noise_threshold + 0.1))
+        self.assertIsNone(cache.load_qad(0, signal.noise_threshold))
+
+        self.assertEqual(SignalCache(filename).content_hash, cache.content_hash)
+
+    def test_changed_file_invalidates_cache(self):
+        SignalCache.HASH_BLOCK_SIZE = 1024  # sample only parts of the file
+        self.addCleanup(setattr, SignalCache, "HASH_BLOCK_SIZE", 2 ** 16)
+
+        filename = os.path.join(SignalCache.CACHE_DIR, "test.complex")
+        data = np.fromfile(get_path_for_data_file("esaver.complex"), dtype=np.complex64)
+        data.tofile(filename)
+        content_hash = SignalCache(filename).content_hash
+        self.assertEqual(SignalCache(filename).content_hash, content_hash)
+
+        # A changed sampled block is detected even if the modification time is the same
+        stat = os.stat(filename)
+        data[:10] = 0
+        data.tofile(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(SignalCache(filename).content_hash, content_hash)
+
+    def test_edit_invalidates_cache(self):
+        filename = get_path_for_data_file("esaver.complex")
+        signal = Signal(filename, "esaver")
+        _ = signal.qad
+        signal.mute_range(0, 1000)
+        signal.noise_threshold = 0.5
+        self.assertNotIsInstance(signal.qad, np.memmap)
+        self.assertIsNone(SignalCache(filename).load_qad(signal.modulation_type, 0.5))
+
+    def test_disabled(self):
+        SignalCache.ENABLED = False
+        signal = Signal(get_path_for_data_file("esaver.complex"), "esaver")
+        _ = signal.qad
+        self.assertEqual(os.listdir(SignalCache.CACHE_DIR), [])
+
+    def test_clear(self):
+        signal = Signal(get_path_for_data_file("esaver.complex"), "esaver")
+        signal.auto_detect()
+        self.assertGreater(SignalCache.total_size(), 0)
+
+        del signal
+        SignalCache.clear()
+        self.assertEqual(SignalCache.total_size(), 0)
+        self.assertEqual(os.listdir(SignalCache.CACHE_DIR), [])
@@ -243,5 +243,6 @@ class TestSignalTabGUI(QtTestCase):
         frame.ui.cbSignalView.setCurrentIndex(1)
         QApplication.instance().processEvents()
         self.assertEqual(frame.ui.gvSignal.scene_type, 1)
+        self.assertEqual(frame.ui.gvSignal.scene_manager.scene_type, 1)
         if self.SHOW:
             self.assertTrue(frame.ui.gvLegend.isVisible())
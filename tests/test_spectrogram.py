@@ -1,7 +1,11 @@
+import unittest
+
+import numpy as np
 from PyQt5.QtCore import QTimer
 
 from tests.QtTestCase import QtTestCase
 from urh import colormaps
+from urh.cythonext import util
 from urh.signalprocessing.Signal import Signal
 from urh.signalprocessing.Spectrogram import Spectrogram
 
@@ -85,3 +89,68 @@ class TestSpectrogram(QtTestCase):
 
         self.assertEqual(len(filtered_frame.proto_analyzer.plain_bits_str), 1)
         self.assertEqual(filtered_frame.proto_analyzer.plain_bits_str[0], target_bits)
+
+
+class TestSpectrogramSegments(unittest.TestCase):
+    def setUp(self):
+        t = np.arange(100000)
+        self.spectrogram = Spectrogram(np.exp(2j * np.pi * 0.1 * t).astype(np.complex64), window_size=256)
+        self.spectrogram.MAX_LINES_PER_VIEW = 100
+
+    def test_segments_match_whole_spectrogram(self):
+        ranges = self.spectrogram.segment_ranges()
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(self.spectrogram.samples))
+
+        for start, end in ranges:
+            image = self.spectrogram.create_segment_image(start, end)
+            self.assertEqual(image.width(), self.spectrogram.segment_width(start, end))
+            self.assertEqual(image.height(), self.spectrogram.freq_bins)
+
+    def test_segment_cache(self):
+        start, end = self.spectrogram.segment_ranges()[1]
+        self.assertFalse(self.spectrogram.has_segment(start, end))
+        segment = self.spectrogram.get_segment(start, end)
+        self.assertTrue(self.spectrogram.has_segment(start, end))
+
+        # Color range does not invalidate the cached dB values
+        self.spectrogram.data_min = -50
+        self.spectrogram.create_segment_image(start, end)
+        self.assertIs(self.spectrogram.get_segment(start, end), segment)
+
+        self.spectrogram.window_size = 512
+        self.assertFalse(self.spectrogram.has_segment(start, end))
+        self.spectrogram.window_size = 256
+        self.assertTrue(self.spectrogram.has_segment(start, end))
+
+        self.spectrogram.samples = self.spectrogram.samples[::-1]
+        self.assertFalse(self.spectrogram.has_segment(start, end))
+
+    def test_segment_parameter_snapshot(self):
+        start, end = self.spectrogram.segment_ranges()[0]
+        parameters = self.spectrogram.parameters()
+
+        # Window size changes while the segment of the submitted job is calculated
+        self.spectrogram.window_size = 512
+        segment = self.spectrogram.get_segment(start, end, parameters)
+        self.assertEqual(segment.shape, (self.spectrogram.segment_width(start, end, parameters), 256))
+        self.assertFalse(self.spectrogram.has_segment(start, end))
+        self.assertTrue(self.spectrogram.has_segment(start, end, parameters))
+        self.assertEqual(self.spectrogram.get_segment(start, end).shape[1], 512)
+
+    def test_decibel_image_kernels(self):
+        samples = np.random.normal(size=(2, 5000)).astype(np.float32).view(np.complex64)[0]
+        samples[:1000] = 0  # -inf dB
+        self.spectrogram.samples = samples
+
+        stft = self.spectrogram.stft(samples)
+        expected = np.fliplr(util.arr2decibel(np.fft.fftshift(stft, axes=(1,)).astype(np.complex64)))
+        decibel = util.stft_to_decibel(stft)
+        np.testing.assert_array_equal(decibel, expected)
+
+        colormap = colormaps.chosen_colormap_numpy_bgra
+        for transpose in (False, True):
+            data = np.flipud(expected.T) if transpose else expected
+            np.testing.assert_array_equal(util.decibel_to_bgra(decibel, colormap, -100, -20, transpose=transpose),
+                                          Spectrogram.apply_bgra_lookup(data, colormap, -100, -20))
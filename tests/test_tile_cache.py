@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+from PyQt5.QtGui import QColor
+
+from urh.ui.painting.TileRenderer import TileRenderer
+from urh.util.MinMaxPyramid import MinMaxPyramid
+from urh.util.TileCache import TileCache
+
+
+class TestTileCache(unittest.TestCase):
+    def test_memory_budget(self):
+        cache = TileCache(max_bytes=100)
+        for i in range(5):
+            cache.put(i, "tile" + str(i), 30)
+
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.num_bytes, 90)
+        self.assertNotIn(0, cache)
+        self.assertNotIn(1, cache)
+
+        # Using a tile protects it from eviction
+        self.assertEqual(cache.get(2), "tile2")
+        cache.put(5, "tile5", 30)
+        self.assertIn(2, cache)
+        self.assertNotIn(3, cache)
+
+        cache.discard_where(lambda key: key % 2 == 0)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.num_bytes, 30)
+        self.assertIsNone(cache.get(2))
+
+    def test_render_tile(self):
+        samples = np.zeros(100000, dtype=np.float32)
+        samples[50000:50100] = 0.5  # single peak in the first tile
+
+        pyramid = MinMaxPyramid(samples)
+        tile_samples = TileRenderer.tile_samples(zoom=8)  # 256 samples per pixel
+        width, height = TileRenderer.TILE_WIDTH, 40
+
+        def render(index, ranges=None, colors=None):
+            return TileRenderer.render_tile(samples, pyramid, index * tile_samples, (index + 1) * tile_samples,
+                                            width, height, top=-1, scene_height=2,
+                                            subpath_ranges=ranges, colors=colors)
+
+        plain, second = render(0), render(1)
+        colored = render(0, ranges=[(0, 49999), (49999, 50100)], colors=[None, QColor(255, 0, 0)])
+        self.assertEqual(plain.width(), width)
+        self.assertEqual(plain.height(), height)
+
+        # Zero line is in the middle and the peak reaches up to a quarter of the height
+        peak_x, peak_y = int(50000 / tile_samples * width), height // 4 + 2
+        for tile in (plain, second):
+            self.assertNotEqual(tile.pixel(width // 4, height // 2), 0)
+            self.assertEqual(tile.pixel(width // 4, peak_y), 0)
+
+        peak_pixels = range(peak_x - 2, peak_x + 3)
+        self.assertTrue(any(plain.pixel(x, peak_y) != 0 for x in peak_pixels))
+        self.assertTrue(all(second.pixel(x, peak_y) == 0 for x in peak_pixels))
+        self.assertTrue(any(QColor(colored.pixel(x, peak_y)).red() > QColor(colored.pixel(x, peak_y)).green()
+                            for x in peak_pixels))
+
+
+if __name__ == '__main__':
+    unittest.main()